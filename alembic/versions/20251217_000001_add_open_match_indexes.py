@@ -0,0 +1,33 @@
+"""Add partial indexes for open matches
+
+Revision ID: 20251217_000001
+Revises: 20251216_000002
+Create Date: 2025-12-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20251217_000001"
+down_revision = "20251216_000002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_matches_listing_id_open",
+        "matches",
+        ["listing_id"],
+        postgresql_where=sa.text("status IN ('new', 'viewed')"),
+    )
+    op.create_index(
+        "idx_matches_requirement_id_open",
+        "matches",
+        ["requirement_id"],
+        postgresql_where=sa.text("status IN ('new', 'viewed')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_matches_requirement_id_open", table_name="matches")
+    op.drop_index("idx_matches_listing_id_open", table_name="matches")
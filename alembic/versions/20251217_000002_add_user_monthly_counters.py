@@ -0,0 +1,98 @@
+"""Add user monthly counters maintained by triggers
+
+Revision ID: 20251217_000002
+Revises: 20251217_000001
+Create Date: 2025-12-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "20251217_000002"
+down_revision = "20251217_000001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_monthly_counters",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("year_month", sa.String(7), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.UniqueConstraint("user_id", "kind", "year_month", name="uq_user_monthly_counter"),
+    )
+    op.create_index("idx_user_monthly_counters_user_id", "user_monthly_counters", ["user_id"])
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_user_monthly_counter() RETURNS trigger AS $$
+        DECLARE
+            delta integer := 0;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                -- Update only: when a user is deleted, the cascade may already
+                -- have removed their counter rows.
+                IF OLD.status::text <> 'deleted' THEN
+                    UPDATE user_monthly_counters
+                    SET count = count - 1, updated_at = now()
+                    WHERE user_id = OLD.user_id
+                      AND kind = TG_ARGV[0]
+                      AND year_month = to_char(OLD.created_at AT TIME ZONE 'UTC', 'YYYY-MM');
+                END IF;
+                RETURN OLD;
+            END IF;
+
+            IF TG_OP = 'INSERT' THEN
+                IF NEW.status::text <> 'deleted' THEN
+                    delta := 1;
+                END IF;
+            ELSIF NEW.status::text = 'deleted' AND OLD.status::text <> 'deleted' THEN
+                delta := -1;
+            ELSIF OLD.status::text = 'deleted' AND NEW.status::text <> 'deleted' THEN
+                delta := 1;
+            END IF;
+
+            IF delta <> 0 THEN
+                INSERT INTO user_monthly_counters (id, user_id, kind, year_month, count, created_at, updated_at)
+                VALUES (
+                    gen_random_uuid(),
+                    NEW.user_id,
+                    TG_ARGV[0],
+                    to_char(NEW.created_at AT TIME ZONE 'UTC', 'YYYY-MM'),
+                    delta,
+                    now(),
+                    now()
+                )
+                ON CONFLICT (user_id, kind, year_month)
+                DO UPDATE SET count = user_monthly_counters.count + EXCLUDED.count, updated_at = now();
+            END IF;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for table, kind in (("listings", "listing"), ("requirements", "requirement")):
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_monthly_counter
+            AFTER INSERT OR UPDATE OF status OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION bump_user_monthly_counter('{kind}');
+        """)
+        op.execute(f"""
+            INSERT INTO user_monthly_counters (user_id, kind, year_month, count)
+            SELECT user_id, '{kind}', to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM'), count(*)
+            FROM {table}
+            WHERE status::text <> 'deleted'
+            GROUP BY user_id, to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM');
+        """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_requirements_monthly_counter ON requirements;")
+    op.execute("DROP TRIGGER IF EXISTS trg_listings_monthly_counter ON listings;")
+    op.execute("DROP FUNCTION IF EXISTS bump_user_monthly_counter();")
+    op.drop_table("user_monthly_counters")
@@ -0,0 +1,30 @@
+"""Add category/status indexes for match candidate queries
+
+Revision ID: 20251217_000003
+Revises: 20251217_000002
+Create Date: 2025-12-17
+"""
+from alembic import op
+
+revision = "20251217_000003"
+down_revision = "20251217_000002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_listings_category_id_status",
+        "listings",
+        ["category_id", "status"],
+    )
+    op.create_index(
+        "idx_requirements_category_id_status",
+        "requirements",
+        ["category_id", "status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_requirements_category_id_status", table_name="requirements")
+    op.drop_index("idx_listings_category_id_status", table_name="listings")
@@ -1,10 +1,12 @@
+from collections.abc import AsyncIterator, Callable, Iterable
 from datetime import datetime, timedelta, timezone
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select, and_
+from sqlalchemy import Select, func, select, update, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.api.deps import DBSession, CurrentUser
 from app.api.responses import create_success_response, create_error_response
@@ -735,21 +737,8 @@ async def get_moderation_queue(
     
     listings = []
     for listing, user in rows:
-        listings.append(ModerationListingResponse(
-            id=listing.id,
-            user_id=listing.user_id,
-            category_id=listing.category_id,
-            location_id=listing.location_id,
-            price=listing.price,
-            payment_type=listing.payment_type,
-            rooms=listing.rooms,
-            area=listing.area,
-            floor=listing.floor,
-            building_floors=listing.building_floors,
-            renovation_status=listing.renovation_status,
-            description=listing.description,
-            status=listing.status,
-            created_at=listing.created_at,
+        listings.append(ModerationListingResponse.from_orm_trusted(
+            listing,
             seller_telegram_id=user.telegram_id,
             seller_telegram_username=user.telegram_username,
         ))
@@ -960,16 +949,8 @@ async def get_users(
         req_result = await db.execute(req_count_query)
         requirement_count = req_result.scalar() or 0
         
-        users.append(AdminUserResponse(
-            id=user.id,
-            telegram_id=user.telegram_id,
-            telegram_username=user.telegram_username,
-            language=user.language,
-            subscription_type=user.subscription_type,
-            subscription_expires_at=user.subscription_expires_at,
-            is_blocked=user.is_blocked,
-            blocked_reason=user.blocked_reason,
-            created_at=user.created_at,
+        users.append(AdminUserResponse.from_orm_trusted(
+            user,
             listing_count=listing_count,
             requirement_count=requirement_count,
         ))
@@ -1150,198 +1131,153 @@ async def get_stats(
     week_start = today_start - timedelta(days=today_start.weekday())
     month_start = today_start.replace(day=1)
     
-    total_users = (await db.execute(select(func.count(User.id)))).scalar() or 0
-    active_users = (await db.execute(
-        select(func.count(User.id)).where(User.is_blocked == False)
-    )).scalar() or 0
-    blocked_users = total_users - active_users
-    
-    new_users_today = (await db.execute(
-        select(func.count(User.id)).where(User.created_at >= today_start)
-    )).scalar() or 0
-    
-    new_users_this_week = (await db.execute(
-        select(func.count(User.id)).where(User.created_at >= week_start)
-    )).scalar() or 0
-    
-    new_users_this_month = (await db.execute(
-        select(func.count(User.id)).where(User.created_at >= month_start)
-    )).scalar() or 0
+    # One aggregate query per table; each metric is a FILTERed count.
+    users = (await db.execute(
+        select(
+            func.count(User.id).label("total"),
+            func.count(User.id).filter(User.is_blocked == False).label("active"),
+            func.count(User.id).filter(User.created_at >= today_start).label("today"),
+            func.count(User.id).filter(User.created_at >= week_start).label("week"),
+            func.count(User.id).filter(User.created_at >= month_start).label("month"),
+        )
+    )).one()
     
     user_metrics = UserMetrics(
-        total_users=total_users,
-        active_users=active_users,
-        new_users_today=new_users_today,
-        new_users_this_week=new_users_this_week,
-        new_users_this_month=new_users_this_month,
-        blocked_users=blocked_users,
-    )
-    
-    total_listings = (await db.execute(
-        select(func.count(Listing.id)).where(Listing.status != ListingStatusEnum.DELETED)
-    )).scalar() or 0
-    
-    active_listings = (await db.execute(
-        select(func.count(Listing.id)).where(Listing.status == ListingStatusEnum.ACTIVE)
-    )).scalar() or 0
-    
-    pending_moderation = (await db.execute(
-        select(func.count(Listing.id)).where(Listing.status == ListingStatusEnum.PENDING_MODERATION)
-    )).scalar() or 0
-    
-    rejected_listings = (await db.execute(
-        select(func.count(Listing.id)).where(Listing.status == ListingStatusEnum.REJECTED)
-    )).scalar() or 0
-    
-    expired_listings = (await db.execute(
-        select(func.count(Listing.id)).where(Listing.status == ListingStatusEnum.EXPIRED)
-    )).scalar() or 0
-    
-    vip_listings = (await db.execute(
-        select(func.count(Listing.id)).where(
-            and_(Listing.is_vip == True, Listing.status == ListingStatusEnum.ACTIVE)
-        )
-    )).scalar() or 0
+        total_users=users.total,
+        active_users=users.active,
+        new_users_today=users.today,
+        new_users_this_week=users.week,
+        new_users_this_month=users.month,
+        blocked_users=users.total - users.active,
+    )
+    
+    listings = (await db.execute(
+        select(
+            func.count(Listing.id).filter(Listing.status != ListingStatusEnum.DELETED).label("total"),
+            func.count(Listing.id).filter(Listing.status == ListingStatusEnum.ACTIVE).label("active"),
+            func.count(Listing.id).filter(Listing.status == ListingStatusEnum.PENDING_MODERATION).label("pending"),
+            func.count(Listing.id).filter(Listing.status == ListingStatusEnum.REJECTED).label("rejected"),
+            func.count(Listing.id).filter(Listing.status == ListingStatusEnum.EXPIRED).label("expired"),
+            func.count(Listing.id).filter(
+                and_(Listing.is_vip == True, Listing.status == ListingStatusEnum.ACTIVE)
+            ).label("vip"),
+        )
+    )).one()
     
     listing_metrics = ListingMetrics(
-        total_listings=total_listings,
-        active_listings=active_listings,
-        pending_moderation=pending_moderation,
-        rejected_listings=rejected_listings,
-        expired_listings=expired_listings,
-        vip_listings=vip_listings,
+        total_listings=listings.total,
+        active_listings=listings.active,
+        pending_moderation=listings.pending,
+        rejected_listings=listings.rejected,
+        expired_listings=listings.expired,
+        vip_listings=listings.vip,
     )
     
-    total_requirements = (await db.execute(
-        select(func.count(Requirement.id)).where(Requirement.status != RequirementStatusEnum.DELETED)
-    )).scalar() or 0
-    
-    active_requirements = (await db.execute(
-        select(func.count(Requirement.id)).where(Requirement.status == RequirementStatusEnum.ACTIVE)
-    )).scalar() or 0
-    
-    expired_requirements = (await db.execute(
-        select(func.count(Requirement.id)).where(Requirement.status == RequirementStatusEnum.EXPIRED)
-    )).scalar() or 0
+    requirements = (await db.execute(
+        select(
+            func.count(Requirement.id).filter(Requirement.status != RequirementStatusEnum.DELETED).label("total"),
+            func.count(Requirement.id).filter(Requirement.status == RequirementStatusEnum.ACTIVE).label("active"),
+            func.count(Requirement.id).filter(Requirement.status == RequirementStatusEnum.EXPIRED).label("expired"),
+        )
+    )).one()
     
     requirement_metrics = RequirementMetrics(
-        total_requirements=total_requirements,
-        active_requirements=active_requirements,
-        expired_requirements=expired_requirements,
+        total_requirements=requirements.total,
+        active_requirements=requirements.active,
+        expired_requirements=requirements.expired,
     )
     
-    total_matches = (await db.execute(select(func.count(Match.id)))).scalar() or 0
-    
-    matches_today = (await db.execute(
-        select(func.count(Match.id)).where(Match.created_at >= today_start)
-    )).scalar() or 0
-    
-    matches_this_week = (await db.execute(
-        select(func.count(Match.id)).where(Match.created_at >= week_start)
-    )).scalar() or 0
-    
-    avg_score_result = await db.execute(select(func.avg(Match.score)))
-    average_match_score = float(avg_score_result.scalar() or 0)
-    
-    contact_initiated_count = (await db.execute(
-        select(func.count(Match.id)).where(Match.status == MatchStatusEnum.CONTACTED)
-    )).scalar() or 0
+    matches = (await db.execute(
+        select(
+            func.count(Match.id).label("total"),
+            func.count(Match.id).filter(Match.created_at >= today_start).label("today"),
+            func.count(Match.id).filter(Match.created_at >= week_start).label("week"),
+            func.avg(Match.score).label("avg_score"),
+            func.count(Match.id).filter(Match.status == MatchStatusEnum.CONTACTED).label("contacted"),
+        )
+    )).one()
     
     match_metrics = MatchMetrics(
-        total_matches=total_matches,
-        matches_today=matches_today,
-        matches_this_week=matches_this_week,
-        average_match_score=round(average_match_score, 2),
-        contact_initiated_count=contact_initiated_count,
+        total_matches=matches.total,
+        matches_today=matches.today,
+        matches_this_week=matches.week,
+        average_match_score=round(float(matches.avg_score or 0), 2),
+        contact_initiated_count=matches.contacted,
     )
     
-    total_chats = (await db.execute(select(func.count(Chat.id)))).scalar() or 0
-    
-    active_chats = (await db.execute(
-        select(func.count(Chat.id)).where(Chat.status == ChatStatusEnum.ACTIVE)
-    )).scalar() or 0
-    
-    total_messages = (await db.execute(select(func.count(ChatMessage.id)))).scalar() or 0
-    
-    messages_today = (await db.execute(
-        select(func.count(ChatMessage.id)).where(ChatMessage.created_at >= today_start)
-    )).scalar() or 0
+    chats = (await db.execute(
+        select(
+            func.count(Chat.id).label("total"),
+            func.count(Chat.id).filter(Chat.status == ChatStatusEnum.ACTIVE).label("active"),
+            func.count(Chat.id).filter(
+                and_(Chat.buyer_revealed == True, Chat.seller_revealed == True)
+            ).label("reveals"),
+        )
+    )).one()
     
-    contact_reveals = (await db.execute(
-        select(func.count(Chat.id)).where(
-            and_(Chat.buyer_revealed == True, Chat.seller_revealed == True)
+    messages = (await db.execute(
+        select(
+            func.count(ChatMessage.id).label("total"),
+            func.count(ChatMessage.id).filter(ChatMessage.created_at >= today_start).label("today"),
         )
-    )).scalar() or 0
+    )).one()
     
     chat_metrics = ChatMetrics(
-        total_chats=total_chats,
-        active_chats=active_chats,
-        total_messages=total_messages,
-        messages_today=messages_today,
-        contact_reveals=contact_reveals,
+        total_chats=chats.total,
+        active_chats=chats.active,
+        total_messages=messages.total,
+        messages_today=messages.today,
+        contact_reveals=chats.reveals,
     )
     
     # Auto listings metrics
-    total_auto_listings = (await db.execute(
-        select(func.count(AutoListing.id)).where(AutoListing.status != AutoStatusEnum.DELETED)
-    )).scalar() or 0
-    
-    active_auto_listings = (await db.execute(
-        select(func.count(AutoListing.id)).where(AutoListing.status == AutoStatusEnum.ACTIVE)
-    )).scalar() or 0
-    
-    pending_auto_listings = (await db.execute(
-        select(func.count(AutoListing.id)).where(AutoListing.status == AutoStatusEnum.PENDING_MODERATION)
-    )).scalar() or 0
-    
-    sale_auto_listings = (await db.execute(
-        select(func.count(AutoListing.id)).where(
-            and_(AutoListing.deal_type == "sale", AutoListing.status != AutoStatusEnum.DELETED)
-        )
-    )).scalar() or 0
-    
-    rent_auto_listings = (await db.execute(
-        select(func.count(AutoListing.id)).where(
-            and_(AutoListing.deal_type == "rent", AutoListing.status != AutoStatusEnum.DELETED)
-        )
-    )).scalar() or 0
+    auto_listing_live = AutoListing.status != AutoStatusEnum.DELETED
+    auto_listings = (await db.execute(
+        select(
+            func.count(AutoListing.id).filter(auto_listing_live).label("total"),
+            func.count(AutoListing.id).filter(AutoListing.status == AutoStatusEnum.ACTIVE).label("active"),
+            func.count(AutoListing.id).filter(
+                AutoListing.status == AutoStatusEnum.PENDING_MODERATION
+            ).label("pending"),
+            func.count(AutoListing.id).filter(
+                and_(AutoListing.deal_type == "sale", auto_listing_live)
+            ).label("sale"),
+            func.count(AutoListing.id).filter(
+                and_(AutoListing.deal_type == "rent", auto_listing_live)
+            ).label("rent"),
+        )
+    )).one()
     
     from app.schemas.admin import AutoListingMetrics, AutoRequirementMetrics
     
     auto_listing_metrics = AutoListingMetrics(
-        total_listings=total_auto_listings,
-        active_listings=active_auto_listings,
-        pending_moderation=pending_auto_listings,
-        sale_listings=sale_auto_listings,
-        rent_listings=rent_auto_listings,
+        total_listings=auto_listings.total,
+        active_listings=auto_listings.active,
+        pending_moderation=auto_listings.pending,
+        sale_listings=auto_listings.sale,
+        rent_listings=auto_listings.rent,
     )
     
     # Auto requirements metrics (status is string, not enum)
-    total_auto_requirements = (await db.execute(
-        select(func.count(AutoRequirement.id)).where(AutoRequirement.status != "deleted")
-    )).scalar() or 0
-    
-    active_auto_requirements = (await db.execute(
-        select(func.count(AutoRequirement.id)).where(AutoRequirement.status == "active")
-    )).scalar() or 0
-    
-    sale_auto_requirements = (await db.execute(
-        select(func.count(AutoRequirement.id)).where(
-            and_(AutoRequirement.deal_type == "sale", AutoRequirement.status != "deleted")
-        )
-    )).scalar() or 0
-    
-    rent_auto_requirements = (await db.execute(
-        select(func.count(AutoRequirement.id)).where(
-            and_(AutoRequirement.deal_type == "rent", AutoRequirement.status != "deleted")
-        )
-    )).scalar() or 0
+    auto_requirement_live = AutoRequirement.status != "deleted"
+    auto_requirements = (await db.execute(
+        select(
+            func.count(AutoRequirement.id).filter(auto_requirement_live).label("total"),
+            func.count(AutoRequirement.id).filter(AutoRequirement.status == "active").label("active"),
+            func.count(AutoRequirement.id).filter(
+                and_(AutoRequirement.deal_type == "sale", auto_requirement_live)
+            ).label("sale"),
+            func.count(AutoRequirement.id).filter(
+                and_(AutoRequirement.deal_type == "rent", auto_requirement_live)
+            ).label("rent"),
+        )
+    )).one()
     
     auto_requirement_metrics = AutoRequirementMetrics(
-        total_requirements=total_auto_requirements,
-        active_requirements=active_auto_requirements,
-        sale_requirements=sale_auto_requirements,
-        rent_requirements=rent_auto_requirements,
+        total_requirements=auto_requirements.total,
+        active_requirements=auto_requirements.active,
+        sale_requirements=auto_requirements.sale,
+        rent_requirements=auto_requirements.rent,
     )
     
     return create_success_response(
@@ -1943,30 +1879,25 @@ async def bulk_update_listing_status(
             ),
         )
     
-    updated_count = 0
-    failed_count = 0
-    failed_ids: list[UUID] = []
-    
-    for listing_id in request.listing_ids:
-        listing_query = select(Listing).where(Listing.id == listing_id)
-        result = await db.execute(listing_query)
-        listing = result.scalar_one_or_none()
-        
-        if listing is None:
-            failed_count += 1
-            failed_ids.append(listing_id)
-            continue
-        
-        if listing.user_id != current_user.id:
-            failed_count += 1
-            failed_ids.append(listing_id)
-            continue
-        
-        listing.status = request.status
-        updated_count += 1
-    
+    result = await db.execute(
+        update(Listing)
+        .where(
+            and_(
+                Listing.id.in_(request.listing_ids),
+                Listing.user_id == current_user.id,
+            )
+        )
+        .values(status=request.status)
+        .returning(Listing.id)
+        .execution_options(synchronize_session=False)
+    )
+    updated_ids = set(result.scalars().all())
     await db.commit()
     
+    failed_ids = [listing_id for listing_id in request.listing_ids if listing_id not in updated_ids]
+    updated_count = len(request.listing_ids) - len(failed_ids)
+    failed_count = len(failed_ids)
+    
     return create_success_response(
         data=BulkStatusUpdateResponse(
             updated_count=updated_count,
@@ -2035,57 +1966,59 @@ async def bulk_vip_upgrade(
             ),
         )
     
-    upgraded_count = 0
-    failed_count = 0
-    failed_ids: list[UUID] = []
-    slots_used = 0
+    now = datetime.now(timezone.utc)
+    eligible_result = await db.execute(
+        select(Listing.id).where(
+            and_(
+                Listing.id.in_(request.listing_ids),
+                Listing.user_id == current_user.id,
+                Listing.status == ListingStatusEnum.ACTIVE,
+                or_(
+                    Listing.is_vip.is_(False),
+                    Listing.vip_expires_at.is_(None),
+                    Listing.vip_expires_at <= now,
+                ),
+            )
+        )
+    )
+    eligible_ids = set(eligible_result.scalars().all())
     
+    # Slots go to eligible listings in request order; the rest fail.
+    # A repeated ID fails like an already-VIP listing instead of using a second slot.
+    upgrade_ids: list[UUID] = []
+    failed_ids: list[UUID] = []
     for listing_id in request.listing_ids:
-        if slots_used >= available_slots:
-            failed_count += 1
-            failed_ids.append(listing_id)
-            continue
-        
-        listing_query = select(Listing).where(Listing.id == listing_id)
-        result = await db.execute(listing_query)
-        listing = result.scalar_one_or_none()
-        
-        if listing is None:
-            failed_count += 1
-            failed_ids.append(listing_id)
-            continue
-        
-        if listing.user_id != current_user.id:
-            failed_count += 1
-            failed_ids.append(listing_id)
-            continue
-        
-        if listing.status != ListingStatusEnum.ACTIVE:
-            failed_count += 1
-            failed_ids.append(listing_id)
-            continue
-        
-        if listing.is_vip and listing.vip_expires_at and listing.vip_expires_at > datetime.now(timezone.utc):
-            failed_count += 1
+        if len(upgrade_ids) < available_slots and listing_id in eligible_ids:
+            eligible_ids.discard(listing_id)
+            upgrade_ids.append(listing_id)
+        else:
             failed_ids.append(listing_id)
-            continue
-        
-        listing.is_vip = True
-        listing.vip_expires_at = datetime.now(timezone.utc) + timedelta(days=request.days)
-        listing.priority_score = 100
-        
-        upgraded_count += 1
-        slots_used += 1
     
-    if slots_used > 0:
-        user_query = select(User).where(User.id == current_user.id)
-        user_result = await db.execute(user_query)
-        user = user_result.scalar_one()
-        user.vip_slots_used += slots_used
+    slots_used = len(upgrade_ids)
+    
+    if upgrade_ids:
+        await db.execute(
+            update(Listing)
+            .where(Listing.id.in_(upgrade_ids))
+            .values(
+                is_vip=True,
+                vip_expires_at=now + timedelta(days=request.days),
+                priority_score=100,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(
+            update(User)
+            .where(User.id == current_user.id)
+            .values(vip_slots_used=User.vip_slots_used + slots_used)
+            .execution_options(synchronize_session=False)
+        )
     
     await db.commit()
     
-    vip_slots_remaining = current_user.vip_slots_total - current_user.vip_slots_used - slots_used
+    upgraded_count = slots_used
+    failed_count = len(failed_ids)
+    vip_slots_remaining = available_slots - slots_used
     
     return create_success_response(
         data=BulkVIPUpgradeResponse(
@@ -2922,6 +2855,41 @@ from fastapi.responses import StreamingResponse
 import csv
 import io
 
+CSV_EXPORT_BATCH_SIZE = 500
+
+async def _stream_csv(
+    db: AsyncSession,
+    query: Select,
+    header: list[str],
+    to_row: Callable[..., Iterable[Any]],
+) -> AsyncIterator[str]:
+    """
+    Yield CSV text one batch of rows at a time from a server-side cursor.
+    
+    Keeps at most CSV_EXPORT_BATCH_SIZE rows in memory, however large the
+    table; the request session stays open until the response is sent.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(header)
+    
+    result = await db.stream(query.execution_options(yield_per=CSV_EXPORT_BATCH_SIZE))
+    async for partition in result.partitions():
+        writer.writerows(to_row(*row) for row in partition)
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+    
+    if output.tell():
+        yield output.getvalue()
+
+def _csv_response(body: AsyncIterator[str], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
 @router.get("/export/users")
 async def export_users_csv(
     db: DBSession,
@@ -2933,23 +2901,16 @@ async def export_users_csv(
     Returns CSV file with user data including telegram_id, username,
     subscription status, listings count, requirements count.
     """
-    result = await db.execute(
-        select(User).order_by(User.created_at.desc())
-    )
-    users = result.scalars().all()
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
+    query = select(User).options(lazyload("*")).order_by(User.created_at.desc())
     
-    # Header
-    writer.writerow([
+    header = [
         "ID", "Telegram ID", "Username", "Language", 
         "Subscription", "Subscription Expires", "Is Blocked",
         "Created At"
-    ])
+    ]
     
-    for user in users:
-        writer.writerow([
+    def to_row(user: User) -> list[Any]:
+        return [
             str(user.id),
             user.telegram_id,
             user.telegram_username or "",
@@ -2958,15 +2919,9 @@ async def export_users_csv(
             user.subscription_expires_at.isoformat() if user.subscription_expires_at else "",
             "Yes" if user.is_blocked else "No",
             user.created_at.isoformat() if user.created_at else "",
-        ])
-    
-    output.seek(0)
+        ]
     
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=users.csv"}
-    )
+    return _csv_response(_stream_csv(db, query, header, to_row), "users.csv")
 
 
 @router.get("/export/listings")
@@ -2980,27 +2935,23 @@ async def export_listings_csv(
     Returns CSV file with listing data including price, rooms, area,
     location, seller info.
     """
-    result = await db.execute(
+    query = (
         select(Listing, User)
         .join(User, Listing.user_id == User.id)
+        .options(lazyload("*"))
         .where(Listing.status != ListingStatusEnum.DELETED)
         .order_by(Listing.created_at.desc())
     )
-    rows = result.all()
     
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
+    header = [
         "ID", "Seller Telegram ID", "Seller Username", "Price (AZN)",
         "Rooms", "Area (m²)", "Floor", "Building Floors",
         "Status", "Is VIP", "Deal Type", "Created At"
-    ])
+    ]
     
-    for listing, user in rows:
+    def to_row(listing: Listing, user: User) -> list[Any]:
         deal_type = listing.deal_type.value if listing.deal_type else "sale"
-        writer.writerow([
+        return [
             str(listing.id),
             user.telegram_id,
             user.telegram_username or "",
@@ -3013,15 +2964,9 @@ async def export_listings_csv(
             "Yes" if listing.is_vip else "No",
             deal_type,
             listing.created_at.isoformat() if listing.created_at else "",
-        ])
+        ]
     
-    output.seek(0)
-    
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=listings.csv"}
-    )
+    return _csv_response(_stream_csv(db, query, header, to_row), "listings.csv")
 
 
 @router.get("/export/requirements")
@@ -3035,29 +2980,25 @@ async def export_requirements_csv(
     Returns CSV file with requirement data including price range,
     rooms range, area range, buyer info.
     """
-    result = await db.execute(
+    query = (
         select(Requirement, User)
         .join(User, Requirement.user_id == User.id)
+        .options(lazyload("*"))
         .where(Requirement.status != RequirementStatusEnum.DELETED)
         .order_by(Requirement.created_at.desc())
     )
-    rows = result.all()
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
     
-    # Header
-    writer.writerow([
+    header = [
         "ID", "Buyer Telegram ID", "Buyer Username",
         "Price Min (AZN)", "Price Max (AZN)",
         "Rooms Min", "Rooms Max",
         "Area Min (m²)", "Area Max (m²)",
         "Status", "Deal Type", "Created At"
-    ])
+    ]
     
-    for req, user in rows:
+    def to_row(req: Requirement, user: User) -> list[Any]:
         deal_type = req.deal_type.value if req.deal_type else "sale"
-        writer.writerow([
+        return [
             str(req.id),
             user.telegram_id,
             user.telegram_username or "",
@@ -3070,15 +3011,9 @@ async def export_requirements_csv(
             req.status.value,
             deal_type,
             req.created_at.isoformat() if req.created_at else "",
-        ])
-    
-    output.seek(0)
+        ]
     
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=requirements.csv"}
-    )
+    return _csv_response(_stream_csv(db, query, header, to_row), "requirements.csv")
 
 
 @router.get("/export/matches")
@@ -3089,28 +3024,24 @@ async def export_matches_csv(
     """
     Export all matches to CSV.
     """
-    result = await db.execute(
+    query = (
         select(Match, Listing, Requirement)
         .join(Listing, Match.listing_id == Listing.id)
         .join(Requirement, Match.requirement_id == Requirement.id)
+        .options(lazyload("*"))
         .order_by(Match.created_at.desc())
     )
-    rows = result.all()
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
     
-    # Header
-    writer.writerow([
+    header = [
         "Match ID", "Score (%)", "Status",
         "Listing ID", "Listing Price",
         "Requirement ID", "Requirement Price Range",
         "Created At"
-    ])
+    ]
     
-    for match, listing, req in rows:
+    def to_row(match: Match, listing: Listing, req: Requirement) -> list[Any]:
         price_range = f"{float(req.price_min) if req.price_min else 0} - {float(req.price_max) if req.price_max else 0}"
-        writer.writerow([
+        return [
             str(match.id),
             match.score,
             match.status.value,
@@ -3119,15 +3050,9 @@ async def export_matches_csv(
             str(req.id),
             price_range,
             match.created_at.isoformat() if match.created_at else "",
-        ])
-    
-    output.seek(0)
+        ]
     
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=matches.csv"}
-    )
+    return _csv_response(_stream_csv(db, query, header, to_row), "matches.csv")
 
 
 # ============== Recommended Listings ==============
@@ -77,11 +77,10 @@ async def authenticate_telegram(
     )
     refresh_token = create_refresh_token(str(user.id))
     
-    token_response = TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer",
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+    token_response = TokenResponse.issue(
+        access_token,
+        refresh_token,
+        settings.jwt_access_token_expire_minutes * 60,
     )
     
     return create_success_response(data=token_response.model_dump())
@@ -153,11 +152,10 @@ async def refresh_token(
     )
     new_refresh_token = create_refresh_token(str(user.id))
     
-    token_response = TokenResponse(
-        access_token=access_token,
-        refresh_token=new_refresh_token,
-        token_type="bearer",
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+    token_response = TokenResponse.issue(
+        access_token,
+        new_refresh_token,
+        settings.jwt_access_token_expire_minutes * 60,
     )
     
     return create_success_response(data=token_response.model_dump())
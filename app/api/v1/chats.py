@@ -1,7 +1,9 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from app.api.deps import CurrentUser, DBSession
 from app.api.responses import create_error_response, create_success_response
@@ -17,7 +19,7 @@ from app.schemas.chat import (
     ChatRevealRequest,
     ChatRevealResponse,
 )
-from app.schemas.common import PaginationMeta, PaginationParams
+from app.schemas.common import PaginationMeta, PaginationParams, list_adapter
 from app.services.chat import ChatService
 
 router = APIRouter(prefix="/chats", tags=["Chats"])
@@ -29,6 +31,18 @@ def get_pagination_params(
     """Dependency for pagination parameters."""
     return PaginationParams(page=page, page_size=page_size)
 
+async def parse_message_body(request: Request) -> ChatMessageCreate:
+    """
+    Validate the message body straight from raw JSON bytes.
+    
+    Skips FastAPI's json.loads-then-validate round trip on the busiest
+    inbound endpoint; errors surface through the usual 400 handler.
+    """
+    try:
+        return ChatMessageCreate.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
 async def get_user_role_in_chat(
     chat_id: UUID,
     user_id: UUID,
@@ -105,17 +119,13 @@ async def list_chats(
                 last_message_preview = last_msg.content[:50] + "..." if len(last_msg.content) > 50 else last_msg.content
         
         chat_responses.append(
-            ChatListResponse(
-                id=c.id,
-                match_id=c.match_id,
-                status=c.status,
-                last_message_at=c.last_message_at,
-                created_at=c.created_at,
+            ChatListResponse.from_orm_trusted(
+                c,
                 user_alias=user_alias or "",
                 other_alias=other_alias or "",
                 unread_count=0,
                 last_message_preview=last_message_preview,
-            ).model_dump()
+            )
         )
     
     pagination_meta = PaginationMeta(
@@ -128,7 +138,7 @@ async def list_chats(
     )
     
     return create_success_response(
-        data=chat_responses,
+        data=list_adapter(ChatListResponse).dump_python(chat_responses),
         pagination=pagination_meta.model_dump(),
     )
 
@@ -200,17 +210,12 @@ async def get_chat_messages(
             sender_alias = "System"
         
         message_responses.append(
-            ChatMessageResponse(
-                id=m.id,
-                chat_id=m.chat_id,
+            ChatMessageResponse.from_orm_trusted(
+                m,
                 sender_alias=sender_alias,
-                message_type=m.message_type,
-                content=m.content,
-                media_url=m.media_url,
-                created_at=m.created_at,
                 updated_at=m.created_at,
                 is_own_message=m.sender_id == current_user.id,
-            ).model_dump()
+            )
         )
     
     pagination_meta = PaginationMeta(
@@ -223,14 +228,22 @@ async def get_chat_messages(
     )
     
     return create_success_response(
-        data=message_responses,
+        data=list_adapter(ChatMessageResponse).dump_python(message_responses),
         pagination=pagination_meta.model_dump(),
     )
 
-@router.post("/{chat_id}/messages")
+@router.post(
+    "/{chat_id}/messages",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ChatMessageCreate.model_json_schema()}},
+        },
+    },
+)
 async def send_message(
     chat_id: UUID,
-    message_data: ChatMessageCreate,
+    message_data: Annotated[ChatMessageCreate, Depends(parse_message_body)],
     current_user: CurrentUser,
     db: DBSession,
 ) -> dict:
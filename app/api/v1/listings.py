@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.api.deps import CurrentUser, DBSession
 from app.api.responses import create_error_response, create_success_response
-from app.schemas.common import PaginationMeta, PaginationParams
+from app.schemas.common import PaginationMeta, PaginationParams, list_adapter
 from app.schemas.listing import (
     ListingCreate,
     ListingListResponse,
@@ -71,7 +71,7 @@ async def create_listing(
             **coords,
         )
         
-        response = ListingResponse.model_validate(listing)
+        response = ListingResponse.from_orm_trusted(listing)
         return create_success_response(data=response.model_dump())
         
     except ListingValidationError as e:
@@ -97,40 +97,22 @@ async def list_listings(
     """
     listing_service = ListingService(db)
     
-    listings = await listing_service.get_user_listings(
+    listings = await listing_service.get_user_listing_cards(
         user_id=current_user.id,
         skip=pagination.offset,
         limit=pagination.page_size,
     )
     
-    all_listings = await listing_service.get_user_listings(
+    all_listings = await listing_service.get_user_listing_cards(
         user_id=current_user.id,
         limit=10000,
     )
     total_items = len(all_listings)
     total_pages = (total_items + pagination.page_size - 1) // pagination.page_size
     
-    listing_responses = [
-        ListingListResponse(
-            id=l.id,
-            user_id=l.user_id,
-            category_id=l.category_id,
-            location_id=l.location_id,
-            price=l.price,
-            payment_type=l.payment_type,
-            rooms=l.rooms,
-            area=l.area,
-            floor=l.floor,
-            building_floors=l.building_floors,
-            renovation_status=l.renovation_status,
-            status=l.status,
-            is_vip=l.is_vip,
-            expires_at=l.expires_at,
-            created_at=l.created_at,
-            thumbnail_url=None,
-        ).model_dump()
-        for l in listings
-    ]
+    listing_responses = list_adapter(ListingListResponse).dump_python(
+        [ListingListResponse.from_orm_trusted(l) for l in listings]
+    )
     
     pagination_meta = PaginationMeta(
         page=pagination.page,
@@ -179,7 +161,7 @@ async def get_listing(
             ),
         )
     
-    response = ListingResponse.model_validate(listing)
+    response = ListingResponse.from_orm_trusted(listing)
     return create_success_response(data=response.model_dump())
 
 @router.put("/{listing_id}")
@@ -239,6 +221,7 @@ async def update_listing(
         
         updated_listing, requires_remoderation = await listing_service.update_listing(
             listing_id,
+            current=listing,
             **update_dict,
         )
         
@@ -251,7 +234,7 @@ async def update_listing(
                 ),
             )
         
-        response = ListingResponse.model_validate(updated_listing)
+        response = ListingResponse.from_orm_trusted(updated_listing)
         response_data = response.model_dump()
         response_data["requires_remoderation"] = requires_remoderation
         
@@ -347,7 +330,7 @@ async def renew_listing(
             ),
         )
     
-    response = ListingResponse.model_validate(renewed_listing)
+    response = ListingResponse.from_orm_trusted(renewed_listing)
     return create_success_response(data=response.model_dump())
 
 @router.post("/{listing_id}/vip")
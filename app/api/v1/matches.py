@@ -5,10 +5,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.api.deps import CurrentUser, DBSession
 from app.api.responses import create_error_response, create_success_response
+from app.core.database import async_session_factory
 from app.repositories.chat import ChatRepository
 from app.repositories.listing import ListingRepository
 from app.repositories.requirement import RequirementRepository
-from app.schemas.common import PaginationMeta, PaginationParams
+from app.schemas.common import PaginationMeta, PaginationParams, list_adapter
 from app.schemas.listing import ListingListResponse
 from app.schemas.match import (
     MatchContactRequest,
@@ -41,7 +42,7 @@ async def list_matches(
     
     Requirements: 13.6
     """
-    match_service = MatchService(db)
+    match_service = MatchService(db, session_factory=async_session_factory)
     listing_repo = ListingRepository(db)
     chat_repo = ChatRepository(db)
     
@@ -51,11 +52,7 @@ async def list_matches(
         limit=pagination.page_size,
     )
     
-    all_matches = await match_service.get_matches_for_user(
-        user_id=current_user.id,
-        limit=10000,
-    )
-    total_items = len(all_matches)
+    total_items = await match_service.count_matches_for_user(current_user.id)
     total_pages = (total_items + pagination.page_size - 1) // pagination.page_size
     
     match_responses = []
@@ -65,18 +62,13 @@ async def list_matches(
         chat = await chat_repo.get_by_match(m.id)
         
         match_responses.append(
-            MatchListResponse(
-                id=m.id,
-                listing_id=m.listing_id,
-                requirement_id=m.requirement_id,
-                score=m.score,
-                status=m.status,
-                created_at=m.created_at,
+            MatchListResponse.from_orm_trusted(
+                m,
                 listing_price=float(listing.price) if listing else None,
                 listing_area=float(listing.area) if listing else None,
                 listing_rooms=listing.rooms if listing else None,
                 has_chat=chat is not None,
-            ).model_dump()
+            )
         )
     
     pagination_meta = PaginationMeta(
@@ -89,7 +81,7 @@ async def list_matches(
     )
     
     return create_success_response(
-        data=match_responses,
+        data=list_adapter(MatchListResponse).dump_python(match_responses),
         pagination=pagination_meta.model_dump(),
     )
 
@@ -145,49 +137,11 @@ async def get_match(
     
     chat = await chat_repo.get_by_match(match_id)
     
-    listing_response = ListingListResponse(
-        id=listing.id,
-        user_id=listing.user_id,
-        category_id=listing.category_id,
-        location_id=listing.location_id,
-        price=listing.price,
-        payment_type=listing.payment_type,
-        rooms=listing.rooms,
-        area=listing.area,
-        floor=listing.floor,
-        building_floors=listing.building_floors,
-        renovation_status=listing.renovation_status,
-        status=listing.status,
-        is_vip=listing.is_vip,
-        expires_at=listing.expires_at,
-        created_at=listing.created_at,
-        thumbnail_url=None,
-    )
-    
-    requirement_response = RequirementListResponse(
-        id=requirement.id,
-        user_id=requirement.user_id,
-        category_id=requirement.category_id,
-        price_min=requirement.price_min,
-        price_max=requirement.price_max,
-        rooms_min=requirement.rooms_min,
-        rooms_max=requirement.rooms_max,
-        area_min=requirement.area_min,
-        area_max=requirement.area_max,
-        status=requirement.status,
-        expires_at=requirement.expires_at,
-        created_at=requirement.created_at,
-        match_count=0,
-    )
+    listing_response = ListingListResponse.from_orm_trusted(listing)
+    requirement_response = RequirementListResponse.from_orm_trusted(requirement, match_count=0)
     
-    response = MatchDetailResponse(
-        id=match.id,
-        listing_id=match.listing_id,
-        requirement_id=match.requirement_id,
-        score=match.score,
-        status=match.status,
-        created_at=match.created_at,
-        updated_at=match.updated_at,
+    response = MatchDetailResponse.from_orm_trusted(
+        match,
         listing=listing_response,
         requirement=requirement_response,
         has_chat=chat is not None,
@@ -319,5 +273,5 @@ async def reject_match(
             ),
         )
     
-    response = MatchResponse.model_validate(rejected_match)
+    response = MatchResponse.from_orm_trusted(rejected_match)
     return create_success_response(data=response.model_dump())
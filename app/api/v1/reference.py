@@ -1,7 +1,9 @@
+import hashlib
 from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,52 +24,33 @@ router = APIRouter(prefix="/reference", tags=["Reference Data"])
 
 CACHE_TTL = 3600
 
-def build_category_tree(
-    categories: list[Category],
-    parent_id: Any = None,
-) -> list[dict]:
-    """Build hierarchical category tree."""
+_CATEGORY_TREE_FIELDS = tuple(f for f in CategoryTreeResponse.model_fields if f != "children")
+_LOCATION_TREE_FIELDS = tuple(f for f in LocationTreeResponse.model_fields if f != "children")
+
+def _build_tree(rows: list[Any], fields: tuple[str, ...]) -> list[dict]:
+    """
+    Assemble a parent/child tree of plain dicts in one pass over ``rows``.
+    
+    Rows come straight from the reference tables, so the nodes skip
+    schema validation; sibling order follows ``rows``.
+    """
+    nodes = {row.id: {**{f: getattr(row, f) for f in fields}, "children": []} for row in rows}
     tree = []
-    for cat in categories:
-        if cat.parent_id == parent_id:
-            children = build_category_tree(categories, cat.id)
-            cat_dict = CategoryTreeResponse(
-                id=cat.id,
-                name_az=cat.name_az,
-                name_ru=cat.name_ru,
-                name_en=cat.name_en,
-                icon=cat.icon,
-                parent_id=cat.parent_id,
-                form_config=cat.form_config,
-                created_at=cat.created_at,
-                updated_at=cat.updated_at,
-                children=[CategoryTreeResponse(**c) for c in children],
-            ).model_dump()
-            tree.append(cat_dict)
+    for row in rows:
+        node = nodes[row.id]
+        if row.parent_id is None:
+            tree.append(node)
+        elif row.parent_id in nodes:
+            nodes[row.parent_id]["children"].append(node)
     return tree
 
-def build_location_tree(
-    locations: list[Location],
-    parent_id: Any = None,
-) -> list[dict]:
+def build_category_tree(categories: list[Category]) -> list[dict]:
+    """Build hierarchical category tree."""
+    return _build_tree(categories, _CATEGORY_TREE_FIELDS)
+
+def build_location_tree(locations: list[Location]) -> list[dict]:
     """Build hierarchical location tree."""
-    tree = []
-    for loc in locations:
-        if loc.parent_id == parent_id:
-            children = build_location_tree(locations, loc.id)
-            loc_dict = LocationTreeResponse(
-                id=loc.id,
-                name_az=loc.name_az,
-                name_ru=loc.name_ru,
-                name_en=loc.name_en,
-                type=loc.type,
-                parent_id=loc.parent_id,
-                created_at=loc.created_at,
-                updated_at=loc.updated_at,
-                children=[LocationTreeResponse(**c) for c in children],
-            ).model_dump()
-            tree.append(loc_dict)
-    return tree
+    return _build_tree(locations, _LOCATION_TREE_FIELDS)
 
 @router.get("/categories")
 async def get_categories(
@@ -157,44 +140,56 @@ async def get_metro_stations(
     
     return create_success_response(data=metro_lines)
 
-@router.get("/options")
+_REFERENCE_OPTIONS = ReferenceOptionsResponse(
+    renovation_status=[
+        {"value": "renovated", "label_az": "Təmirli", "label_ru": "С ремонтом", "label_en": "Renovated"},
+        {"value": "not_renovated", "label_az": "Təmirsiz", "label_ru": "Без ремонта", "label_en": "Not Renovated"},
+        {"value": "partial", "label_az": "Orta təmir", "label_ru": "Частичный ремонт", "label_en": "Partially Renovated"},
+    ],
+    document_types=[
+        {"value": "extract", "label_az": "Çıxarış", "label_ru": "Выписка", "label_en": "Extract"},
+        {"value": "title_deed", "label_az": "Kupça", "label_ru": "Купчая", "label_en": "Title Deed"},
+        {"value": "technical_passport", "label_az": "Texniki pasport", "label_ru": "Технический паспорт", "label_en": "Technical Passport"},
+    ],
+    heating_types=[
+        {"value": "central", "label_az": "Mərkəzi", "label_ru": "Центральное", "label_en": "Central"},
+        {"value": "individual", "label_az": "Fərdi", "label_ru": "Индивидуальное", "label_en": "Individual"},
+        {"value": "combi", "label_az": "Kombi", "label_ru": "Комби", "label_en": "Combi"},
+        {"value": "none", "label_az": "Yoxdur", "label_ru": "Нет", "label_en": "None"},
+    ],
+    property_age=[
+        {"value": "new", "label_az": "Yeni (<5 il)", "label_ru": "Новый (<5 лет)", "label_en": "New (<5 years)"},
+        {"value": "medium", "label_az": "Orta (5-20 il)", "label_ru": "Средний (5-20 лет)", "label_en": "Medium (5-20 years)"},
+        {"value": "old", "label_az": "Köhnə (>20 il)", "label_ru": "Старый (>20 лет)", "label_en": "Old (>20 years)"},
+    ],
+    payment_types=[
+        {"value": "cash", "label_az": "Nağd", "label_ru": "Наличные", "label_en": "Cash"},
+        {"value": "credit", "label_az": "Kredit", "label_ru": "Кредит", "label_en": "Credit/Mortgage"},
+        {"value": "both", "label_az": "Hər ikisi", "label_ru": "Оба варианта", "label_en": "Both"},
+    ],
+)
+
+_REFERENCE_OPTIONS_BODY = orjson.dumps(create_success_response(data=_REFERENCE_OPTIONS.model_dump()))
+_REFERENCE_OPTIONS_ETAG = f'"{hashlib.sha1(_REFERENCE_OPTIONS_BODY).hexdigest()}"'
+
+@router.get(
+    "/options",
+    response_class=Response,
+    responses={200: {"content": {"application/json": {}}}},
+)
 async def get_options(
+    request: Request,
     user: OptionalUser = None,
-) -> dict:
+) -> Response:
     """
     Get reference options for forms (renovation, documents, heating, etc.).
     
-    Cached for 1 hour.
+    The payload is static per deploy, so it is serialized once at import and
+    served with an ETag; clients may cache it for 1 hour.
     
     Requirements: 26.8
     """
-    options = ReferenceOptionsResponse(
-        renovation_status=[
-            {"value": "renovated", "label_az": "Təmirli", "label_ru": "С ремонтом", "label_en": "Renovated"},
-            {"value": "not_renovated", "label_az": "Təmirsiz", "label_ru": "Без ремонта", "label_en": "Not Renovated"},
-            {"value": "partial", "label_az": "Orta təmir", "label_ru": "Частичный ремонт", "label_en": "Partially Renovated"},
-        ],
-        document_types=[
-            {"value": "extract", "label_az": "Çıxarış", "label_ru": "Выписка", "label_en": "Extract"},
-            {"value": "title_deed", "label_az": "Kupça", "label_ru": "Купчая", "label_en": "Title Deed"},
-            {"value": "technical_passport", "label_az": "Texniki pasport", "label_ru": "Технический паспорт", "label_en": "Technical Passport"},
-        ],
-        heating_types=[
-            {"value": "central", "label_az": "Mərkəzi", "label_ru": "Центральное", "label_en": "Central"},
-            {"value": "individual", "label_az": "Fərdi", "label_ru": "Индивидуальное", "label_en": "Individual"},
-            {"value": "combi", "label_az": "Kombi", "label_ru": "Комби", "label_en": "Combi"},
-            {"value": "none", "label_az": "Yoxdur", "label_ru": "Нет", "label_en": "None"},
-        ],
-        property_age=[
-            {"value": "new", "label_az": "Yeni (<5 il)", "label_ru": "Новый (<5 лет)", "label_en": "New (<5 years)"},
-            {"value": "medium", "label_az": "Orta (5-20 il)", "label_ru": "Средний (5-20 лет)", "label_en": "Medium (5-20 years)"},
-            {"value": "old", "label_az": "Köhnə (>20 il)", "label_ru": "Старый (>20 лет)", "label_en": "Old (>20 years)"},
-        ],
-        payment_types=[
-            {"value": "cash", "label_az": "Nağd", "label_ru": "Наличные", "label_en": "Cash"},
-            {"value": "credit", "label_az": "Kredit", "label_ru": "Кредит", "label_en": "Credit/Mortgage"},
-            {"value": "both", "label_az": "Hər ikisi", "label_ru": "Оба варианта", "label_en": "Both"},
-        ],
-    )
-    
-    return create_success_response(data=options.model_dump())
+    headers = {"ETag": _REFERENCE_OPTIONS_ETAG, "Cache-Control": f"public, max-age={CACHE_TTL}"}
+    if request.headers.get("if-none-match") == _REFERENCE_OPTIONS_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=_REFERENCE_OPTIONS_BODY, media_type="application/json", headers=headers)
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from app.api.deps import CurrentUser, DBSession
 from app.api.responses import create_error_response, create_success_response
 from app.repositories.match import MatchRepository
-from app.schemas.common import PaginationMeta, PaginationParams
+from app.schemas.common import PaginationMeta, PaginationParams, list_adapter
 from app.schemas.requirement import (
     RequirementCreate,
     RequirementListResponse,
@@ -71,19 +71,17 @@ async def create_requirement(
             comments=requirement_data.comments,
         )
         
-        for loc in requirement_data.locations:
-            await requirement_service.add_location(
-                requirement_id=requirement.id,
-                location_id=loc.location_id,
-                search_radius_km=float(loc.search_radius_km),
-            )
+        await requirement_service.add_locations(
+            requirement.id,
+            [(loc.location_id, float(loc.search_radius_km)) for loc in requirement_data.locations],
+        )
         
         requirement = await requirement_service.get_requirement_with_locations(requirement.id)
         
         match_repo = MatchRepository(db)
         matches = await match_repo.get_matches_for_requirement(requirement.id)
         
-        response = RequirementResponse.model_validate(requirement)
+        response = RequirementResponse.from_orm_trusted(requirement)
         response_data = response.model_dump()
         response_data["match_count"] = len(matches)
         
@@ -131,21 +129,7 @@ async def list_requirements(
         matches = await match_repo.get_matches_for_requirement(r.id)
         
         requirement_responses.append(
-            RequirementListResponse(
-                id=r.id,
-                user_id=r.user_id,
-                category_id=r.category_id,
-                price_min=r.price_min,
-                price_max=r.price_max,
-                rooms_min=r.rooms_min,
-                rooms_max=r.rooms_max,
-                area_min=r.area_min,
-                area_max=r.area_max,
-                status=r.status,
-                expires_at=r.expires_at,
-                created_at=r.created_at,
-                match_count=len(matches),
-            ).model_dump()
+            RequirementListResponse.from_orm_trusted(r, match_count=len(matches))
         )
     
     pagination_meta = PaginationMeta(
@@ -158,7 +142,7 @@ async def list_requirements(
     )
     
     return create_success_response(
-        data=requirement_responses,
+        data=list_adapter(RequirementListResponse).dump_python(requirement_responses),
         pagination=pagination_meta.model_dump(),
     )
 
@@ -198,7 +182,7 @@ async def get_requirement(
     
     matches = await match_repo.get_matches_for_requirement(requirement.id)
     
-    response = RequirementResponse.model_validate(requirement)
+    response = RequirementResponse.from_orm_trusted(requirement)
     response_data = response.model_dump()
     response_data["match_count"] = len(matches)
     
@@ -271,18 +255,16 @@ async def update_requirement(
                 for loc in existing_req.locations:
                     await requirement_service.remove_location(requirement_id, loc.location_id)
             
-            for loc in locations:
-                await requirement_service.add_location(
-                    requirement_id=requirement_id,
-                    location_id=loc.location_id,
-                    search_radius_km=float(loc.search_radius_km),
-                )
+            await requirement_service.add_locations(
+                requirement_id,
+                [(loc.location_id, float(loc.search_radius_km)) for loc in locations],
+            )
         
         updated_requirement = await requirement_service.get_requirement_with_locations(requirement_id)
         
         matches = await match_repo.get_matches_for_requirement(requirement_id)
         
-        response = RequirementResponse.model_validate(updated_requirement)
+        response = RequirementResponse.from_orm_trusted(updated_requirement)
         response_data = response.model_dump()
         response_data["match_count"] = len(matches)
         response_data["triggers_rematch"] = triggers_rematch
@@ -384,7 +366,7 @@ async def renew_requirement(
     
     matches = await match_repo.get_matches_for_requirement(requirement_id)
     
-    response = RequirementResponse.model_validate(renewed_requirement)
+    response = RequirementResponse.from_orm_trusted(renewed_requirement)
     response_data = response.model_dump()
     response_data["match_count"] = len(matches)
     
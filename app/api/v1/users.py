@@ -1,7 +1,10 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter
 
 from app.api.deps import CurrentUser, DBSession
 from app.api.responses import create_success_response
+from app.core.database import async_session_factory
 from app.repositories.listing import ListingRepository
 from app.repositories.requirement import RequirementRepository
 from app.repositories.match import MatchRepository
@@ -23,7 +26,7 @@ async def get_current_user_profile(
     """
     listing_repo = ListingRepository(db)
     requirement_repo = RequirementRepository(db)
-    match_repo = MatchRepository(db)
+    match_repo = MatchRepository(db, session_factory=async_session_factory)
     chat_repo = ChatRepository(db)
     
     all_listings = await listing_repo.get_by_user(current_user.id, include_deleted=False)
@@ -47,10 +50,10 @@ async def get_current_user_profile(
         total_chats=len(all_chats),
     )
     
-    user_response = UserResponse.model_validate(current_user)
+    user_response = UserResponse.from_orm_trusted(current_user)
     profile_response = UserProfileResponse(user=user_response, stats=stats)
     
-    return create_success_response(data=profile_response.model_dump())
+    return create_success_response(data=profile_response.to_dict())
 
 @router.put("/me")
 async def update_current_user_profile(
@@ -75,7 +78,7 @@ async def update_current_user_profile(
     else:
         user = current_user
     
-    user_response = UserResponse.model_validate(user)
+    user_response = UserResponse.from_orm_trusted(user)
     return create_success_response(data=user_response.model_dump())
 
 @router.get("/me/stats")
@@ -90,7 +93,7 @@ async def get_current_user_stats(
     """
     listing_repo = ListingRepository(db)
     requirement_repo = RequirementRepository(db)
-    match_repo = MatchRepository(db)
+    match_repo = MatchRepository(db, session_factory=async_session_factory)
     chat_repo = ChatRepository(db)
     
     all_listings = await listing_repo.get_by_user(current_user.id, include_deleted=False)
@@ -114,4 +117,4 @@ async def get_current_user_stats(
         total_chats=len(all_chats),
     )
     
-    return create_success_response(data=stats.model_dump())
+    return create_success_response(data=asdict(stats))
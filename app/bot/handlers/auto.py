@@ -969,12 +969,10 @@ async def confirm_auto_listing(
     # Save photos
     photos = data.get("photos", [])
     if photos:
-        for i, photo_file_id in enumerate(photos):
-            await service.add_media(
-                listing_id=listing.id,
-                url=photo_file_id,
-                order=i,
-            )
+        await service.bulk_add_media(
+            listing.id,
+            [(photo_file_id, None, i) for i, photo_file_id in enumerate(photos)],
+        )
         logger.info(f"Saved {len(photos)} photos for auto listing {listing.id}")
     
     await db_session.commit()
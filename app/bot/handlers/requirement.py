@@ -1,5 +1,6 @@
 import logging
 from decimal import Decimal
+from operator import itemgetter
 from typing import Any, Optional
 
 from aiogram import F, Router
@@ -905,7 +906,7 @@ async def _search_and_show_matches(
         return False
     
     # Sort by score descending
-    matches_data.sort(key=lambda x: x["score"], reverse=True)
+    matches_data.sort(key=itemgetter("score"), reverse=True)
     
     # Store matches in state for pagination
     await state.update_data(
@@ -87,7 +87,10 @@ class AuthMiddleware(BaseMiddleware):
             data["user_created"] = created
             data["db_session"] = session
             
-            return await handler(event, data)
+            # One unit of work per update: services flush, the commit is here
+            result = await handler(event, data)
+            await session.commit()
+            return result
     
     def _extract_user_info(
         self, event: TelegramObject
@@ -22,6 +22,13 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    connect_args={
+        # Per-connection caches of prepared statements: SQLAlchemy's (used by
+        # every ORM/Core query) and asyncpg's own. Both default to 100, which
+        # the app's distinct statements overflow, causing re-prepares.
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -55,6 +62,9 @@ class TimestampMixin:
 class BaseModel(Base, TimestampMixin):
 
     __abstract__ = True
+    # Fetch server-generated columns (created_at, updated_at) with RETURNING on
+    # INSERT and UPDATE, so they are never left expired after a flush.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -125,13 +125,13 @@ def validate_coordinates(latitude: float, longitude: float) -> ValidationResult:
             error_message="Coordinates must be valid numbers"
         )
     
-    if lat < AZERBAIJAN_LAT_MIN or lat > AZERBAIJAN_LAT_MAX:
+    if not AZERBAIJAN_LAT_MIN <= lat <= AZERBAIJAN_LAT_MAX:
         return ValidationResult(
             is_valid=False,
             error_message=f"Latitude must be between {AZERBAIJAN_LAT_MIN}°N and {AZERBAIJAN_LAT_MAX}°N"
         )
     
-    if lon < AZERBAIJAN_LON_MIN or lon > AZERBAIJAN_LON_MAX:
+    if not AZERBAIJAN_LON_MIN <= lon <= AZERBAIJAN_LON_MAX:
         return ValidationResult(
             is_valid=False,
             error_message=f"Longitude must be between {AZERBAIJAN_LON_MIN}°E and {AZERBAIJAN_LON_MAX}°E"
@@ -154,6 +154,7 @@ SCRIPT_PATTERN = re.compile(
     r'<style[^>]*>.*?</style>',
     re.IGNORECASE | re.DOTALL
 )
+_MARKUP_CHARS = frozenset("<:=")
 
 def sanitize_text(text: str) -> ValidationResult:
 
@@ -163,14 +164,29 @@ def sanitize_text(text: str) -> ValidationResult:
             error_message="Text must be a string"
         )
     
-    sanitized = SCRIPT_PATTERN.sub('', text)
-    
-    sanitized = HTML_TAG_PATTERN.sub('', sanitized)
+    # Both patterns need one of these characters to match; most user text has none.
+    if _MARKUP_CHARS.isdisjoint(text):
+        sanitized = text
+    else:
+        sanitized = SCRIPT_PATTERN.sub('', text)
+        
+        # Tags need a '<'; text that only had e.g. "javascript:" is done.
+        # The two passes stay separate: removing a script block can join
+        # the pieces around it into a new tag, which the second pass strips.
+        if '<' in sanitized:
+            sanitized = HTML_TAG_PATTERN.sub('', sanitized)
     
     sanitized = ' '.join(sanitized.split())
     
     return ValidationResult(is_valid=True, sanitized_value=sanitized)
 
+def sanitize_optional_text(text: str | None) -> str | None:
+
+    if text is None:
+        return text
+    result = sanitize_text(text)
+    return result.sanitized_value if result.is_valid else text
+
 def validate_rooms(rooms: Union[int, str]) -> ValidationResult:
 
     try:
@@ -45,6 +45,7 @@ from app.models.requirement import (
 from app.models.user import LanguageEnum, SubscriptionTypeEnum, User
 from app.models.payment import Payment, PaymentStatusEnum, PaymentTypeEnum as PaymentTypeEnumModel
 from app.models.recommended import RecommendedListing
+from app.models.usage import UserMonthlyCounter
 
 __all__ = [
     "User",
@@ -97,4 +98,6 @@ __all__ = [
     "PaymentTypeEnumModel",
     # Recommended
     "RecommendedListing",
+    # Usage counters
+    "UserMonthlyCounter",
 ]
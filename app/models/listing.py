@@ -260,6 +260,7 @@ class Listing(BaseModel):
         Index("idx_listings_status", "status"),
         Index("idx_listings_price", "price"),
         Index("idx_listings_deal_type", "deal_type"),
+        Index("idx_listings_category_id_status", "category_id", "status"),
     )
 
     def __repr__(self) -> str:
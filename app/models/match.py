@@ -9,6 +9,7 @@ from sqlalchemy import (
     Index,
     Integer,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -76,6 +77,16 @@ class Match(BaseModel):
         Index("idx_matches_listing_id", "listing_id"),
         Index("idx_matches_requirement_id", "requirement_id"),
         Index("idx_matches_status", "status"),
+        Index(
+            "idx_matches_listing_id_open",
+            "listing_id",
+            postgresql_where=text("status IN ('new', 'viewed')"),
+        ),
+        Index(
+            "idx_matches_requirement_id_open",
+            "requirement_id",
+            postgresql_where=text("status IN ('new', 'viewed')"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -250,6 +250,7 @@ class Requirement(BaseModel):
         Index("idx_requirements_category_id", "category_id"),
         Index("idx_requirements_status", "status"),
         Index("idx_requirements_deal_type", "deal_type"),
+        Index("idx_requirements_category_id_status", "category_id", "status"),
     )
 
     def __repr__(self) -> str:
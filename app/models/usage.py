@@ -0,0 +1,116 @@
+"""Per-user monthly usage counters maintained by database triggers."""
+import uuid
+
+from sqlalchemy import DDL, ForeignKey, Index, Integer, String, UniqueConstraint, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import BaseModel
+from app.models.listing import Listing
+from app.models.requirement import Requirement
+
+COUNTER_KIND_LISTING = "listing"
+COUNTER_KIND_REQUIREMENT = "requirement"
+
+
+class UserMonthlyCounter(BaseModel):
+    """Number of non-deleted listings/requirements a user created in a month (UTC)."""
+
+    __tablename__ = "user_monthly_counters"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    year_month: Mapped[str] = mapped_column(String(7), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "kind", "year_month", name="uq_user_monthly_counter"),
+        Index("idx_user_monthly_counters_user_id", "user_id"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserMonthlyCounter(user_id={self.user_id}, kind={self.kind}, "
+            f"year_month={self.year_month}, count={self.count})>"
+        )
+
+
+# Counts inserts, drops hard deletes, and moves the counter on transitions
+# into/out of 'deleted', so the quota check is a single indexed lookup
+# instead of a range count.
+BUMP_COUNTER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION bump_user_monthly_counter() RETURNS trigger AS $$
+DECLARE
+    delta integer := 0;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        -- Update only: when a user is deleted, the cascade may already
+        -- have removed their counter rows.
+        IF OLD.status::text <> 'deleted' THEN
+            UPDATE user_monthly_counters
+            SET count = count - 1, updated_at = now()
+            WHERE user_id = OLD.user_id
+              AND kind = TG_ARGV[0]
+              AND year_month = to_char(OLD.created_at AT TIME ZONE 'UTC', 'YYYY-MM');
+        END IF;
+        RETURN OLD;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        IF NEW.status::text <> 'deleted' THEN
+            delta := 1;
+        END IF;
+    ELSIF NEW.status::text = 'deleted' AND OLD.status::text <> 'deleted' THEN
+        delta := -1;
+    ELSIF OLD.status::text = 'deleted' AND NEW.status::text <> 'deleted' THEN
+        delta := 1;
+    END IF;
+
+    IF delta <> 0 THEN
+        INSERT INTO user_monthly_counters (id, user_id, kind, year_month, count, created_at, updated_at)
+        VALUES (
+            gen_random_uuid(),
+            NEW.user_id,
+            TG_ARGV[0],
+            to_char(NEW.created_at AT TIME ZONE 'UTC', 'YYYY-MM'),
+            delta,
+            now(),
+            now()
+        )
+        ON CONFLICT (user_id, kind, year_month)
+        DO UPDATE SET count = user_monthly_counters.count + EXCLUDED.count, updated_at = now();
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def counter_trigger_sql(table: str, kind: str) -> str:
+    return (
+        f"CREATE TRIGGER trg_{table}_monthly_counter "
+        f"AFTER INSERT OR UPDATE OF status OR DELETE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION bump_user_monthly_counter('{kind}')"
+    )
+
+
+# Keep metadata.create_all() (used by the test suite) in line with the migration.
+for _table, _kind in (
+    (Listing.__table__, COUNTER_KIND_LISTING),
+    (Requirement.__table__, COUNTER_KIND_REQUIREMENT),
+):
+    event.listen(
+        _table,
+        "after_create",
+        DDL(BUMP_COUNTER_FUNCTION_SQL).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        _table,
+        "after_create",
+        DDL(counter_trigger_sql(_table.name, _kind)).execute_if(dialect="postgresql"),
+    )
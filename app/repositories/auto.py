@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional, Sequence
 
-from sqlalchemy import and_, or_, select, func
+from sqlalchemy import and_, case, false, func, insert, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -20,6 +20,91 @@ from app.models.auto import (
 from app.repositories.base import BaseRepository
 
 
+def _requirement_conditions(requirement: AutoRequirement) -> list:
+    """WHERE clauses selecting active listings that satisfy a requirement."""
+    conditions = [AutoListing.status == AutoStatusEnum.ACTIVE]
+    
+    # Brand filter
+    if requirement.brands:
+        conditions.append(AutoListing.brand.in_(requirement.brands))
+    
+    # Year range
+    if requirement.year_min:
+        conditions.append(AutoListing.year >= requirement.year_min)
+    if requirement.year_max:
+        conditions.append(AutoListing.year <= requirement.year_max)
+    
+    # Price range
+    if requirement.price_min:
+        conditions.append(AutoListing.price >= requirement.price_min)
+    if requirement.price_max:
+        conditions.append(AutoListing.price <= requirement.price_max)
+    
+    # Mileage
+    if requirement.mileage_max:
+        conditions.append(AutoListing.mileage <= requirement.mileage_max)
+    
+    # Fuel types
+    if requirement.fuel_types:
+        fuel_conditions = [
+            AutoListing.fuel_type == ft for ft in requirement.fuel_types
+        ]
+        conditions.append(or_(*fuel_conditions))
+    
+    # Transmissions
+    if requirement.transmissions:
+        trans_conditions = [
+            AutoListing.transmission == t for t in requirement.transmissions
+        ]
+        conditions.append(or_(*trans_conditions))
+    
+    # Body types
+    if requirement.body_types:
+        body_conditions = [
+            AutoListing.body_type == bt for bt in requirement.body_types
+        ]
+        conditions.append(or_(*body_conditions))
+    
+    # City
+    if requirement.city:
+        conditions.append(AutoListing.city == requirement.city)
+    
+    return conditions
+
+
+def _score_expression(requirement: AutoRequirement):
+    """
+    SQL expression for the 0-100 match score of a listing.
+    
+    Each unmet criterion subtracts its penalty: brand 20, year 10,
+    price 15, mileage 10, fuel type / transmission / body type 10.
+    """
+    penalties = []
+    if requirement.brands:
+        penalties.append((AutoListing.brand.not_in(requirement.brands), 20))
+    if requirement.year_min:
+        penalties.append((AutoListing.year < requirement.year_min, 10))
+    if requirement.year_max:
+        penalties.append((AutoListing.year > requirement.year_max, 10))
+    if requirement.price_min:
+        penalties.append((AutoListing.price < requirement.price_min, 15))
+    if requirement.price_max:
+        penalties.append((AutoListing.price > requirement.price_max, 15))
+    if requirement.mileage_max:
+        penalties.append((AutoListing.mileage > requirement.mileage_max, 10))
+    if requirement.fuel_types:
+        penalties.append((AutoListing.fuel_type.not_in(requirement.fuel_types), 10))
+    if requirement.transmissions:
+        penalties.append((AutoListing.transmission.not_in(requirement.transmissions), 10))
+    if requirement.body_types:
+        penalties.append((AutoListing.body_type.not_in(requirement.body_types), 10))
+    
+    score = literal(100)
+    for condition, penalty in penalties:
+        score = score - case((condition, penalty), else_=0)
+    return func.greatest(0, score)
+
+
 class AutoListingRepository(BaseRepository[AutoListing]):
     """Repository for auto listings."""
 
@@ -93,56 +178,9 @@ class AutoListingRepository(BaseRepository[AutoListing]):
         limit: int = 50,
     ) -> Sequence[AutoListing]:
         """Find listings matching a requirement."""
-        conditions = [AutoListing.status == AutoStatusEnum.ACTIVE]
-        
-        # Brand filter
-        if requirement.brands:
-            conditions.append(AutoListing.brand.in_(requirement.brands))
-        
-        # Year range
-        if requirement.year_min:
-            conditions.append(AutoListing.year >= requirement.year_min)
-        if requirement.year_max:
-            conditions.append(AutoListing.year <= requirement.year_max)
-        
-        # Price range
-        if requirement.price_min:
-            conditions.append(AutoListing.price >= requirement.price_min)
-        if requirement.price_max:
-            conditions.append(AutoListing.price <= requirement.price_max)
-        
-        # Mileage
-        if requirement.mileage_max:
-            conditions.append(AutoListing.mileage <= requirement.mileage_max)
-        
-        # Fuel types
-        if requirement.fuel_types:
-            fuel_conditions = [
-                AutoListing.fuel_type == ft for ft in requirement.fuel_types
-            ]
-            conditions.append(or_(*fuel_conditions))
-        
-        # Transmissions
-        if requirement.transmissions:
-            trans_conditions = [
-                AutoListing.transmission == t for t in requirement.transmissions
-            ]
-            conditions.append(or_(*trans_conditions))
-        
-        # Body types
-        if requirement.body_types:
-            body_conditions = [
-                AutoListing.body_type == bt for bt in requirement.body_types
-            ]
-            conditions.append(or_(*body_conditions))
-        
-        # City
-        if requirement.city:
-            conditions.append(AutoListing.city == requirement.city)
-        
         query = (
             select(AutoListing)
-            .where(and_(*conditions))
+            .where(and_(*_requirement_conditions(requirement)))
             .options(selectinload(AutoListing.media))
             .order_by(AutoListing.is_vip.desc(), AutoListing.created_at.desc())
             .limit(limit)
@@ -240,7 +278,9 @@ class AutoMatchRepository(BaseRepository[AutoMatch]):
             )
             .options(
                 selectinload(AutoMatch.listing).selectinload(AutoListing.media),
-                selectinload(AutoMatch.listing).selectinload(AutoListing.user),
+                # The seller is shown, not their collections
+                selectinload(AutoMatch.listing).selectinload(AutoListing.user).lazyload("*"),
+                selectinload(AutoMatch.requirement),
             )
             .order_by(AutoMatch.score.desc(), AutoMatch.created_at.desc())
         )
@@ -260,6 +300,45 @@ class AutoMatchRepository(BaseRepository[AutoMatch]):
         result = await self.session.execute(query)
         return result.scalar() > 0
 
+    async def create_for_requirement(
+        self,
+        requirement: AutoRequirement,
+        limit: int = 50,
+    ) -> Sequence[AutoMatch]:
+        """
+        Match a requirement against active listings in one statement.
+        
+        Listings already matched to the requirement are skipped; new rows
+        are inserted with their score computed in SQL and returned.
+        """
+        already_matched = select(AutoMatch.id).where(
+            AutoMatch.auto_listing_id == AutoListing.id,
+            AutoMatch.auto_requirement_id == requirement.id,
+        )
+        candidates = (
+            select(
+                func.gen_random_uuid(),
+                AutoListing.id,
+                literal(requirement.id),
+                _score_expression(requirement),
+                literal("pending"),
+                false(),
+            )
+            .where(*_requirement_conditions(requirement), ~already_matched.exists())
+            .order_by(AutoListing.is_vip.desc(), AutoListing.created_at.desc())
+            .limit(limit)
+        )
+        stmt = (
+            insert(AutoMatch)
+            .from_select(
+                ["id", "auto_listing_id", "auto_requirement_id", "score", "status", "buyer_viewed"],
+                candidates,
+            )
+            .returning(AutoMatch)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
     async def get_with_details(self, match_id: uuid.UUID) -> Optional[AutoMatch]:
         """Get match with listing and user details."""
         query = (
@@ -291,6 +370,22 @@ class AutoChatRepository(BaseRepository[AutoChat]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def create_for_match(self, match_id: uuid.UUID, **values) -> AutoChat:
+        """Insert a chat and mark its match contacted in one statement."""
+        mark_contacted = (
+            update(AutoMatch)
+            .where(AutoMatch.id == match_id)
+            .values(status="contacted")
+            .cte("mark_contacted")
+        )
+        result = await self.session.execute(
+            insert(AutoChat)
+            .values(auto_match_id=match_id, **values)
+            .add_cte(mark_contacted)
+            .returning(AutoChat)
+        )
+        return result.scalar_one()
+
     async def get_chats_for_user(
         self,
         user_id: uuid.UUID,
@@ -1,7 +1,8 @@
 import uuid
+from functools import cache
 from typing import Any, Generic, TypeVar, Sequence
 
-from sqlalchemy import select, func
+from sqlalchemy import inspect, select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import BaseModel
@@ -9,6 +10,11 @@ from app.core.database import BaseModel
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
 
+@cache
+def _column_names(model: type[BaseModel]) -> frozenset[str]:
+    return frozenset(inspect(model).column_attrs.keys())
+
+
 class BaseRepository(Generic[ModelType]):
     def __init__(self, model: type[ModelType], session: AsyncSession):
         self.model = model
@@ -54,14 +60,25 @@ class BaseRepository(Generic[ModelType]):
         if db_obj is None:
             return None
 
+        columns = _column_names(self.model)
         for field, value in obj_in.items():
-            if hasattr(db_obj, field):
+            if field in columns:
                 setattr(db_obj, field, value)
 
         await self.session.flush()
-        await self.session.refresh(db_obj)
         return db_obj
 
+    async def update_returning(self, id: uuid.UUID, **values: Any) -> ModelType | None:
+        """Apply ``values`` with a single UPDATE ... RETURNING, without loading the row first."""
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     async def delete(self, id: uuid.UUID, *, soft: bool = True) -> bool:
         db_obj = await self.get(id)
         if db_obj is None:
@@ -4,9 +4,9 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Sequence
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, update, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.models.chat import Chat, ChatMessage, ChatStatusEnum, MessageTypeEnum
 from app.models.match import Match
@@ -51,6 +51,19 @@ class ChatRepository(BaseRepository[Chat]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_with_match_context(self, id: uuid.UUID) -> Chat | None:
+        match = joinedload(Chat.match)
+        query = (
+            select(Chat)
+            .options(
+                match.joinedload(Match.listing),
+                match.joinedload(Match.requirement),
+            )
+            .where(Chat.id == id)
+        )
+        result = await self.session.execute(query)
+        return result.unique().scalar_one_or_none()
+
     async def get_with_messages(
         self,
         id: uuid.UUID,
@@ -111,18 +124,15 @@ class ChatRepository(BaseRepository[Chat]):
         is_buyer: bool,
         revealed: bool = True,
     ) -> Chat | None:
-        chat = await self.get(id)
-        if chat is None:
-            return None
-
-        if is_buyer:
-            chat.buyer_revealed = revealed
-        else:
-            chat.seller_revealed = revealed
-
-        await self.session.flush()
-        await self.session.refresh(chat)
-        return chat
+        flag = Chat.buyer_revealed if is_buyer else Chat.seller_revealed
+        result = await self.session.execute(
+            update(Chat)
+            .where(Chat.id == id)
+            .values({flag: revealed})
+            .returning(Chat)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
 
     async def check_both_revealed(self, id: uuid.UUID) -> bool:
         chat = await self.get(id)
@@ -132,15 +142,7 @@ class ChatRepository(BaseRepository[Chat]):
         return chat.buyer_revealed and chat.seller_revealed
 
     async def archive(self, id: uuid.UUID) -> Chat | None:
-        chat = await self.get(id)
-        if chat is None:
-            return None
-
-        chat.status = ChatStatusEnum.ARCHIVED
-
-        await self.session.flush()
-        await self.session.refresh(chat)
-        return chat
+        return await self.update_returning(id, status=ChatStatusEnum.ARCHIVED)
 
     async def report(
         self,
@@ -149,18 +151,13 @@ class ChatRepository(BaseRepository[Chat]):
         reported_by: uuid.UUID | None = None,
         reason: str | None = None,
     ) -> Chat | None:
-        chat = await self.get(id)
-        if chat is None:
-            return None
-
-        chat.status = ChatStatusEnum.REPORTED
-        chat.reported_by = reported_by
-        chat.report_reason = reason
-        chat.reported_at = datetime.now(timezone.utc)
-
-        await self.session.flush()
-        await self.session.refresh(chat)
-        return chat
+        return await self.update_returning(
+            id,
+            status=ChatStatusEnum.REPORTED,
+            reported_by=reported_by,
+            report_reason=reason,
+            reported_at=datetime.now(timezone.utc),
+        )
 
     async def get_inactive_chats(
         self,
@@ -1,15 +1,69 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from collections.abc import AsyncIterator
 from typing import Any, Sequence
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import Row, select, update, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.listing import Listing, ListingStatusEnum
+from app.models.usage import COUNTER_KIND_LISTING, UserMonthlyCounter
 from app.repositories.base import BaseRepository
+from app.repositories.requirement import MATCH_AREA_TOLERANCE, MATCH_PRICE_TOLERANCE
 
 SIGNIFICANT_PRICE_CHANGE_THRESHOLD = Decimal("0.20")
+_PRICE_CHANGE_NUM, _PRICE_CHANGE_DEN = SIGNIFICANT_PRICE_CHANGE_THRESHOLD.as_integer_ratio()
+
+# Columns an owner edit may touch; status is only changed by the remoderation check.
+_LISTING_UPDATABLE_FIELDS = frozenset(Listing.__table__.columns.keys()) - {
+    "id",
+    "user_id",
+    "status",
+    "created_at",
+    "updated_at",
+}
+
+# Columns needed to render a listing card (see ListingListResponse); list reads
+# select these as plain rows instead of hydrating full ORM objects.
+LISTING_CARD_COLUMNS = (
+    Listing.id,
+    Listing.user_id,
+    Listing.category_id,
+    Listing.location_id,
+    Listing.price,
+    Listing.payment_type,
+    Listing.rooms,
+    Listing.area,
+    Listing.floor,
+    Listing.building_floors,
+    Listing.renovation_status,
+    Listing.status,
+    Listing.is_vip,
+    Listing.expires_at,
+    Listing.created_at,
+)
+
+
+# Columns ListingData.from_model reads, plus the owner; match candidate reads
+# select these as plain rows instead of hydrating ORM objects.
+LISTING_MATCH_COLUMNS = (
+    Listing.id,
+    Listing.user_id,
+    Listing.category_id,
+    Listing.location_id,
+    Listing.price,
+    Listing.rooms,
+    Listing.area,
+    Listing.floor,
+    Listing.building_floors,
+    Listing.renovation_status,
+    Listing.document_types,
+    Listing.utilities,
+    Listing.heating_type,
+    Listing.is_vip,
+    Listing.priority_score,
+)
 
 
 class ListingRepository(BaseRepository[Listing]):
@@ -53,6 +107,62 @@ class ListingRepository(BaseRepository[Listing]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def stream_match_candidates(
+        self,
+        *,
+        category_id: uuid.UUID,
+        location_ids: Sequence[uuid.UUID],
+        price_min: Decimal | None = None,
+        price_max: Decimal | None = None,
+        area_min: Decimal | None = None,
+        area_max: Decimal | None = None,
+        limit: int = 100,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Active listings in ``category_id`` that a requirement could match,
+        streamed in partitions of ``chunk_size`` rows.
+        
+        Listings outside ``location_ids`` are kept only when their price and
+        area are within MATCH_PRICE_TOLERANCE / MATCH_AREA_TOLERANCE of the
+        requirement's ranges; an empty ``location_ids`` keeps every location.
+        Rows carry LISTING_MATCH_COLUMNS.
+        """
+        now = datetime.now(timezone.utc)
+
+        conditions = [
+            Listing.status == ListingStatusEnum.ACTIVE,
+            or_(
+                Listing.expires_at.is_(None),
+                Listing.expires_at > now
+            ),
+            Listing.category_id == category_id,
+        ]
+
+        if location_ids:
+            near_ranges = []
+            if price_min is not None:
+                near_ranges.append(Listing.price >= price_min * (1 - MATCH_PRICE_TOLERANCE))
+            if price_max is not None:
+                near_ranges.append(Listing.price <= price_max * (1 + MATCH_PRICE_TOLERANCE))
+            if area_min is not None:
+                near_ranges.append(Listing.area >= area_min * (1 - MATCH_AREA_TOLERANCE))
+            if area_max is not None:
+                near_ranges.append(Listing.area <= area_max * (1 + MATCH_AREA_TOLERANCE))
+            if near_ranges:
+                conditions.append(or_(Listing.location_id.in_(location_ids), and_(*near_ranges)))
+
+        query = (
+            select(*LISTING_MATCH_COLUMNS)
+            .where(and_(*conditions))
+            .limit(limit)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        result = await self.session.stream(query)
+        async for chunk in result.partitions():
+            yield chunk
+
     async def get_by_user(
         self,
         user_id: uuid.UUID,
@@ -77,38 +187,78 @@ class ListingRepository(BaseRepository[Listing]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_cards_by_user(
+        self,
+        user_id: uuid.UUID,
+        *,
+        include_deleted: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[Row]:
+        conditions = [Listing.user_id == user_id]
+
+        if not include_deleted:
+            conditions.append(Listing.status != ListingStatusEnum.DELETED)
+
+        query = (
+            select(*LISTING_CARD_COLUMNS)
+            .where(and_(*conditions))
+            .order_by(Listing.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        return result.all()
+
     async def update_with_remoderation_check(
         self,
         id: uuid.UUID,
         obj_in: dict[str, Any],
     ) -> tuple[Listing | None, bool]:
-        listing = await self.get(id)
-        if listing is None:
+        current = await self.session.execute(
+            select(Listing.price, Listing.location_id, Listing.status).where(Listing.id == id)
+        )
+        row = current.one_or_none()
+        if row is None:
             return None, False
 
+        old_price, old_location_id, old_status = row
         requires_remoderation = False
 
         if "price" in obj_in:
-            new_price = Decimal(str(obj_in["price"]))
-            old_price = listing.price
-            if old_price > 0:
-                price_change = abs(new_price - old_price) / old_price
-                if price_change > SIGNIFICANT_PRICE_CHANGE_THRESHOLD:
-                    requires_remoderation = True
-
-        if "location_id" in obj_in and obj_in["location_id"] != listing.location_id:
+            new_price = obj_in["price"]
+            if not isinstance(new_price, Decimal):
+                new_price = Decimal(str(new_price))
+            # |new - old| / old > num / den, rearranged to avoid the division
+            if old_price > 0 and (
+                abs(new_price - old_price) * _PRICE_CHANGE_DEN > old_price * _PRICE_CHANGE_NUM
+            ):
+                requires_remoderation = True
+
+        if "location_id" in obj_in and obj_in["location_id"] != old_location_id:
             requires_remoderation = True
 
-        for field, value in obj_in.items():
-            if hasattr(listing, field):
-                setattr(listing, field, value)
+        values = {
+            field: value
+            for field, value in obj_in.items()
+            if field in _LISTING_UPDATABLE_FIELDS
+        }
 
-        if requires_remoderation and listing.status == ListingStatusEnum.ACTIVE:
-            listing.status = ListingStatusEnum.PENDING_MODERATION
+        if requires_remoderation and old_status == ListingStatusEnum.ACTIVE:
+            values["status"] = ListingStatusEnum.PENDING_MODERATION
 
-        await self.session.flush()
-        await self.session.refresh(listing)
-        return listing, requires_remoderation
+        if not values:
+            return await self.get(id), requires_remoderation
+
+        result = await self.session.execute(
+            update(Listing)
+            .where(Listing.id == id)
+            .values(**values)
+            .returning(Listing)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one(), requires_remoderation
 
     async def approve(
         self,
@@ -196,9 +346,9 @@ class ListingRepository(BaseRepository[Listing]):
         *,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[Listing]:
+    ) -> Sequence[Row]:
         query = (
-            select(Listing)
+            select(*LISTING_CARD_COLUMNS)
             .where(Listing.status == ListingStatusEnum.PENDING_MODERATION)
             .order_by(Listing.created_at.asc())
             .offset(skip)
@@ -206,7 +356,7 @@ class ListingRepository(BaseRepository[Listing]):
         )
 
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_expiring_soon(
         self,
@@ -214,12 +364,12 @@ class ListingRepository(BaseRepository[Listing]):
         *,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[Listing]:
+    ) -> Sequence[Row]:
         now = datetime.now(timezone.utc)
         expiry_threshold = now + timedelta(days=days_until_expiry)
 
         query = (
-            select(Listing)
+            select(*LISTING_CARD_COLUMNS)
             .where(
                 and_(
                     Listing.status == ListingStatusEnum.ACTIVE,
@@ -234,7 +384,7 @@ class ListingRepository(BaseRepository[Listing]):
         )
 
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def expire_old_listings(self) -> int:
         now = datetime.now(timezone.utc)
@@ -310,18 +460,14 @@ class ListingRepository(BaseRepository[Listing]):
         return count
 
     async def count_by_user_this_month(self, user_id: uuid.UUID) -> int:
+        # Maintained by the bump_user_monthly_counter trigger on listings.
         now = datetime.now(timezone.utc)
-        month_start = datetime(now.year, now.month, 1, tzinfo=timezone.utc)
 
-        query = (
-            select(func.count())
-            .select_from(Listing)
-            .where(
-                and_(
-                    Listing.user_id == user_id,
-                    Listing.created_at >= month_start,
-                    Listing.status != ListingStatusEnum.DELETED,
-                )
+        query = select(UserMonthlyCounter.count).where(
+            and_(
+                UserMonthlyCounter.user_id == user_id,
+                UserMonthlyCounter.kind == COUNTER_KIND_LISTING,
+                UserMonthlyCounter.year_month == now.strftime("%Y-%m"),
             )
         )
 
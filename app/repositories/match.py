@@ -1,8 +1,11 @@
+import asyncio
 import uuid
-from typing import Sequence
+from operator import attrgetter
+from typing import Any, Sequence
 
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, Select, select, update, and_, or_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from app.models.match import Match, MatchStatusEnum
@@ -10,10 +13,27 @@ from app.models.listing import Listing
 from app.models.requirement import Requirement
 from app.repositories.base import BaseRepository
 
+OPEN_MATCH_STATUSES = (MatchStatusEnum.NEW, MatchStatusEnum.VIEWED)
+
 
 class MatchRepository(BaseRepository[Match]):
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
         super().__init__(Match, session)
+        # When set, buyer-side and seller-side lookups run concurrently on two
+        # extra sessions. Those sessions only see committed data, so this is
+        # meant for read-only request paths.
+        self.session_factory = session_factory
+
+    async def _two_sided(self, q1: Select, q2: Select) -> tuple[Sequence[Any], Sequence[Any]]:
+        if self.session_factory is None:
+            raise RuntimeError("_two_sided needs a session_factory")
+        async with self.session_factory() as s1, self.session_factory() as s2:
+            r1, r2 = await asyncio.gather(s1.execute(q1), s2.execute(q2))
+            return r1.scalars().all(), r2.scalars().all()
 
     async def create_match(
         self,
@@ -21,20 +41,65 @@ class MatchRepository(BaseRepository[Match]):
         requirement_id: uuid.UUID,
         score: int,
     ) -> Match | None:
-        existing = await self.get_by_listing_and_requirement(
-            listing_id, requirement_id
+        """Insert a match; returns None if the pair already has one."""
+        result = await self.session.execute(
+            pg_insert(Match)
+            .values(
+                listing_id=listing_id,
+                requirement_id=requirement_id,
+                score=score,
+                status=MatchStatusEnum.NEW,
+            )
+            .on_conflict_do_nothing(constraint="uq_match_listing_requirement")
+            .returning(Match)
         )
-        if existing is not None:
-            return None
-
-        match_data = {
-            "listing_id": listing_id,
-            "requirement_id": requirement_id,
-            "score": score,
-            "status": MatchStatusEnum.NEW,
-        }
+        return result.scalar_one_or_none()
 
-        return await super().create(match_data)
+    async def create_matches(
+        self,
+        matches: Sequence[tuple[uuid.UUID, uuid.UUID, int]],
+    ) -> Sequence[Row]:
+        """
+        Insert ``(listing_id, requirement_id, score)`` matches in bulk.
+        
+        Pairs that already have a match are skipped; returns
+        ``(id, listing_id, requirement_id)`` rows for the inserted ones.
+        """
+        if not matches:
+            return []
+
+        stmt = (
+            pg_insert(Match)
+            .on_conflict_do_nothing(constraint="uq_match_listing_requirement")
+            .returning(Match.id, Match.listing_id, Match.requirement_id)
+        )
+        result = await self.session.execute(
+            stmt,
+            [
+                {
+                    "listing_id": listing_id,
+                    "requirement_id": requirement_id,
+                    "score": score,
+                    "status": MatchStatusEnum.NEW,
+                }
+                for listing_id, requirement_id, score in matches
+            ],
+        )
+        return result.all()
+
+    async def get_party_user_ids(self, id: uuid.UUID) -> Row | None:
+        """``(buyer_user_id, seller_user_id)`` for a match, in one joined query."""
+        result = await self.session.execute(
+            select(
+                Requirement.user_id.label("buyer_user_id"),
+                Listing.user_id.label("seller_user_id"),
+            )
+            .select_from(Match)
+            .join(Listing, Match.listing_id == Listing.id)
+            .join(Requirement, Match.requirement_id == Requirement.id)
+            .where(Match.id == id)
+        )
+        return result.one_or_none()
 
     async def get_by_listing_and_requirement(
         self,
@@ -113,6 +178,23 @@ class MatchRepository(BaseRepository[Match]):
         req_subquery = select(Requirement.id).where(Requirement.user_id == user_id)
         listing_subquery = select(Listing.id).where(Listing.user_id == user_id)
 
+        if self.session_factory is not None:
+            side_query = select(Match).options(
+                selectinload(Match.listing),
+                selectinload(Match.requirement),
+            )
+            if status is not None:
+                side_query = side_query.where(Match.status == status)
+            side_query = side_query.order_by(Match.created_at.desc()).limit(skip + limit)
+
+            as_buyer, as_seller = await self._two_sided(
+                side_query.where(Match.requirement_id.in_(req_subquery)),
+                side_query.where(Match.listing_id.in_(listing_subquery)),
+            )
+            merged = {m.id: m for m in (*as_buyer, *as_seller)}
+            ordered = sorted(merged.values(), key=attrgetter("created_at"), reverse=True)
+            return ordered[skip:skip + limit]
+
         query = (
             select(Match)
             .options(
@@ -135,6 +217,32 @@ class MatchRepository(BaseRepository[Match]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def count_matches_for_user(
+        self,
+        user_id: uuid.UUID,
+        *,
+        status: MatchStatusEnum | None = None,
+    ) -> int:
+        req_subquery = select(Requirement.id).where(Requirement.user_id == user_id)
+        listing_subquery = select(Listing.id).where(Listing.user_id == user_id)
+
+        query = (
+            select(func.count())
+            .select_from(Match)
+            .where(
+                or_(
+                    Match.requirement_id.in_(req_subquery),
+                    Match.listing_id.in_(listing_subquery),
+                )
+            )
+        )
+
+        if status is not None:
+            query = query.where(Match.status == status)
+
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
     async def get_matches_for_listing(
         self,
         listing_id: uuid.UUID,
@@ -184,15 +292,7 @@ class MatchRepository(BaseRepository[Match]):
         id: uuid.UUID,
         status: MatchStatusEnum,
     ) -> Match | None:
-        match = await self.get(id)
-        if match is None:
-            return None
-
-        match.status = status
-
-        await self.session.flush()
-        await self.session.refresh(match)
-        return match
+        return await self.update_returning(id, status=status)
 
     async def mark_viewed(self, id: uuid.UUID) -> Match | None:
         return await self.update_status(id, MatchStatusEnum.VIEWED)
@@ -207,52 +307,30 @@ class MatchRepository(BaseRepository[Match]):
         return await self.update_status(id, MatchStatusEnum.REJECTED_BY_SELLER)
 
     async def cancel_matches_for_listing(self, listing_id: uuid.UUID) -> int:
-        query = select(Match).where(
-            and_(
-                Match.listing_id == listing_id,
-                Match.status.in_([
-                    MatchStatusEnum.NEW,
-                    MatchStatusEnum.VIEWED,
-                ]),
+        result = await self.session.execute(
+            update(Match)
+            .where(
+                and_(
+                    Match.listing_id == listing_id,
+                    Match.status.in_(OPEN_MATCH_STATUSES),
+                )
             )
+            .values(status=MatchStatusEnum.CANCELLED)
         )
-
-        result = await self.session.execute(query)
-        matches = result.scalars().all()
-
-        count = 0
-        for match in matches:
-            match.status = MatchStatusEnum.CANCELLED
-            count += 1
-
-        if count > 0:
-            await self.session.flush()
-
-        return count
+        return result.rowcount
 
     async def cancel_matches_for_requirement(self, requirement_id: uuid.UUID) -> int:
-        query = select(Match).where(
-            and_(
-                Match.requirement_id == requirement_id,
-                Match.status.in_([
-                    MatchStatusEnum.NEW,
-                    MatchStatusEnum.VIEWED,
-                ]),
+        result = await self.session.execute(
+            update(Match)
+            .where(
+                and_(
+                    Match.requirement_id == requirement_id,
+                    Match.status.in_(OPEN_MATCH_STATUSES),
+                )
             )
+            .values(status=MatchStatusEnum.CANCELLED)
         )
-
-        result = await self.session.execute(query)
-        matches = result.scalars().all()
-
-        count = 0
-        for match in matches:
-            match.status = MatchStatusEnum.CANCELLED
-            count += 1
-
-        if count > 0:
-            await self.session.flush()
-
-        return count
+        return result.rowcount
 
     async def get_new_matches_count(self, user_id: uuid.UUID) -> int:
         req_subquery = select(Requirement.id).where(Requirement.user_id == user_id)
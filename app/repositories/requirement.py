@@ -1,8 +1,10 @@
 import uuid
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from collections.abc import AsyncIterator
 from typing import Any, Sequence
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import Row, delete, func, insert, select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -11,10 +13,39 @@ from app.models.requirement import (
     RequirementLocation,
     RequirementStatusEnum,
 )
+from app.models.usage import COUNTER_KIND_REQUIREMENT, UserMonthlyCounter
 from app.repositories.base import BaseRepository
 
 DEFAULT_REQUIREMENT_EXPIRY_DAYS = 90
 
+# With the default match weights a pair whose location does not match can only
+# reach the 70-point threshold with price within 10% and area within 20% of the
+# buyer's range; candidate queries use this to skip hopeless rows in SQL.
+MATCH_PRICE_TOLERANCE = Decimal("0.10")
+MATCH_AREA_TOLERANCE = Decimal("0.20")
+
+# Columns RequirementData.from_model reads, plus the owner; match candidate
+# reads select these as plain rows instead of hydrating ORM objects.
+REQUIREMENT_MATCH_COLUMNS = (
+    Requirement.id,
+    Requirement.user_id,
+    Requirement.category_id,
+    Requirement.price_min,
+    Requirement.price_max,
+    Requirement.rooms_min,
+    Requirement.rooms_max,
+    Requirement.area_min,
+    Requirement.area_max,
+    Requirement.floor_min,
+    Requirement.floor_max,
+    Requirement.not_first_floor,
+    Requirement.not_last_floor,
+    Requirement.renovation_status,
+    Requirement.document_types,
+    Requirement.utilities,
+    Requirement.heating_types,
+)
+
 
 class RequirementRepository(BaseRepository[Requirement]):
     def __init__(self, session: AsyncSession):
@@ -67,6 +98,74 @@ class RequirementRepository(BaseRepository[Requirement]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def stream_match_candidates(
+        self,
+        *,
+        category_id: uuid.UUID,
+        location_id: uuid.UUID,
+        price: Decimal,
+        area: Decimal,
+        limit: int = 100,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Active requirements in ``category_id`` that a listing could match,
+        streamed in partitions of ``chunk_size`` rows.
+        
+        Keeps requirements that cover ``location_id`` (or have no locations)
+        and otherwise only those whose price and area ranges are within
+        MATCH_PRICE_TOLERANCE / MATCH_AREA_TOLERANCE of the listing.
+        Rows carry REQUIREMENT_MATCH_COLUMNS plus ``location_ids`` (NULL
+        when the requirement has none).
+        """
+        now = datetime.now(timezone.utc)
+
+        location_ids = (
+            select(func.array_agg(RequirementLocation.location_id))
+            .where(RequirementLocation.requirement_id == Requirement.id)
+            .scalar_subquery()
+            .label("location_ids")
+        )
+        query = (
+            select(*REQUIREMENT_MATCH_COLUMNS, location_ids)
+            .where(
+                Requirement.status == RequirementStatusEnum.ACTIVE,
+                or_(
+                    Requirement.expires_at.is_(None),
+                    Requirement.expires_at > now
+                ),
+                Requirement.category_id == category_id,
+                or_(
+                    ~Requirement.locations.any(),
+                    Requirement.locations.any(RequirementLocation.location_id == location_id),
+                    and_(
+                        or_(
+                            Requirement.price_min.is_(None),
+                            Requirement.price_min * (1 - MATCH_PRICE_TOLERANCE) <= price,
+                        ),
+                        or_(
+                            Requirement.price_max.is_(None),
+                            Requirement.price_max * (1 + MATCH_PRICE_TOLERANCE) >= price,
+                        ),
+                        or_(
+                            Requirement.area_min.is_(None),
+                            Requirement.area_min * (1 - MATCH_AREA_TOLERANCE) <= area,
+                        ),
+                        or_(
+                            Requirement.area_max.is_(None),
+                            Requirement.area_max * (1 + MATCH_AREA_TOLERANCE) >= area,
+                        ),
+                    ),
+                ),
+            )
+            .limit(limit)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        result = await self.session.stream(query)
+        async for chunk in result.partitions():
+            yield chunk
+
     async def get_by_user(
         self,
         user_id: uuid.UUID,
@@ -98,40 +197,55 @@ class RequirementRepository(BaseRepository[Requirement]):
         location_id: uuid.UUID,
         search_radius_km: float = 2.0,
     ) -> RequirementLocation | None:
-        requirement = await self.get(requirement_id)
-        if requirement is None:
+        added = await self.add_locations(
+            requirement_id, [(location_id, search_radius_km)]
+        )
+        return added[0] if added else None
+
+    async def add_locations(
+        self,
+        requirement_id: uuid.UUID,
+        locations: Sequence[tuple[uuid.UUID, float]],
+    ) -> Sequence[RequirementLocation] | None:
+        exists = await self.session.scalar(
+            select(Requirement.id).where(Requirement.id == requirement_id)
+        )
+        if exists is None:
             return None
 
-        req_location = RequirementLocation(
-            requirement_id=requirement_id,
-            location_id=location_id,
-            search_radius_km=search_radius_km,
+        if not locations:
+            return []
+
+        result = await self.session.scalars(
+            insert(RequirementLocation).returning(RequirementLocation),
+            [
+                {
+                    "requirement_id": requirement_id,
+                    "location_id": location_id,
+                    "search_radius_km": search_radius_km,
+                }
+                for location_id, search_radius_km in locations
+            ],
         )
-        self.session.add(req_location)
-        await self.session.flush()
-        await self.session.refresh(req_location)
-        return req_location
+        return result.all()
 
     async def remove_location(
         self,
         requirement_id: uuid.UUID,
         location_id: uuid.UUID,
     ) -> bool:
-        query = select(RequirementLocation).where(
-            and_(
-                RequirementLocation.requirement_id == requirement_id,
-                RequirementLocation.location_id == location_id,
+        query = (
+            delete(RequirementLocation)
+            .where(
+                and_(
+                    RequirementLocation.requirement_id == requirement_id,
+                    RequirementLocation.location_id == location_id,
+                )
             )
+            .returning(RequirementLocation.id)
         )
         result = await self.session.execute(query)
-        req_location = result.scalar_one_or_none()
-
-        if req_location is None:
-            return False
-
-        await self.session.delete(req_location)
-        await self.session.flush()
-        return True
+        return result.first() is not None
 
     async def soft_delete(self, id: uuid.UUID) -> Requirement | None:
         requirement = await self.get(id)
@@ -249,18 +363,14 @@ class RequirementRepository(BaseRepository[Requirement]):
         return count
 
     async def count_by_user_this_month(self, user_id: uuid.UUID) -> int:
+        # Maintained by the bump_user_monthly_counter trigger on requirements.
         now = datetime.now(timezone.utc)
-        month_start = datetime(now.year, now.month, 1, tzinfo=timezone.utc)
 
-        query = (
-            select(func.count())
-            .select_from(Requirement)
-            .where(
-                and_(
-                    Requirement.user_id == user_id,
-                    Requirement.created_at >= month_start,
-                    Requirement.status != RequirementStatusEnum.DELETED,
-                )
+        query = select(UserMonthlyCounter.count).where(
+            and_(
+                UserMonthlyCounter.user_id == user_id,
+                UserMonthlyCounter.kind == COUNTER_KIND_REQUIREMENT,
+                UserMonthlyCounter.year_month == now.strftime("%Y-%m"),
             )
         )
 
@@ -1,6 +1,7 @@
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.settings import GlobalSettings
@@ -21,20 +22,19 @@ class SettingsRepository:
         return setting.value if setting else None
 
     async def set(self, key: str, value: int) -> GlobalSettings:
-        """Set setting value."""
-        result = await self.session.execute(
-            select(GlobalSettings).where(GlobalSettings.key == key)
+        """Set setting value (single-statement upsert, committed by the caller)."""
+        stmt = (
+            pg_insert(GlobalSettings)
+            .values(key=key, value=value)
+            .on_conflict_do_update(
+                index_elements=[GlobalSettings.key],
+                set_={"value": value, "updated_at": func.now()},
+            )
+            .returning(GlobalSettings)
+            .execution_options(populate_existing=True)
         )
-        setting = result.scalar_one_or_none()
-        
-        if setting:
-            setting.value = value
-        else:
-            setting = GlobalSettings(key=key, value=value)
-            self.session.add(setting)
-        
-        await self.session.commit()
-        return setting
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
 
     async def get_all(self) -> dict[str, int]:
         """Get all settings as dict."""
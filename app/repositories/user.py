@@ -1,81 +1,114 @@
+import uuid
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.models.user import User, LanguageEnum
 from app.repositories.base import BaseRepository
 
+_USER_UPDATABLE_FIELDS = frozenset(User.__table__.columns.keys()) - {
+    "id",
+    "telegram_id",
+    "created_at",
+    "updated_at",
+}
+
 
 class UserRepository(BaseRepository[User]):
+    # Built once; callers only bind the parameter.
+    _GET_BY_TELEGRAM_ID = (
+        select(User)
+        .where(User.telegram_id == bindparam("telegram_id"))
+        .options(lazyload("*"))
+    )
+
     def __init__(self, session: AsyncSession):
         super().__init__(User, session)
 
-    async def get_by_telegram_id(self, telegram_id: int) -> User | None:
+    async def get_by_telegram_id(
+        self,
+        telegram_id: int,
+        *,
+        load: Sequence[str] = (),
+    ) -> User | None:
+        """Fetch a user by Telegram ID, eager-loading only the relationships in ``load``.
+
+        The mapper's ``selectin`` defaults would otherwise issue one extra
+        query per collection on every lookup, which the webhook paths never read.
+        """
+        query = self._GET_BY_TELEGRAM_ID
+        if load:
+            query = query.options(*(selectinload(getattr(User, name)) for name in load))
+        result = await self.session.execute(query, {"telegram_id": telegram_id})
+        return result.scalar_one_or_none()
+
+    async def get_many(self, ids: Sequence[uuid.UUID]) -> dict[uuid.UUID, User]:
+        """Fetch several users in one query, keyed by ID, without relationships."""
         result = await self.session.execute(
-            select(User).where(User.telegram_id == telegram_id)
+            select(User).where(User.id.in_(ids)).options(lazyload("*"))
         )
-        return result.scalar_one_or_none()
+        return {user.id: user for user in result.scalars()}
 
     async def create_or_update(
         self,
         telegram_id: int,
         data: dict[str, Any],
+        *,
+        defaults: dict[str, Any] | None = None,
     ) -> tuple[User, bool]:
-        existing_user = await self.get_by_telegram_id(telegram_id)
-
-        if existing_user is not None:
-            for field, value in data.items():
-                if hasattr(existing_user, field) and field != "telegram_id":
-                    setattr(existing_user, field, value)
-
-            await self.session.flush()
-            await self.session.refresh(existing_user)
-            return existing_user, False
+        """Upsert by ``telegram_id``; ``defaults`` only apply to a new row."""
+        values = {
+            field: value
+            for field, value in data.items()
+            if field in _USER_UPDATABLE_FIELDS
+        }
+        stmt = pg_insert(User).values(
+            telegram_id=telegram_id, **{**(defaults or {}), **values}
+        )
+        # An empty SET is invalid; a no-op assignment still lets RETURNING see the row.
+        set_ = {**values, "updated_at": func.now()} if values else {"telegram_id": stmt.excluded.telegram_id}
+        stmt = stmt.on_conflict_do_update(index_elements=[User.telegram_id], set_=set_)
+        result = await self.session.execute(
+            stmt.returning(User, literal_column("xmax = 0").label("inserted"))
+            .execution_options(populate_existing=True)
+        )
+        user, inserted = result.one()
+        return user, inserted
 
-        user_data = {"telegram_id": telegram_id, **data}
-        new_user = await self.create(user_data)
-        return new_user, True
+    async def _update_by_telegram_id(self, telegram_id: int, **values: Any) -> User | None:
+        result = await self.session.execute(
+            update(User)
+            .where(User.telegram_id == telegram_id)
+            .values(**values)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
 
     async def update_language(
         self,
         telegram_id: int,
         language: LanguageEnum,
     ) -> User | None:
-        user = await self.get_by_telegram_id(telegram_id)
-        if user is None:
-            return None
-
-        user.language = language
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        return await self._update_by_telegram_id(telegram_id, language=language)
 
     async def block_user(
         self,
         telegram_id: int,
         reason: str | None = None,
     ) -> User | None:
-        user = await self.get_by_telegram_id(telegram_id)
-        if user is None:
-            return None
-
-        user.is_blocked = True
-        user.blocked_reason = reason
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        return await self._update_by_telegram_id(
+            telegram_id, is_blocked=True, blocked_reason=reason
+        )
 
     async def unblock_user(self, telegram_id: int) -> User | None:
-        user = await self.get_by_telegram_id(telegram_id)
-        if user is None:
-            return None
-
-        user.is_blocked = False
-        user.blocked_reason = None
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        return await self._update_by_telegram_id(
+            telegram_id, is_blocked=False, blocked_reason=None
+        )
 
     async def get_active_users_count(self) -> int:
         return await self.count(filters={"is_blocked": False})
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from pydantic import Field, field_validator
 
+from app.core.validators import sanitize_optional_text
 from app.models.chat import ChatStatusEnum, MessageTypeEnum
 from app.schemas.common import BaseSchema, IDTimestampSchema
 
@@ -20,15 +21,7 @@ class ChatMessageCreate(BaseSchema):
     content: str | None = Field(None, max_length=4000)
     media_url: str | None = Field(None, max_length=500)
     
-    @field_validator("content")
-    @classmethod
-    def sanitize_content(cls, v: str | None) -> str | None:
-
-        if v is None:
-            return v
-        from app.core.validators import sanitize_text
-        result = sanitize_text(v)
-        return result.sanitized_value if result.is_valid else v
+    sanitize_content = field_validator("content")(sanitize_optional_text)
 
 class ChatMessageResponse(ChatMessageBase, IDTimestampSchema):
 
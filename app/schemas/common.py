@@ -1,18 +1,76 @@
+import types
+from collections.abc import Callable, Mapping
 from datetime import datetime
-from typing import Any, Generic, TypeVar
+from functools import cache, lru_cache
+from typing import Any, Generic, Self, TypeVar, Union, get_args, get_origin
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 T = TypeVar("T")
 
+_MISSING = object()
+
 class BaseSchema(BaseModel):
 
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True,
-    )
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, /, **extra: Any) -> Self:
+        """
+        Build a response schema from a DB row without re-running validation.
+        
+        Only for data the database already constrains; inbound request
+        bodies must keep going through ``model_validate``. Attributes missing
+        on ``obj`` fall back to field defaults, ``extra`` supplies values that
+        are not read from ``obj``.
+        """
+        is_mapping = isinstance(obj, Mapping)
+        values: dict[str, Any] = {}
+        for name, convert in _trusted_fields(cls):
+            if name in extra:
+                value = extra[name]
+            elif is_mapping:
+                value = obj.get(name, _MISSING)
+            else:
+                value = getattr(obj, name, _MISSING)
+            if value is _MISSING:
+                continue
+            if convert is not None and value is not None:
+                value = convert(value)
+            values[name] = value
+        return cls.model_construct(**values)
+
+@cache
+def _trusted_fields(
+    cls: type[BaseSchema],
+) -> tuple[tuple[str, Callable[[Any], Any] | None], ...]:
+    """Field names of ``cls`` with a converter for nested schema fields."""
+    fields = []
+    for name, info in cls.model_fields.items():
+        fields.append((name, _nested_converter(info.annotation)))
+    return tuple(fields)
+
+def _nested_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        return _nested_converter(args[0]) if len(args) == 1 else None
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        item_converter = _nested_converter(item)
+        if item_converter is None:
+            return None
+        return lambda values: [item_converter(v) for v in values]
+    if isinstance(annotation, type) and issubclass(annotation, BaseSchema):
+        return lambda value: value if isinstance(value, annotation) else annotation.from_orm_trusted(value)
+    return None
+
+@lru_cache(maxsize=256)
+def list_adapter(item_type: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Shared ``TypeAdapter`` for ``list[item_type]``, built once per schema."""
+    return TypeAdapter(list[item_type])
 
 class TimestampSchema(BaseSchema):
 
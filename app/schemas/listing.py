@@ -15,6 +15,7 @@ from app.core.validators import (
     PRICE_MIN_AZN,
     ROOMS_MAX,
     ROOMS_MIN,
+    sanitize_optional_text,
 )
 from app.models.listing import (
     HeatingTypeEnum,
@@ -90,15 +91,7 @@ class ListingCreate(ListingBase):
     
     coordinates: CoordinatesSchema | None = None
     
-    @field_validator("description")
-    @classmethod
-    def sanitize_description(cls, v: str | None) -> str | None:
-
-        if v is None:
-            return v
-        from app.core.validators import sanitize_text
-        result = sanitize_text(v)
-        return result.sanitized_value if result.is_valid else v
+    sanitize_description = field_validator("description")(sanitize_optional_text)
 
 class ListingUpdate(BaseSchema):
 
@@ -119,15 +112,7 @@ class ListingUpdate(BaseSchema):
     description: str | None = Field(None, max_length=1000)
     coordinates: CoordinatesSchema | None = None
     
-    @field_validator("description")
-    @classmethod
-    def sanitize_description(cls, v: str | None) -> str | None:
-
-        if v is None:
-            return v
-        from app.core.validators import sanitize_text
-        result = sanitize_text(v)
-        return result.sanitized_value if result.is_valid else v
+    sanitize_description = field_validator("description")(sanitize_optional_text)
 
 class ListingResponse(ListingBase, IDTimestampSchema):
 
@@ -15,10 +15,19 @@ from app.core.validators import (
     PRICE_MIN_AZN,
     ROOMS_MAX,
     ROOMS_MIN,
+    sanitize_optional_text,
 )
 from app.models.requirement import RequirementPaymentTypeEnum, RequirementStatusEnum
 from app.schemas.common import BaseSchema, IDTimestampSchema
 
+_RANGE_PAIRS = (
+    ("price_min", "price_max"),
+    ("rooms_min", "rooms_max"),
+    ("area_min", "area_max"),
+    ("floor_min", "floor_max"),
+    ("building_floors_min", "building_floors_max"),
+)
+
 class RequirementLocationBase(BaseSchema):
 
     
@@ -70,37 +79,15 @@ class RequirementBase(BaseSchema):
     @model_validator(mode="after")
     def validate_ranges(self) -> "RequirementBase":
 
-        if self.price_min is not None and self.price_max is not None:
-            if self.price_min > self.price_max:
-                raise ValueError("price_min must be less than or equal to price_max")
-        
-        if self.rooms_min is not None and self.rooms_max is not None:
-            if self.rooms_min > self.rooms_max:
-                raise ValueError("rooms_min must be less than or equal to rooms_max")
-        
-        if self.area_min is not None and self.area_max is not None:
-            if self.area_min > self.area_max:
-                raise ValueError("area_min must be less than or equal to area_max")
-        
-        if self.floor_min is not None and self.floor_max is not None:
-            if self.floor_min > self.floor_max:
-                raise ValueError("floor_min must be less than or equal to floor_max")
-        
-        if self.building_floors_min is not None and self.building_floors_max is not None:
-            if self.building_floors_min > self.building_floors_max:
-                raise ValueError("building_floors_min must be less than or equal to building_floors_max")
+        for low, high in _RANGE_PAIRS:
+            low_value = getattr(self, low)
+            high_value = getattr(self, high)
+            if low_value is not None and high_value is not None and low_value > high_value:
+                raise ValueError(f"{low} must be less than or equal to {high}")
         
         return self
     
-    @field_validator("comments")
-    @classmethod
-    def sanitize_comments(cls, v: str | None) -> str | None:
-
-        if v is None:
-            return v
-        from app.core.validators import sanitize_text
-        result = sanitize_text(v)
-        return result.sanitized_value if result.is_valid else v
+    sanitize_comments = field_validator("comments")(sanitize_optional_text)
 
 class RequirementCreate(RequirementBase):
 
@@ -141,15 +128,7 @@ class RequirementUpdate(BaseSchema):
         max_length=5
     )
     
-    @field_validator("comments")
-    @classmethod
-    def sanitize_comments(cls, v: str | None) -> str | None:
-
-        if v is None:
-            return v
-        from app.core.validators import sanitize_text
-        result = sanitize_text(v)
-        return result.sanitized_value if result.is_valid else v
+    sanitize_comments = field_validator("comments")(sanitize_optional_text)
 
 class RequirementResponse(RequirementBase, IDTimestampSchema):
 
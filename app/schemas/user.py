@@ -1,4 +1,6 @@
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from typing import Self
 from uuid import UUID
 
 from pydantic import Field
@@ -35,8 +37,9 @@ class UserResponse(IDTimestampSchema):
     subscription_expires_at: datetime | None = None
     is_blocked: bool
 
-class UserStats(BaseSchema):
-
+@dataclass(slots=True)
+class UserStats:
+    """Per-user counters; built from DB counts, so no validation is needed."""
     
     total_listings: int = 0
     active_listings: int = 0
@@ -46,12 +49,15 @@ class UserStats(BaseSchema):
     active_matches: int = 0
     total_chats: int = 0
 
-class UserProfileResponse(BaseSchema):
-
+@dataclass(slots=True)
+class UserProfileResponse:
     
     user: UserResponse
     stats: UserStats
 
+    def to_dict(self) -> dict:
+        return {"user": self.user.model_dump(), "stats": asdict(self.stats)}
+
 class TelegramAuthRequest(BaseSchema):
 
     
@@ -70,6 +76,16 @@ class TokenResponse(BaseSchema):
         description="Token expiration time in seconds"
     )
 
+    @classmethod
+    def issue(cls, access_token: str, refresh_token: str, expires_in: int) -> Self:
+        """Wrap freshly minted tokens; they come from our own encoder, so skip validation."""
+        return cls.model_construct(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type="bearer",
+            expires_in=expires_in,
+        )
+
 class RefreshTokenRequest(BaseSchema):
 
     
@@ -1,11 +1,11 @@
 """Service for auto marketplace operations."""
 import logging
-import random
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.auto import (
@@ -28,14 +28,14 @@ from app.repositories.auto import (
 logger = logging.getLogger(__name__)
 
 # Aliases for anonymous chat
-BUYER_ALIASES = [
+BUYER_ALIASES = (
     "Покупатель Альфа", "Покупатель Бета", "Покупатель Гамма",
     "Покупатель Дельта", "Покупатель Эпсилон", "Покупатель Зета",
-]
-SELLER_ALIASES = [
+)
+SELLER_ALIASES = (
     "Продавец Один", "Продавец Два", "Продавец Три",
     "Продавец Четыре", "Продавец Пять", "Продавец Шесть",
-]
+)
 
 
 class AutoListingService:
@@ -87,7 +87,6 @@ class AutoListingService:
         )
         self.session.add(listing)
         await self.session.flush()
-        await self.session.refresh(listing)
         logger.info(f"Created auto listing {listing.id} for user {user_id}")
         return listing
 
@@ -107,9 +106,51 @@ class AutoListingService:
         )
         self.session.add(media)
         await self.session.flush()
-        await self.session.refresh(media)
         return media
 
+    async def bulk_add_media(
+        self,
+        listing_id: uuid.UUID,
+        items: Sequence[tuple[str, Optional[str], int]],
+    ) -> int:
+        """
+        Add a gallery of (url, thumbnail_url, order) media rows to a listing.
+        
+        On asyncpg the rows are streamed with COPY in one round-trip; other
+        drivers get a single batched INSERT. Rows are not added to the
+        session's identity map.
+        """
+        if not items:
+            return 0
+        
+        # The listing row must be visible to the FK check before COPY runs
+        await self.session.flush()
+        conn = await self.session.connection()
+        if conn.dialect.driver == "asyncpg":
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            assert driver is not None, "asyncpg raw connection has no driver connection"
+            await driver.copy_records_to_table(
+                AutoMedia.__tablename__,
+                records=[
+                    (uuid.uuid4(), listing_id, url, thumbnail_url, order)
+                    for url, thumbnail_url, order in items
+                ],
+                columns=["id", "auto_listing_id", "url", "thumbnail_url", "order"],
+            )
+        else:
+            self.session.add_all([
+                AutoMedia(
+                    auto_listing_id=listing_id,
+                    url=url,
+                    thumbnail_url=thumbnail_url,
+                    order=order,
+                )
+                for url, thumbnail_url, order in items
+            ])
+            await self.session.flush()
+        return len(items)
+
     async def get_listing(self, listing_id: uuid.UUID) -> Optional[AutoListing]:
         """Get listing by ID with media."""
         return await self.repo.get_with_media(listing_id)
@@ -129,17 +170,10 @@ class AutoListingService:
         rejection_reason: Optional[str] = None,
     ) -> Optional[AutoListing]:
         """Update listing status."""
-        listing = await self.repo.get(listing_id)
-        if not listing:
-            return None
-        
-        listing.status = status
+        values: dict[str, Any] = {"status": status}
         if rejection_reason:
-            listing.rejection_reason = rejection_reason
-        
-        await self.session.commit()
-        await self.session.refresh(listing)
-        return listing
+            values["rejection_reason"] = rejection_reason
+        return await self.repo.update_returning(listing_id, **values)
 
 
 class AutoRequirementService:
@@ -182,7 +216,6 @@ class AutoRequirementService:
         )
         self.session.add(requirement)
         await self.session.flush()
-        await self.session.refresh(requirement)
         logger.info(f"Created auto requirement {requirement.id} for user {user_id}")
         return requirement
 
@@ -217,79 +250,12 @@ class AutoMatchService:
         if not requirement:
             return []
         
-        # Find matching listings
-        listings = await self.listing_repo.find_matches_for_requirement(requirement)
-        
-        matches = []
-        for listing in listings:
-            # Skip if match already exists
-            if await self.match_repo.exists(listing.id, requirement_id):
-                continue
-            
-            # Calculate match score
-            score = self._calculate_score(listing, requirement)
-            
-            # Create match
-            match = AutoMatch(
-                auto_listing_id=listing.id,
-                auto_requirement_id=requirement_id,
-                score=score,
-                status="pending",
-            )
-            self.session.add(match)
-            await self.session.flush()
-            await self.session.refresh(match)
-            matches.append(match)
+        # Candidate selection, scoring and insertion happen in one statement
+        matches = await self.match_repo.create_for_requirement(requirement)
         
         logger.info(f"Found {len(matches)} new matches for requirement {requirement_id}")
         return matches
 
-    def _calculate_score(
-        self,
-        listing: AutoListing,
-        requirement: AutoRequirement,
-    ) -> int:
-        """Calculate match score (0-100)."""
-        score = 100
-        
-        # Brand match (exact match = 100%, no match = -20)
-        if requirement.brands:
-            if listing.brand not in requirement.brands:
-                score -= 20
-        
-        # Year match
-        if requirement.year_min and listing.year < requirement.year_min:
-            score -= 10
-        if requirement.year_max and listing.year > requirement.year_max:
-            score -= 10
-        
-        # Price match
-        if requirement.price_min and listing.price < requirement.price_min:
-            score -= 15
-        if requirement.price_max and listing.price > requirement.price_max:
-            score -= 15
-        
-        # Mileage match
-        if requirement.mileage_max and listing.mileage > requirement.mileage_max:
-            score -= 10
-        
-        # Fuel type match
-        if requirement.fuel_types:
-            if listing.fuel_type.value not in requirement.fuel_types:
-                score -= 10
-        
-        # Transmission match
-        if requirement.transmissions:
-            if listing.transmission.value not in requirement.transmissions:
-                score -= 10
-        
-        # Body type match
-        if requirement.body_types:
-            if listing.body_type.value not in requirement.body_types:
-                score -= 10
-        
-        return max(0, score)
-
     async def get_matches_for_browsing(
         self,
         requirement_id: uuid.UUID,
@@ -303,20 +269,13 @@ class AutoMatchService:
 
     async def mark_viewed(self, match_id: uuid.UUID) -> Optional[AutoMatch]:
         """Mark match as viewed."""
-        match = await self.match_repo.get(match_id)
-        if match:
-            match.buyer_viewed = True
-            match.status = "viewed"
-            await self.session.commit()
-        return match
+        return await self.match_repo.update_returning(
+            match_id, buyer_viewed=True, status="viewed"
+        )
 
     async def reject_match(self, match_id: uuid.UUID) -> Optional[AutoMatch]:
         """Reject a match."""
-        match = await self.match_repo.get(match_id)
-        if match:
-            match.status = "rejected"
-            await self.session.commit()
-        return match
+        return await self.match_repo.update_returning(match_id, status="rejected")
 
 
 class AutoChatService:
@@ -339,23 +298,16 @@ class AutoChatService:
         if existing:
             return existing
         
-        chat = AutoChat(
-            auto_match_id=match_id,
+        # Also moves the match to "contacted" in the same statement
+        chat = await self.chat_repo.create_for_match(
+            match_id,
             buyer_id=buyer_id,
             seller_id=seller_id,
-            buyer_alias=random.choice(BUYER_ALIASES),
-            seller_alias=random.choice(SELLER_ALIASES),
+            # Derived from the match so a retried create picks the same aliases
+            buyer_alias=BUYER_ALIASES[match_id.int % len(BUYER_ALIASES)],
+            seller_alias=SELLER_ALIASES[(match_id.int >> 64) % len(SELLER_ALIASES)],
             status="active",
         )
-        self.session.add(chat)
-        await self.session.flush()
-        await self.session.refresh(chat)
-        
-        # Update match status
-        match = await self.match_repo.get(match_id)
-        if match:
-            match.status = "contacted"
-            await self.session.commit()
         
         logger.info(f"Created auto chat {chat.id} for match {match_id}")
         return chat
@@ -402,11 +354,11 @@ class AutoChatService:
         )
         self.session.add(message)
         
-        # Update last message time
-        chat.last_message_at = datetime.utcnow()
+        # Update last message time from the DB clock; the chat isn't returned,
+        # so the expired attribute is never read back
+        chat.last_message_at = func.now()
         
-        await self.session.commit()
-        await self.session.refresh(message)
+        await self.session.flush()
         
         return message
 
@@ -429,10 +381,9 @@ class AutoChatService:
             return None
         
         chat.reveal_requested_by = user_id
-        chat.reveal_requested_at = datetime.utcnow()
+        chat.reveal_requested_at = datetime.now(UTC)
         
-        await self.session.commit()
-        await self.session.refresh(chat)
+        await self.session.flush()
         return chat
 
     async def is_user_in_chat(
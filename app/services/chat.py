@@ -7,11 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.chat import Chat, ChatMessage, ChatStatusEnum, MessageTypeEnum
 from app.repositories.chat import ChatRepository, ChatMessageRepository
 from app.repositories.match import MatchRepository
-from app.repositories.listing import ListingRepository
-from app.repositories.requirement import RequirementRepository
+from app.repositories.user import UserRepository
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RelayedMessage:
     message_id: uuid.UUID
     chat_id: uuid.UUID
@@ -22,7 +21,7 @@ class RelayedMessage:
     media_url: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContactRevealResult:
     success: bool
     both_revealed: bool
@@ -37,8 +36,7 @@ class ChatService:
         self.chat_repository = ChatRepository(session)
         self.message_repository = ChatMessageRepository(session)
         self.match_repository = MatchRepository(session)
-        self.listing_repository = ListingRepository(session)
-        self.requirement_repository = RequirementRepository(session)
+        self.user_repository = UserRepository(session)
 
     async def create_chat_from_match(
         self,
@@ -92,16 +90,16 @@ class ChatService:
         message_type: MessageTypeEnum = MessageTypeEnum.TEXT,
         media_url: Optional[str] = None,
     ) -> Optional[RelayedMessage]:
-        chat = await self.chat_repository.get(chat_id)
+        chat = await self.chat_repository.get_with_match_context(chat_id)
         if chat is None or chat.status != ChatStatusEnum.ACTIVE:
             return None
 
-        match = await self.match_repository.get(chat.match_id)
+        match = chat.match
         if match is None:
             return None
 
-        listing = await self.listing_repository.get(match.listing_id)
-        requirement = await self.requirement_repository.get(match.requirement_id)
+        listing = match.listing
+        requirement = match.requirement
 
         if listing is None or requirement is None:
             return None
@@ -140,7 +138,7 @@ class ChatService:
         chat_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> ContactRevealResult:
-        chat = await self.chat_repository.get(chat_id)
+        chat = await self.chat_repository.get_with_match_context(chat_id)
         if chat is None:
             return ContactRevealResult(
                 success=False,
@@ -148,7 +146,7 @@ class ChatService:
                 message="Chat not found",
             )
 
-        match = await self.match_repository.get(chat.match_id)
+        match = chat.match
         if match is None:
             return ContactRevealResult(
                 success=False,
@@ -156,8 +154,8 @@ class ChatService:
                 message="Match not found",
             )
 
-        listing = await self.listing_repository.get(match.listing_id)
-        requirement = await self.requirement_repository.get(match.requirement_id)
+        listing = match.listing
+        requirement = match.requirement
 
         if listing is None or requirement is None:
             return ContactRevealResult(
@@ -177,12 +175,9 @@ class ChatService:
                 message="User is not part of this chat",
             )
 
-        await self.chat_repository.update_reveal_flag(
+        chat = await self.chat_repository.update_reveal_flag(
             chat_id, is_buyer=is_buyer, revealed=True
         )
-        await self.session.commit()
-
-        chat = await self.chat_repository.get(chat_id)
         if chat is None:
             return ContactRevealResult(
                 success=False,
@@ -193,11 +188,11 @@ class ChatService:
         both_revealed = chat.buyer_revealed and chat.seller_revealed
 
         if both_revealed:
-            from app.repositories.user import UserRepository
-            user_repo = UserRepository(self.session)
-
-            buyer_user = await user_repo.get(requirement.user_id)
-            seller_user = await user_repo.get(listing.user_id)
+            users = await self.user_repository.get_many(
+                [requirement.user_id, listing.user_id]
+            )
+            buyer_user = users.get(requirement.user_id)
+            seller_user = users.get(listing.user_id)
 
             buyer_contact = buyer_user.telegram_username if buyer_user else None
             seller_contact = seller_user.telegram_username if seller_user else None
@@ -216,6 +211,8 @@ class ChatService:
                 message="Contacts revealed",
             )
 
+        await self.session.commit()
+
         return ContactRevealResult(
             success=True,
             both_revealed=False,
@@ -270,16 +267,16 @@ class ChatService:
         chat_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> bool:
-        chat = await self.chat_repository.get(chat_id)
+        chat = await self.chat_repository.get_with_match_context(chat_id)
         if chat is None:
             return False
 
-        match = await self.match_repository.get(chat.match_id)
+        match = chat.match
         if match is None:
             return False
 
-        listing = await self.listing_repository.get(match.listing_id)
-        requirement = await self.requirement_repository.get(match.requirement_id)
+        listing = match.listing
+        requirement = match.requirement
 
         if listing is None or requirement is None:
             return False
@@ -1,7 +1,8 @@
 import uuid
 from decimal import Decimal
-from typing import Any, Optional, Sequence
+from typing import Any, Optional, Sequence, cast
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.listing import Listing, ListingStatusEnum
@@ -28,6 +29,20 @@ class ListingValidationError(Exception):
         super().__init__(f"{field}: {message}")
 
 
+# Optional fields validated the same way on create and update:
+# (field, validator, fallback error message)
+_OPTIONAL_FIELD_VALIDATORS = (
+    ("rooms", validate_rooms, "Invalid rooms"),
+    ("floor", validate_floor, "Invalid floor"),
+    ("building_floors", validate_building_floors, "Invalid building floors"),
+)
+
+
+def _point_wkt(latitude: float, longitude: float) -> str:
+    # WKT takes (x, y), i.e. longitude first
+    return f"POINT({longitude} {latitude})"
+
+
 class ListingService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -53,26 +68,13 @@ class ListingService:
         if not area_result.is_valid:
             raise ListingValidationError("area", area_result.error_message or "Invalid area")
 
-        rooms = kwargs.get("rooms")
-        if rooms is not None:
-            rooms_result = validate_rooms(rooms)
-            if not rooms_result.is_valid:
-                raise ListingValidationError("rooms", rooms_result.error_message or "Invalid rooms")
-            kwargs["rooms"] = rooms_result.sanitized_value
-
-        floor = kwargs.get("floor")
-        if floor is not None:
-            floor_result = validate_floor(floor)
-            if not floor_result.is_valid:
-                raise ListingValidationError("floor", floor_result.error_message or "Invalid floor")
-            kwargs["floor"] = floor_result.sanitized_value
-
-        building_floors = kwargs.get("building_floors")
-        if building_floors is not None:
-            bf_result = validate_building_floors(building_floors)
-            if not bf_result.is_valid:
-                raise ListingValidationError("building_floors", bf_result.error_message or "Invalid building floors")
-            kwargs["building_floors"] = bf_result.sanitized_value
+        for field, validator, default_error in _OPTIONAL_FIELD_VALIDATORS:
+            value = kwargs.get(field)
+            if value is not None:
+                result = validator(value)
+                if not result.is_valid:
+                    raise ListingValidationError(field, result.error_message or default_error)
+                kwargs[field] = result.sanitized_value
 
         latitude = kwargs.pop("latitude", None)
         longitude = kwargs.pop("longitude", None)
@@ -80,7 +82,9 @@ class ListingService:
             coords_result = validate_coordinates(latitude, longitude)
             if not coords_result.is_valid:
                 raise ListingValidationError("coordinates", coords_result.error_message or "Invalid coordinates")
-            kwargs["coordinates"] = f"POINT({longitude} {latitude})"
+            # validate_coordinates returns (lat, lon) on success
+            lat, lon = cast(tuple[float, float], coords_result.sanitized_value)
+            kwargs["coordinates"] = _point_wkt(lat, lon)
 
         description = kwargs.get("description")
         if description is not None:
@@ -121,41 +125,54 @@ class ListingService:
             limit=limit,
         )
 
+    async def get_user_listing_cards(
+        self,
+        user_id: uuid.UUID,
+        *,
+        include_deleted: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[Row]:
+        return await self.repository.get_cards_by_user(
+            user_id,
+            include_deleted=include_deleted,
+            skip=skip,
+            limit=limit,
+        )
+
     async def update_listing(
         self,
         listing_id: uuid.UUID,
+        *,
+        current: Optional[Listing] = None,
         **kwargs: Any,
     ) -> tuple[Optional[Listing], bool]:
-        if "price" in kwargs:
+        is_land_plot = kwargs.pop("is_land_plot", False)
+
+        # Values equal to those stored on ``current`` (the listing as loaded by
+        # the caller) were validated when first saved; don't validate them again.
+        def changed(field: str) -> bool:
+            return current is None or kwargs[field] != getattr(current, field)
+
+        if "price" in kwargs and changed("price"):
             price_result = validate_price(kwargs["price"])
             if not price_result.is_valid:
                 raise ListingValidationError("price", price_result.error_message or "Invalid price")
             kwargs["price"] = price_result.sanitized_value
 
-        if "area" in kwargs:
-            is_land_plot = kwargs.pop("is_land_plot", False)
+        if "area" in kwargs and changed("area"):
             area_result = validate_area(kwargs["area"], is_land_plot=is_land_plot)
             if not area_result.is_valid:
                 raise ListingValidationError("area", area_result.error_message or "Invalid area")
             kwargs["area"] = area_result.sanitized_value
 
-        if "rooms" in kwargs and kwargs["rooms"] is not None:
-            rooms_result = validate_rooms(kwargs["rooms"])
-            if not rooms_result.is_valid:
-                raise ListingValidationError("rooms", rooms_result.error_message or "Invalid rooms")
-            kwargs["rooms"] = rooms_result.sanitized_value
-
-        if "floor" in kwargs and kwargs["floor"] is not None:
-            floor_result = validate_floor(kwargs["floor"])
-            if not floor_result.is_valid:
-                raise ListingValidationError("floor", floor_result.error_message or "Invalid floor")
-            kwargs["floor"] = floor_result.sanitized_value
-
-        if "building_floors" in kwargs and kwargs["building_floors"] is not None:
-            bf_result = validate_building_floors(kwargs["building_floors"])
-            if not bf_result.is_valid:
-                raise ListingValidationError("building_floors", bf_result.error_message or "Invalid building floors")
-            kwargs["building_floors"] = bf_result.sanitized_value
+        for field, validator, default_error in _OPTIONAL_FIELD_VALIDATORS:
+            value = kwargs.get(field)
+            if value is not None and changed(field):
+                result = validator(value)
+                if not result.is_valid:
+                    raise ListingValidationError(field, result.error_message or default_error)
+                kwargs[field] = result.sanitized_value
 
         latitude = kwargs.pop("latitude", None)
         longitude = kwargs.pop("longitude", None)
@@ -163,9 +180,11 @@ class ListingService:
             coords_result = validate_coordinates(latitude, longitude)
             if not coords_result.is_valid:
                 raise ListingValidationError("coordinates", coords_result.error_message or "Invalid coordinates")
-            kwargs["coordinates"] = f"POINT({longitude} {latitude})"
+            # validate_coordinates returns (lat, lon) on success
+            lat, lon = cast(tuple[float, float], coords_result.sanitized_value)
+            kwargs["coordinates"] = _point_wkt(lat, lon)
 
-        if "description" in kwargs and kwargs["description"] is not None:
+        if "description" in kwargs and kwargs["description"] is not None and changed("description"):
             desc_result = sanitize_text(kwargs["description"])
             kwargs["description"] = desc_result.sanitized_value
 
@@ -245,7 +264,7 @@ class ListingService:
         *,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[Listing]:
+    ) -> Sequence[Row]:
         return await self.repository.get_pending_moderation(skip=skip, limit=limit)
 
     async def upgrade_to_vip(
@@ -1,8 +1,9 @@
 import uuid
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Optional, Sequence
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.match import Match, MatchStatusEnum
 from app.models.listing import Listing, ListingStatusEnum
@@ -10,11 +11,11 @@ from app.models.requirement import Requirement, RequirementStatusEnum
 from app.repositories.match import MatchRepository
 from app.repositories.listing import ListingRepository
 from app.repositories.requirement import RequirementRepository
-from app.services.matching.engine import AutoMatchEngine
+from app.services.matching.engine import get_match_engine
 from app.services.matching.scorer import ListingData, RequirementData
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchNotification:
     match_id: uuid.UUID
     listing_id: uuid.UUID
@@ -25,12 +26,16 @@ class MatchNotification:
 
 
 class MatchService:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ):
         self.session = session
-        self.match_repository = MatchRepository(session)
+        self.match_repository = MatchRepository(session, session_factory=session_factory)
         self.listing_repository = ListingRepository(session)
         self.requirement_repository = RequirementRepository(session)
-        self.match_engine = AutoMatchEngine()
+        self.match_engine = get_match_engine()
 
     async def process_new_listing(
         self,
@@ -40,52 +45,39 @@ class MatchService:
         if listing is None or listing.status != ListingStatusEnum.ACTIVE:
             return []
 
-        requirements = await self.requirement_repository.get_active_requirements(
+        listing_data = ListingData.from_model(listing)
+
+        # (listing_id, requirement_id) -> (result, buyer_user_id)
+        pending = {}
+        async for requirements in self.requirement_repository.stream_match_candidates(
             category_id=listing.category_id,
+            location_id=listing.location_id,
+            price=listing.price,
+            area=listing.area,
             limit=10000,
-        )
+        ):
+            buyer_by_requirement = {req.id: req.user_id for req in requirements}
+            match_results = self.match_engine.find_matches_for_listing(
+                listing=listing_data,
+                requirements=[
+                    RequirementData.from_model(req, location_ids=req.location_ids or [])
+                    for req in requirements
+                ],
+            )
+            for result in match_results:
+                pending[(result.listing_id, result.requirement_id)] = (
+                    result, buyer_by_requirement[result.requirement_id]
+                )
 
-        if not requirements:
+        if not pending:
             return []
 
-        listing_data = ListingData.from_model(listing)
-        requirement_data_list = [
-            RequirementData.from_model(req) for req in requirements
-        ]
-
-        match_results = self.match_engine.find_matches_for_listing(
-            listing=listing_data,
-            requirements=requirement_data_list,
+        notifications = self._notifications(
+            await self.match_repository.create_matches(self._ranked_rows(pending)),
+            pending,
+            seller_user_id=listing.user_id,
         )
 
-        notifications = []
-        for result in match_results:
-            if not result.is_valid:
-                continue
-
-            req = next(
-                (r for r in requirements if r.id == result.requirement_id),
-                None
-            )
-            if req is None:
-                continue
-
-            match = await self.match_repository.create_match(
-                listing_id=result.listing_id,
-                requirement_id=result.requirement_id,
-                score=result.score,
-            )
-
-            if match:
-                notifications.append(MatchNotification(
-                    match_id=match.id,
-                    listing_id=result.listing_id,
-                    requirement_id=result.requirement_id,
-                    buyer_user_id=req.user_id,
-                    seller_user_id=listing.user_id,
-                    score=result.score,
-                ))
-
         if notifications:
             await self.session.commit()
 
@@ -99,57 +91,77 @@ class MatchService:
         if requirement is None or requirement.status != RequirementStatusEnum.ACTIVE:
             return []
 
-        listings = await self.listing_repository.get_active_listings(
+        requirement_data = RequirementData.from_model(requirement)
+
+        # (listing_id, requirement_id) -> (result, seller_user_id)
+        pending = {}
+        async for listings in self.listing_repository.stream_match_candidates(
             category_id=requirement.category_id,
+            location_ids=[loc.location_id for loc in requirement.locations],
+            price_min=requirement.price_min,
+            price_max=requirement.price_max,
+            area_min=requirement.area_min,
+            area_max=requirement.area_max,
             limit=10000,
-        )
+        ):
+            seller_by_listing = {lst.id: lst.user_id for lst in listings}
+            match_results = self.match_engine.find_matches_for_requirement(
+                requirement=requirement_data,
+                listings=[ListingData.from_model(lst) for lst in listings],
+            )
+            for result in match_results:
+                pending[(result.listing_id, result.requirement_id)] = (
+                    result, seller_by_listing[result.listing_id]
+                )
 
-        if not listings:
+        if not pending:
             return []
 
-        requirement_data = RequirementData.from_model(requirement)
-        listing_data_list = [
-            ListingData.from_model(lst) for lst in listings
-        ]
-
-        match_results = self.match_engine.find_matches_for_requirement(
-            requirement=requirement_data,
-            listings=listing_data_list,
+        notifications = self._notifications(
+            await self.match_repository.create_matches(self._ranked_rows(pending)),
+            pending,
+            buyer_user_id=requirement.user_id,
         )
 
-        notifications = []
-        for result in match_results:
-            if not result.is_valid:
-                continue
-
-            lst = next(
-                (l for l in listings if l.id == result.listing_id),
-                None
-            )
-            if lst is None:
-                continue
-
-            match = await self.match_repository.create_match(
-                listing_id=result.listing_id,
-                requirement_id=result.requirement_id,
-                score=result.score,
-            )
-
-            if match:
-                notifications.append(MatchNotification(
-                    match_id=match.id,
-                    listing_id=result.listing_id,
-                    requirement_id=result.requirement_id,
-                    buyer_user_id=requirement.user_id,
-                    seller_user_id=lst.user_id,
-                    score=result.score,
-                ))
-
         if notifications:
             await self.session.commit()
 
         return notifications
 
+    @staticmethod
+    def _ranked_rows(pending: dict) -> list[tuple[uuid.UUID, uuid.UUID, int]]:
+        """``create_matches`` rows, best score first across all scored chunks."""
+        results = sorted((result for result, _ in pending.values()), key=attrgetter("score"), reverse=True)
+        return [(r.listing_id, r.requirement_id, r.score) for r in results]
+
+    @staticmethod
+    def _notifications(
+        created: Sequence,
+        pending: dict,
+        *,
+        buyer_user_id: Optional[uuid.UUID] = None,
+        seller_user_id: Optional[uuid.UUID] = None,
+    ) -> list[MatchNotification]:
+        """
+        Build notifications for newly inserted matches.
+        
+        ``pending`` maps each (listing_id, requirement_id) pair to its match
+        result and the user on the side that varies; the fixed side's user
+        is passed as ``buyer_user_id`` or ``seller_user_id``.
+        """
+        notifications = []
+        for row in created:
+            result, other_user_id = pending[(row.listing_id, row.requirement_id)]
+            notifications.append(MatchNotification(
+                match_id=row.id,
+                listing_id=row.listing_id,
+                requirement_id=row.requirement_id,
+                buyer_user_id=buyer_user_id or other_user_id,
+                seller_user_id=seller_user_id or other_user_id,
+                score=result.score,
+            ))
+        return notifications
+
     async def get_match(self, match_id: uuid.UUID) -> Optional[Match]:
         return await self.match_repository.get(match_id)
 
@@ -168,6 +180,14 @@ class MatchService:
             limit=limit,
         )
 
+    async def count_matches_for_user(
+        self,
+        user_id: uuid.UUID,
+        *,
+        status: Optional[MatchStatusEnum] = None,
+    ) -> int:
+        return await self.match_repository.count_matches_for_user(user_id, status=status)
+
     async def get_matches_for_buyer(
         self,
         user_id: uuid.UUID,
@@ -203,19 +223,13 @@ class MatchService:
         match_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> Optional[Match]:
-        match = await self.match_repository.get(match_id)
-        if match is None:
-            return None
-
-        listing = await self.listing_repository.get(match.listing_id)
-        requirement = await self.requirement_repository.get(match.requirement_id)
-
-        if listing is None or requirement is None:
+        parties = await self.match_repository.get_party_user_ids(match_id)
+        if parties is None:
             return None
 
-        if user_id == requirement.user_id:
+        if user_id == parties.buyer_user_id:
             match = await self.match_repository.reject_by_buyer(match_id)
-        elif user_id == listing.user_id:
+        elif user_id == parties.seller_user_id:
             match = await self.match_repository.reject_by_seller(match_id)
         else:
             return None
@@ -1,8 +1,9 @@
 from app.services.matching.scorer import MatchScorer, MatchWeights
-from app.services.matching.engine import AutoMatchEngine
+from app.services.matching.engine import AutoMatchEngine, get_match_engine
 from app.services.matching.duplicate import (
     DuplicateDetector,
     DuplicateCheckResult,
+    ListingArray,
     ListingForDuplicateCheck,
 )
 from app.services.matching.image_hash import (
@@ -15,8 +16,10 @@ __all__ = [
     "MatchScorer",
     "MatchWeights",
     "AutoMatchEngine",
+    "get_match_engine",
     "DuplicateDetector",
     "DuplicateCheckResult",
+    "ListingArray",
     "ListingForDuplicateCheck",
     "ImageHasher",
     "compute_content_hash",
@@ -0,0 +1,22 @@
+"""Optional numba support for the matching kernels.
+
+Without numba, ``njit`` leaves functions as plain Python and ``prange`` is
+``range``, so every kernel still runs (slowly) and callers can branch on
+``NUMBA_AVAILABLE`` to prefer their NumPy paths.
+"""
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*_args: Any, **_kwargs: Any) -> Callable[[_F], _F]:
+        return lambda func: func
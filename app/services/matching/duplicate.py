@@ -1,9 +1,17 @@
-from dataclasses import dataclass
-from decimal import Decimal
-from typing import Optional, Sequence
 import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+
+from app.services.matching._numba import NUMBA_AVAILABLE, njit, prange
+from app.services.matching.image_hash import any_within_hamming, pack_hex_hashes
+from app.services.matching.scorer import rank_by_score
 
-@dataclass
+
+@dataclass(slots=True)
 class DuplicateCheckResult:
 
     
@@ -17,7 +25,7 @@ class DuplicateCheckResult:
     rooms_match: bool
     image_hash_match: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ListingForDuplicateCheck:
 
     
@@ -28,6 +36,12 @@ class ListingForDuplicateCheck:
     rooms: Optional[int]
     description: Optional[str] = None
     image_hashes: Optional[list[str]] = None
+    _image_hash_set: Optional[frozenset[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _packed_image_hashes: Optional[dict[int, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     @classmethod
     def from_model(cls, listing) -> "ListingForDuplicateCheck":
@@ -41,6 +55,102 @@ class ListingForDuplicateCheck:
             description=listing.description,
             image_hashes=None,
         )
+    
+    @property
+    def image_hash_set(self) -> frozenset[str]:
+        """``image_hashes`` as a set, built once for exact-match checks."""
+        if self._image_hash_set is None:
+            self._image_hash_set = frozenset(self.image_hashes or ())
+        return self._image_hash_set
+    
+    @property
+    def packed_image_hashes(self) -> dict[int, np.ndarray]:
+        """``image_hashes`` packed once into uint64 words, grouped by length."""
+        if self._packed_image_hashes is None:
+            self._packed_image_hashes = pack_hex_hashes(self.image_hashes)
+        return self._packed_image_hashes
+
+# Stands in for ``rooms=None`` in the int64 rooms column, so "both unknown"
+# and "same count" are one equality test.
+_NO_ROOMS = np.iinfo(np.int64).min
+
+def _rooms_code(rooms: Optional[int]) -> int:
+    return _NO_ROOMS if rooms is None else rooms
+
+def _uuid_words(values: Sequence[uuid.UUID]) -> np.ndarray:
+    """(n, 2) uint64 array holding the high and low halves of each UUID."""
+    return np.array(
+        [divmod(v.int, 1 << 64) for v in values], dtype=np.uint64
+    ).reshape(-1, 2)
+
+@dataclass(frozen=True)
+class ListingArray:
+    """Structure-of-arrays view of listings for vectorized duplicate checks."""
+    
+    rows: Sequence[ListingForDuplicateCheck]
+    ids: np.ndarray
+    location_ids: np.ndarray
+    price: np.ndarray
+    area: np.ndarray
+    rooms: np.ndarray
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[ListingForDuplicateCheck]) -> "ListingArray":
+        
+        return cls(
+            rows=rows,
+            ids=_uuid_words([r.id for r in rows]),
+            location_ids=_uuid_words([r.location_id for r in rows]),
+            price=np.array([float(r.price) for r in rows], dtype=np.float64),
+            area=np.array([float(r.area) for r in rows], dtype=np.float64),
+            rooms=np.array([_rooms_code(r.rooms) for r in rows], dtype=np.int64),
+        )
+
+def _within_tolerance(value1: float, value2: float, tolerance: float) -> bool:
+    """
+    Whether two positive values differ by at most ``tolerance`` percent of
+    their average, i.e. ``|a - b| / ((a + b) / 2) * 100 <= tolerance``
+    rearranged to avoid the division.
+    """
+    return value1 > 0 and value2 > 0 and abs(value1 - value2) * 200 <= tolerance * (value1 + value2)
+
+@njit(parallel=True, cache=True)
+def _criteria_kernel(
+    location_ids: np.ndarray,
+    price: np.ndarray,
+    area: np.ndarray,
+    rooms: np.ndarray,
+    new_location_id: np.ndarray,
+    new_price: float,
+    new_area: float,
+    new_rooms: int,
+    price_tolerance: float,
+    area_tolerance: float,
+) -> tuple[np.ndarray, ...]:
+    """Single-pass equivalent of the NumPy criteria masks, compiled when numba is installed."""
+    n = price.shape[0]
+    location_match = np.empty(n, dtype=np.bool_)
+    price_match = np.empty(n, dtype=np.bool_)
+    area_match = np.empty(n, dtype=np.bool_)
+    rooms_match = np.empty(n, dtype=np.bool_)
+    
+    for i in prange(n):
+        location_match[i] = (
+            location_ids[i, 0] == new_location_id[0] and location_ids[i, 1] == new_location_id[1]
+        )
+        price_match[i] = (
+            price[i] > 0
+            and new_price > 0
+            and abs(price[i] - new_price) * 200 <= price_tolerance * (price[i] + new_price)
+        )
+        area_match[i] = (
+            area[i] > 0
+            and new_area > 0
+            and abs(area[i] - new_area) * 200 <= area_tolerance * (area[i] + new_area)
+        )
+        rooms_match[i] = rooms[i] == new_rooms
+    
+    return location_match, price_match, area_match, rooms_match
 
 class DuplicateDetector:
 
@@ -56,6 +166,8 @@ class DuplicateDetector:
     ROOMS_WEIGHT = 15
     IMAGE_WEIGHT = 10
     
+    IMAGE_HAMMING_THRESHOLD = 10
+    
     def __init__(
         self,
         price_tolerance: float = PRICE_TOLERANCE_PERCENT,
@@ -74,8 +186,8 @@ class DuplicateDetector:
         self.area_tolerance = area_tolerance
         self.duplicate_threshold = duplicate_threshold
     
+    @staticmethod
     def check_location_match(
-        self,
         listing1_location_id: uuid.UUID,
         listing2_location_id: uuid.UUID,
     ) -> bool:
@@ -116,14 +228,7 @@ class DuplicateDetector:
         """
         tolerance = tolerance_percent if tolerance_percent is not None else self.price_tolerance
         
-        if price1 <= 0 or price2 <= 0:
-            return False
-        
-        avg_price = (price1 + price2) / 2
-        diff = abs(price1 - price2)
-        diff_percent = (diff / avg_price) * 100
-        
-        return float(diff_percent) <= tolerance
+        return _within_tolerance(float(price1), float(price2), tolerance)
     
     def check_area_within_tolerance(
         self,
@@ -148,17 +253,10 @@ class DuplicateDetector:
         """
         tolerance = tolerance_percent if tolerance_percent is not None else self.area_tolerance
         
-        if area1 <= 0 or area2 <= 0:
-            return False
-        
-        avg_area = (area1 + area2) / 2
-        diff = abs(area1 - area2)
-        diff_percent = (diff / avg_area) * 100
-        
-        return float(diff_percent) <= tolerance
+        return _within_tolerance(float(area1), float(area2), tolerance)
     
+    @staticmethod
     def check_rooms_match(
-        self,
         rooms1: Optional[int],
         rooms2: Optional[int],
     ) -> bool:
@@ -174,25 +272,20 @@ class DuplicateDetector:
             
         Requirements: 12.2
         """
-        if rooms1 is None and rooms2 is None:
-            return True
-        
-        if rooms1 is None or rooms2 is None:
-            return False
-        
         return rooms1 == rooms2
     
     def check_image_hash_match(
         self,
         hashes1: Optional[list[str]],
         hashes2: Optional[list[str]],
-        hamming_threshold: int = 10,
+        hamming_threshold: int = IMAGE_HAMMING_THRESHOLD,
     ) -> bool:
         """
         Check if any images match between two listings using perceptual hashes.
         
         Uses hamming distance comparison for pHash values. Two images are
-        considered matching if their hamming distance is <= threshold.
+        considered matching if their hamming distance is <= threshold; the
+        hashes are packed into uint64 words and compared with a popcount.
         
         Args:
             hashes1: List of pHash values for first listing's images
@@ -207,21 +300,30 @@ class DuplicateDetector:
         if not hashes1 or not hashes2:
             return False
         
-        set1 = set(hashes1)
-        set2 = set(hashes2)
-        if set1 & set2:
+        if set(hashes1) & set(hashes2):
             return True
         
-        try:
-            from app.services.matching.image_hash import ImageHasher, is_imagehash_available
-            
-            if is_imagehash_available():
-                hasher = ImageHasher(similarity_threshold=hamming_threshold)
-                return hasher.has_any_match(hashes1, hashes2, threshold=hamming_threshold)
-        except ImportError:
-            pass
+        return any_within_hamming(
+            pack_hex_hashes(hashes1), pack_hex_hashes(hashes2), hamming_threshold
+        )
+    
+    def _listing_images_match(
+        self,
+        listing1: ListingForDuplicateCheck,
+        listing2: ListingForDuplicateCheck,
+    ) -> bool:
+        """``check_image_hash_match`` reusing each listing's packed hashes."""
+        if not listing1.image_hashes or not listing2.image_hashes:
+            return False
+        
+        if not listing1.image_hash_set.isdisjoint(listing2.image_hash_set):
+            return True
         
-        return False
+        return any_within_hamming(
+            listing1.packed_image_hashes,
+            listing2.packed_image_hashes,
+            self.IMAGE_HAMMING_THRESHOLD,
+        )
     
     def calculate_similarity_score(
         self,
@@ -247,24 +349,38 @@ class DuplicateDetector:
             
         Requirements: 12.1, 12.2
         """
-        score = 0
-        
-        if self.check_location_match(listing1.location_id, listing2.location_id):
-            score += self.LOCATION_WEIGHT
-        
-        if self.check_price_within_tolerance(listing1.price, listing2.price):
-            score += self.PRICE_WEIGHT
-        
-        if self.check_area_within_tolerance(listing1.area, listing2.area):
-            score += self.AREA_WEIGHT
-        
-        if self.check_rooms_match(listing1.rooms, listing2.rooms):
-            score += self.ROOMS_WEIGHT
-        
-        if self.check_image_hash_match(listing1.image_hashes, listing2.image_hashes):
-            score += self.IMAGE_WEIGHT
-        
-        return min(score, 100)
+        return self._weighted_score(*self._pair_criteria(listing1, listing2))
+    
+    def _pair_criteria(
+        self,
+        listing1: ListingForDuplicateCheck,
+        listing2: ListingForDuplicateCheck,
+    ) -> tuple[bool, bool, bool, bool, bool]:
+        """Location, price, area, rooms and image matches of one pair."""
+        return (
+            listing1.location_id == listing2.location_id,
+            _within_tolerance(float(listing1.price), float(listing2.price), self.price_tolerance),
+            _within_tolerance(float(listing1.area), float(listing2.area), self.area_tolerance),
+            listing1.rooms == listing2.rooms,
+            self._listing_images_match(listing1, listing2),
+        )
+    
+    def _weighted_score(
+        self,
+        location_match: bool,
+        price_match: bool,
+        area_match: bool,
+        rooms_match: bool,
+        image_match: bool,
+    ) -> int:
+        return min(
+            self.LOCATION_WEIGHT * location_match
+            + self.PRICE_WEIGHT * price_match
+            + self.AREA_WEIGHT * area_match
+            + self.ROOMS_WEIGHT * rooms_match
+            + self.IMAGE_WEIGHT * image_match,
+            100,
+        )
     
     def is_potential_duplicate(self, similarity_score: int) -> bool:
 
@@ -287,23 +403,15 @@ class DuplicateDetector:
             
         Requirements: 12.1, 12.2
         """
-        location_match = self.check_location_match(
-            new_listing.location_id, existing_listing.location_id
-        )
-        price_within_tolerance = self.check_price_within_tolerance(
-            new_listing.price, existing_listing.price
-        )
-        area_within_tolerance = self.check_area_within_tolerance(
-            new_listing.area, existing_listing.area
-        )
-        rooms_match = self.check_rooms_match(
-            new_listing.rooms, existing_listing.rooms
-        )
-        image_hash_match = self.check_image_hash_match(
-            new_listing.image_hashes, existing_listing.image_hashes
-        )
-        
-        similarity_score = self.calculate_similarity_score(new_listing, existing_listing)
+        criteria = self._pair_criteria(new_listing, existing_listing)
+        (
+            location_match,
+            price_within_tolerance,
+            area_within_tolerance,
+            rooms_match,
+            image_hash_match,
+        ) = criteria
+        similarity_score = self._weighted_score(*criteria)
         
         return DuplicateCheckResult(
             listing_id=new_listing.id,
@@ -321,6 +429,7 @@ class DuplicateDetector:
         self,
         new_listing: ListingForDuplicateCheck,
         existing_listings: Sequence[ListingForDuplicateCheck],
+        top_k: Optional[int] = None,
     ) -> list[DuplicateCheckResult]:
         """
         Find all potential duplicates for a new listing.
@@ -331,6 +440,7 @@ class DuplicateDetector:
         Args:
             new_listing: The new listing to check
             existing_listings: List of existing listings to compare against
+            top_k: Optional cap on the number of (best) results returned
             
         Returns:
             List of DuplicateCheckResult for potential duplicates,
@@ -338,26 +448,19 @@ class DuplicateDetector:
             
         Requirements: 12.1, 12.4
         """
-        duplicates: list[DuplicateCheckResult] = []
-        
-        for existing in existing_listings:
-            if existing.id == new_listing.id:
-                continue
-            
-            result = self.check_duplicate(new_listing, existing)
-            
-            if result.is_potential_duplicate:
-                duplicates.append(result)
-        
-        duplicates.sort(key=lambda r: r.similarity_score, reverse=True)
-        
-        return duplicates
+        candidates = self._location_candidates(
+            new_listing, existing_listings, self.duplicate_threshold
+        )
+        return self.find_duplicates_vectorized(
+            new_listing, ListingArray.from_rows(candidates), top_k=top_k
+        )
     
     def find_all_similar(
         self,
         new_listing: ListingForDuplicateCheck,
         existing_listings: Sequence[ListingForDuplicateCheck],
         min_score: int = 0,
+        top_k: Optional[int] = None,
     ) -> list[DuplicateCheckResult]:
         """
         Find all similar listings above a minimum score threshold.
@@ -368,22 +471,130 @@ class DuplicateDetector:
             new_listing: The listing to check
             existing_listings: List of existing listings to compare against
             min_score: Minimum similarity score to include (default 0)
+            top_k: Optional cap on the number of (best) results returned
             
         Returns:
             List of DuplicateCheckResult for similar listings,
             sorted by similarity score descending
         """
-        similar: list[DuplicateCheckResult] = []
+        candidates = self._location_candidates(new_listing, existing_listings, min_score)
+        return self.find_duplicates_vectorized(
+            new_listing,
+            ListingArray.from_rows(candidates),
+            min_score=min_score,
+            top_k=top_k,
+        )
+    
+    def _location_candidates(
+        self,
+        new_listing: ListingForDuplicateCheck,
+        existing_listings: Sequence[ListingForDuplicateCheck],
+        min_score: int,
+    ) -> Sequence[ListingForDuplicateCheck]:
+        """
+        Drop listings in other locations when they cannot reach ``min_score``.
         
-        for existing in existing_listings:
-            if existing.id == new_listing.id:
-                continue
-            
-            result = self.check_duplicate(new_listing, existing)
-            
-            if result.similarity_score >= min_score:
-                similar.append(result)
+        Without the location weight a pair scores at most 70, so above that
+        only same-location listings need to be converted and scored.
+        """
+        if min_score <= 100 - self.LOCATION_WEIGHT:
+            return existing_listings
+        return [
+            listing for listing in existing_listings
+            if listing.location_id == new_listing.location_id
+        ]
+    
+    def find_duplicates_vectorized(
+        self,
+        new_listing: ListingForDuplicateCheck,
+        listings: ListingArray,
+        min_score: Optional[int] = None,
+        top_k: Optional[int] = None,
+    ) -> list[DuplicateCheckResult]:
+        """
+        Score ``new_listing`` against a whole batch of listings at once.
+        
+        Gives the same results as calling ``check_duplicate`` per listing;
+        only rows scoring at least ``min_score`` (the duplicate threshold by
+        default) are turned into results, sorted by score descending and
+        cut to the best ``top_k`` when given.
+        """
+        if min_score is None:
+            min_score = self.duplicate_threshold
         
-        similar.sort(key=lambda r: r.similarity_score, reverse=True)
+        location_match, price_match, area_match, rooms_match = self._criteria_masks(
+            new_listing, listings
+        )
+        not_self = ~(listings.ids == _uuid_words([new_listing.id])).all(axis=1)
         
-        return similar
+        scores = (
+            self.LOCATION_WEIGHT * location_match
+            + self.PRICE_WEIGHT * price_match
+            + self.AREA_WEIGHT * area_match
+            + self.ROOMS_WEIGHT * rooms_match
+        )
+        # Image hashes are by far the costliest check, so only compare them
+        # for pairs that can still reach min_score with the image bonus.
+        image_match = np.zeros(len(listings.rows), dtype=bool)
+        if new_listing.image_hashes:
+            reachable = not_self & (scores + self.IMAGE_WEIGHT >= min_score)
+            for i in np.flatnonzero(reachable).tolist():
+                if listings.rows[i].image_hashes:
+                    image_match[i] = self._listing_images_match(new_listing, listings.rows[i])
+        scores = np.minimum(scores + self.IMAGE_WEIGHT * image_match, 100)
+        
+        survivors = np.flatnonzero(not_self & (scores >= min_score))
+        survivors = rank_by_score(survivors, scores, top_k)
+        
+        return [
+            DuplicateCheckResult(
+                listing_id=new_listing.id,
+                compared_listing_id=listings.rows[i].id,
+                similarity_score=int(scores[i]),
+                is_potential_duplicate=self.is_potential_duplicate(int(scores[i])),
+                location_match=bool(location_match[i]),
+                price_within_tolerance=bool(price_match[i]),
+                area_within_tolerance=bool(area_match[i]),
+                rooms_match=bool(rooms_match[i]),
+                image_hash_match=bool(image_match[i]),
+            )
+            for i in survivors.tolist()
+        ]
+    
+    def _criteria_masks(
+        self,
+        new_listing: ListingForDuplicateCheck,
+        listings: ListingArray,
+    ) -> tuple[np.ndarray, ...]:
+        """Location, price, area and rooms match masks of ``listings`` against ``new_listing``."""
+        new_location_id = _uuid_words([new_listing.location_id])
+        if NUMBA_AVAILABLE:
+            return _criteria_kernel(
+                listings.location_ids,
+                listings.price,
+                listings.area,
+                listings.rooms,
+                new_location_id[0],
+                float(new_listing.price),
+                float(new_listing.area),
+                _rooms_code(new_listing.rooms),
+                float(self.price_tolerance),
+                float(self.area_tolerance),
+            )
+        
+        return (
+            (listings.location_ids == new_location_id).all(axis=1),
+            self._tolerance_mask(listings.price, new_listing.price, self.price_tolerance),
+            self._tolerance_mask(listings.area, new_listing.area, self.area_tolerance),
+            listings.rooms == _rooms_code(new_listing.rooms),
+        )
+    
+    @staticmethod
+    def _tolerance_mask(values: np.ndarray, value: Decimal, tolerance: float) -> np.ndarray:
+        """Vectorized ``_within_tolerance`` against ``value``; same float ops, same results."""
+        target = float(value)
+        return (
+            (values > 0)
+            & (target > 0)
+            & (np.abs(values - target) * 200 <= tolerance * (values + target))
+        )
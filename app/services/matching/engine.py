@@ -1,11 +1,22 @@
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Optional, Any, Sequence
 import uuid
 
-from app.services.matching.scorer import MatchScorer, ListingData, RequirementData
+import numpy as np
 
-@dataclass
+from app.services.matching.scorer import (
+    MatchScorer,
+    MatchWeights,
+    ListingBatch,
+    ListingData,
+    RequirementBatch,
+    RequirementData,
+    rank_by_score,
+)
+
+@dataclass(slots=True)
 class MatchResult:
 
     
@@ -14,7 +25,7 @@ class MatchResult:
     score: int
     is_valid: bool
 
-@dataclass
+@dataclass(slots=True)
 class MatchCandidate:
 
     
@@ -24,11 +35,11 @@ class MatchCandidate:
     expires_at: Optional[datetime]
     is_blocked_user: bool = False
     
-    def is_active(self) -> bool:
+    def is_active(self, now: Optional[datetime] = None) -> bool:
 
         if self.status not in ("active",):
             return False
-        if self.expires_at and self.expires_at < datetime.now(timezone.utc):
+        if self.expires_at and self.expires_at < (now or datetime.now(UTC)):
             return False
         return True
 
@@ -47,6 +58,7 @@ class AutoMatchEngine:
         rejected_listing_ids: Optional[set[uuid.UUID]] = None,
         adjacent_locations: Optional[dict[uuid.UUID, list[uuid.UUID]]] = None,
         same_city_locations: Optional[dict[uuid.UUID, list[uuid.UUID]]] = None,
+        top_k: Optional[int] = None,
     ) -> list[MatchResult]:
         """
         Find all matching listings for a buyer requirement.
@@ -61,54 +73,34 @@ class AutoMatchEngine:
             rejected_listing_ids: Set of listing IDs previously rejected by this buyer
             adjacent_locations: Map of location ID to adjacent location IDs
             same_city_locations: Map of location ID to same-city location IDs
+            top_k: Optional cap on the number of (best) matches returned
             
         Returns:
             List of MatchResult objects for valid matches, sorted by score descending
             
         Requirements: 7.1, 7.9
         """
-        rejected_ids = rejected_listing_ids or set()
-        matches: list[MatchResult] = []
+        excluded_ids = self._excluded_ids(rejected_listing_ids, listing_metadata)
+        candidates = [listing for listing in listings if listing.id not in excluded_ids]
+        if not candidates:
+            return []
         
-        for listing in listings:
-            if listing.id in rejected_ids:
-                continue
-            
-            if listing_metadata:
-                metadata = listing_metadata.get(listing.id)
-                if metadata:
-                    if not metadata.is_active():
-                        continue
-                    if metadata.is_blocked_user:
-                        continue
-            
-            adj_locs = None
-            city_locs = None
-            if adjacent_locations:
-                adj_locs = adjacent_locations.get(listing.location_id, [])
-            if same_city_locations:
-                city_locs = same_city_locations.get(listing.location_id, [])
-            
-            score = self.scorer.calculate_total_score(
-                listing=listing,
-                requirement=requirement,
-                adjacent_location_ids=adj_locs,
-                same_city_location_ids=city_locs,
-            )
-            
-            is_valid = self.scorer.is_valid_match(score)
-            
-            matches.append(MatchResult(
-                listing_id=listing.id,
+        scores = self.scorer.calculate_requirement_scores(
+            requirement,
+            ListingBatch.from_rows(candidates),
+            adjacent_locations=adjacent_locations,
+            same_city_locations=same_city_locations,
+        )
+        
+        return [
+            MatchResult(
+                listing_id=candidates[i].id,
                 requirement_id=requirement.id,
                 score=score,
-                is_valid=is_valid,
-            ))
-        
-        valid_matches = [m for m in matches if m.is_valid]
-        valid_matches.sort(key=lambda m: m.score, reverse=True)
-        
-        return valid_matches
+                is_valid=True,
+            )
+            for i, score in self._ranked_valid(scores, top_k)
+        ]
     
     def find_matches_for_listing(
         self,
@@ -118,6 +110,7 @@ class AutoMatchEngine:
         rejected_requirement_ids: Optional[set[uuid.UUID]] = None,
         adjacent_locations: Optional[dict[uuid.UUID, list[uuid.UUID]]] = None,
         same_city_locations: Optional[dict[uuid.UUID, list[uuid.UUID]]] = None,
+        top_k: Optional[int] = None,
     ) -> list[MatchResult]:
         """
         Find all matching requirements for a seller listing.
@@ -132,54 +125,66 @@ class AutoMatchEngine:
             rejected_requirement_ids: Set of requirement IDs that rejected this listing
             adjacent_locations: Map of location ID to adjacent location IDs
             same_city_locations: Map of location ID to same-city location IDs
+            top_k: Optional cap on the number of (best) matches returned
             
         Returns:
             List of MatchResult objects for valid matches, sorted by score descending
             
         Requirements: 7.2, 7.9
         """
-        rejected_ids = rejected_requirement_ids or set()
-        matches: list[MatchResult] = []
+        excluded_ids = self._excluded_ids(rejected_requirement_ids, requirement_metadata)
+        candidates = [requirement for requirement in requirements if requirement.id not in excluded_ids]
+        if not candidates:
+            return []
         
-        for requirement in requirements:
-            if requirement.id in rejected_ids:
-                continue
-            
-            if requirement_metadata:
-                metadata = requirement_metadata.get(requirement.id)
-                if metadata:
-                    if not metadata.is_active():
-                        continue
-                    if metadata.is_blocked_user:
-                        continue
-            
-            adj_locs = None
-            city_locs = None
-            if adjacent_locations:
-                adj_locs = adjacent_locations.get(listing.location_id, [])
-            if same_city_locations:
-                city_locs = same_city_locations.get(listing.location_id, [])
-            
-            score = self.scorer.calculate_total_score(
-                listing=listing,
-                requirement=requirement,
-                adjacent_location_ids=adj_locs,
-                same_city_location_ids=city_locs,
-            )
-            
-            is_valid = self.scorer.is_valid_match(score)
-            
-            matches.append(MatchResult(
-                listing_id=listing.id,
-                requirement_id=requirement.id,
-                score=score,
-                is_valid=is_valid,
-            ))
+        adj_locs = None
+        city_locs = None
+        if adjacent_locations:
+            adj_locs = adjacent_locations.get(listing.location_id, [])
+        if same_city_locations:
+            city_locs = same_city_locations.get(listing.location_id, [])
         
-        valid_matches = [m for m in matches if m.is_valid]
-        valid_matches.sort(key=lambda m: m.score, reverse=True)
+        scores = self.scorer.calculate_listing_scores(
+            listing,
+            RequirementBatch.from_rows(candidates),
+            adjacent_location_ids=adj_locs,
+            same_city_location_ids=city_locs,
+        )
         
-        return valid_matches
+        return [
+            MatchResult(
+                listing_id=listing.id,
+                requirement_id=candidates[i].id,
+                score=score,
+                is_valid=True,
+            )
+            for i, score in self._ranked_valid(scores, top_k)
+        ]
+    
+    def _ranked_valid(self, scores: np.ndarray, top_k: Optional[int] = None) -> list[tuple[int, int]]:
+        """(index, score) of scores at or above the threshold, best first; ties keep input order."""
+        valid = np.flatnonzero(scores >= self.scorer.MATCH_THRESHOLD)
+        ranked = rank_by_score(valid, scores, top_k)
+        return list(zip(ranked.tolist(), scores[ranked].tolist(), strict=True))
+    
+    @staticmethod
+    def _excluded_ids(
+        rejected_ids: Optional[set[uuid.UUID]],
+        metadata_by_id: Optional[dict[uuid.UUID, MatchCandidate]],
+    ) -> set[uuid.UUID]:
+        """
+        IDs to skip: previously rejected ones plus those whose metadata marks
+        them inactive or blocked. Built once so candidates need a single lookup.
+        """
+        excluded = set(rejected_ids) if rejected_ids else set()
+        if metadata_by_id:
+            now = datetime.now(UTC)
+            excluded.update(
+                candidate_id
+                for candidate_id, metadata in metadata_by_id.items()
+                if metadata.is_blocked_user or not metadata.is_active(now)
+            )
+        return excluded
     
     def calculate_match(
         self,
@@ -245,29 +250,25 @@ class AutoMatchEngine:
             
         Requirements: 7.9
         """
-        expired_listings = expired_listing_ids or set()
-        expired_requirements = expired_requirement_ids or set()
-        blocked_listings = blocked_user_listing_ids or set()
-        blocked_requirements = blocked_user_requirement_ids or set()
+        excluded_listings = set().union(expired_listing_ids or (), blocked_user_listing_ids or ())
+        excluded_requirements = set().union(
+            expired_requirement_ids or (), blocked_user_requirement_ids or ()
+        )
         rejected = rejected_pairs or set()
         
-        filtered = []
-        for match in matches:
-            if match.listing_id in expired_listings:
-                continue
-            
-            if match.requirement_id in expired_requirements:
-                continue
-            
-            if match.listing_id in blocked_listings:
-                continue
-            
-            if match.requirement_id in blocked_requirements:
-                continue
-            
-            if (match.listing_id, match.requirement_id) in rejected:
-                continue
-            
-            filtered.append(match)
-        
-        return filtered
+        return [
+            match for match in matches
+            if match.listing_id not in excluded_listings
+            and match.requirement_id not in excluded_requirements
+            and (not rejected or (match.listing_id, match.requirement_id) not in rejected)
+        ]
+
+@lru_cache
+def get_match_engine(weights: Optional[MatchWeights] = None) -> AutoMatchEngine:
+    """
+    Shared engine per weight configuration.
+    
+    The engine and its scorer hold no per-request state, so services reuse
+    one instance instead of rebuilding it (and any compiled kernels) per call.
+    """
+    return AutoMatchEngine(MatchScorer(weights))
@@ -1,6 +1,12 @@
-from io import BytesIO
-from typing import Optional, Union
 import hashlib
+from collections.abc import Sequence
+from functools import lru_cache
+from io import BytesIO
+from operator import itemgetter
+from string import hexdigits
+from typing import Any, Optional, Union
+
+import numpy as np
 
 try:
     import imagehash
@@ -11,6 +17,129 @@ except ImportError:
     imagehash = None
     Image = None
 
+from app.services.matching._numba import NUMBA_AVAILABLE, njit, prange
+
+_WORD_MASK = (1 << 64) - 1
+# Rows per side in one XOR/popcount tile: bounds the temporary for large
+# hash sets to a cache-sized block and allows an early exit.
+_HAMMING_TILE = 32
+_HEX_DIGITS = frozenset(hexdigits)
+
+def _swar_popcount(x: Any) -> Any:
+    """SWAR popcount of a uint64 or each uint64 in an array."""
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    m2 = np.uint64(0x3333333333333333)
+    x = (x & m2) + ((x >> np.uint64(2)) & m2)
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+# np.bitwise_count needs NumPy 2.
+_popcount64 = np.bitwise_count if hasattr(np, "bitwise_count") else _swar_popcount
+_popcount_word = njit(cache=True)(_swar_popcount)
+
+@njit(parallel=True, cache=True)
+def _hamming_kernel(words1: np.ndarray, words2: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Pairwise distances, compiled when numba is installed. A pair stops
+    counting once it exceeds ``threshold``, so only distances within the
+    threshold are exact.
+    """
+    n, m, k = words1.shape[0], words2.shape[0], words1.shape[1]
+    distances = np.empty((n, m), dtype=np.int64)
+    for i in prange(n):
+        for j in range(m):
+            distance = 0
+            for w in range(k):
+                distance += np.int64(_popcount_word(words1[i, w] ^ words2[j, w]))
+                if distance > threshold:
+                    break
+            distances[i, j] = distance
+    return distances
+
+def _to_luminance(img: Any) -> Any:
+    """
+    Grayscale image for hashing; imagehash converts to "L" internally, so
+    skipping the RGB intermediate gives identical hashes. YCbCr still goes
+    through RGB because its direct "L" conversion takes the Y plane instead.
+    """
+    if img.mode == "YCbCr":
+        img = img.convert("RGB")
+    if img.mode != "L":
+        img = img.convert("L")
+    return img
+
+@lru_cache(maxsize=4096)
+def _hex_to_int(value: str) -> Optional[int]:
+    """Parsed hex hash, or ``None`` if ``value`` is not plain hex."""
+    if not _HEX_DIGITS.issuperset(value):
+        return None
+    return int(value, 16)
+
+def pack_hex_hashes(hashes: Optional[Sequence[str]]) -> dict[int, np.ndarray]:
+    """
+    Pack hex hash strings into uint64 words for Hamming comparisons.
+    
+    Hashes are grouped by hex length, since only same-sized hashes are
+    comparable; each group is an ``(n, words)`` uint64 array. Empty and
+    non-hex strings are skipped.
+    
+    Requirements: 12.3
+    """
+    return {length: words for length, (_, words) in _indexed_hash_groups(hashes).items()}
+
+def _indexed_hash_groups(
+    hashes: Optional[Sequence[str]],
+) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """``pack_hex_hashes`` groups paired with each row's position in ``hashes``."""
+    groups: dict[int, tuple[list[int], list[list[int]]]] = {}
+    for position, value in enumerate(hashes or ()):
+        number = _hex_to_int(value) if value else None
+        if number is None:
+            continue
+        words = (len(value) * 4 + 63) // 64
+        positions, rows = groups.setdefault(len(value), ([], []))
+        positions.append(position)
+        rows.append([(number >> (64 * k)) & _WORD_MASK for k in range(words)])
+    return {
+        length: (np.array(positions, dtype=np.intp), np.array(rows, dtype=np.uint64))
+        for length, (positions, rows) in groups.items()
+    }
+
+def _hamming_distances(words1: np.ndarray, words2: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    (n, m) bit distances between rows of two ``(n, words)`` / ``(m, words)``
+    arrays; exact wherever they are within ``threshold``.
+    """
+    if NUMBA_AVAILABLE:
+        return _hamming_kernel(words1, words2, threshold)
+    return _popcount64(words1[:, None, :] ^ words2[None, :, :]).sum(axis=-1)
+
+def any_within_hamming(
+    packed1: dict[int, np.ndarray],
+    packed2: dict[int, np.ndarray],
+    threshold: int,
+) -> bool:
+    """
+    Check if any pair of packed hashes is within ``threshold`` bits.
+    
+    XORs same-length hashes pairwise in tiles of ``_HAMMING_TILE`` rows per
+    side, counting differing bits with a per-word popcount, and stops at the
+    first tile holding a match.
+    
+    Requirements: 12.3
+    """
+    for length, words1 in packed1.items():
+        words2 = packed2.get(length)
+        if words2 is None:
+            continue
+        for i in range(0, len(words1), _HAMMING_TILE):
+            tile1 = words1[i:i + _HAMMING_TILE]
+            for j in range(0, len(words2), _HAMMING_TILE):
+                distances = _hamming_distances(tile1, words2[j:j + _HAMMING_TILE], threshold)
+                if (distances <= threshold).any():
+                    return True
+    return False
+
 class ImageHasher:
 
     
@@ -62,8 +191,7 @@ class ImageHasher:
             else:
                 img = Image.open(image_data)
             
-            if img.mode != "RGB":
-                img = img.convert("RGB")
+            img = _to_luminance(img)
             
             phash = imagehash.phash(img, hash_size=self.hash_size)
             
@@ -93,8 +221,7 @@ class ImageHasher:
             else:
                 img = Image.open(image_data)
             
-            if img.mode != "RGB":
-                img = img.convert("RGB")
+            img = _to_luminance(img)
             
             ahash = imagehash.average_hash(img, hash_size=self.hash_size)
             
@@ -124,8 +251,7 @@ class ImageHasher:
             else:
                 img = Image.open(image_data)
             
-            if img.mode != "RGB":
-                img = img.convert("RGB")
+            img = _to_luminance(img)
             
             dhash = imagehash.dhash(img, hash_size=self.hash_size)
             
@@ -166,19 +292,19 @@ class ImageHasher:
             hash2: Second hash as hex string
             
         Returns:
-            Hamming distance (number of differing bits)
+            Hamming distance (number of differing bits), or -1 if either
+            hash is empty, not hex, or of a different size
             
         Requirements: 12.3
         """
-        if not hash1 or not hash2:
+        if not hash1 or not hash2 or len(hash1) != len(hash2):
             return -1
         
-        try:
-            h1 = imagehash.hex_to_hash(hash1)
-            h2 = imagehash.hex_to_hash(hash2)
-            return h1 - h2
-        except Exception:
+        value1 = _hex_to_int(hash1)
+        value2 = _hex_to_int(hash2)
+        if value1 is None or value2 is None:
             return -1
+        return (value1 ^ value2).bit_count()
     
     def are_similar(
         self,
@@ -227,17 +353,8 @@ class ImageHasher:
             
         Requirements: 12.3
         """
-        threshold = threshold if threshold is not None else self.similarity_threshold
-        matches: list[tuple[int, str, int]] = []
-        
-        for idx, candidate in enumerate(candidate_hashes):
-            distance = self.calculate_hamming_distance(target_hash, candidate)
-            if 0 <= distance <= threshold:
-                matches.append((idx, candidate, distance))
-        
-        matches.sort(key=lambda x: x[2])
-        
-        return matches
+        matches = self.compare_image_sets([target_hash], candidate_hashes, threshold)
+        return [(idx, candidate_hashes[idx], distance) for _, idx, distance in matches]
     
     def compare_image_sets(
         self,
@@ -262,17 +379,22 @@ class ImageHasher:
         threshold = threshold if threshold is not None else self.similarity_threshold
         matches: list[tuple[int, int, int]] = []
         
-        for idx1, hash1 in enumerate(hashes1):
-            if not hash1:
+        groups2 = _indexed_hash_groups(hashes2)
+        for length, (positions1, words1) in _indexed_hash_groups(hashes1).items():
+            if length not in groups2:
                 continue
-            for idx2, hash2 in enumerate(hashes2):
-                if not hash2:
-                    continue
-                distance = self.calculate_hamming_distance(hash1, hash2)
-                if 0 <= distance <= threshold:
-                    matches.append((idx1, idx2, distance))
+            positions2, words2 = groups2[length]
+            distances = _hamming_distances(words1, words2, threshold)
+            rows, cols = np.nonzero(distances <= threshold)
+            matches.extend(zip(
+                positions1[rows].tolist(),
+                positions2[cols].tolist(),
+                distances[rows, cols].tolist(),
+                strict=True,
+            ))
         
-        matches.sort(key=lambda x: x[2])
+        # Same order as scanning every pair and stably sorting by distance.
+        matches.sort(key=itemgetter(2, 0, 1))
         
         return matches
     
@@ -300,17 +422,7 @@ class ImageHasher:
         
         threshold = threshold if threshold is not None else self.similarity_threshold
         
-        for hash1 in hashes1:
-            if not hash1:
-                continue
-            for hash2 in hashes2:
-                if not hash2:
-                    continue
-                distance = self.calculate_hamming_distance(hash1, hash2)
-                if 0 <= distance <= threshold:
-                    return True
-        
-        return False
+        return any_within_hamming(pack_hex_hashes(hashes1), pack_hex_hashes(hashes2), threshold)
 
 def compute_content_hash(data: bytes) -> str:
 
@@ -1,7 +1,16 @@
+import uuid
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, Any
-import uuid
+from typing import Any, Optional
+
+import numpy as np
+
+from app.services.matching._numba import NUMBA_AVAILABLE, njit, prange
+
+# Relative deviations this close to a 10%/20% tier edge are rescored with the
+# Decimal-based scalar functions, so batch scores match them exactly.
+_TIER_EPSILON = 1e-6
 
 @dataclass(frozen=True)
 class MatchWeights:
@@ -36,10 +45,6 @@ class ListingData:
     @classmethod
     def from_model(cls, listing: Any) -> "ListingData":
 
-        coords = None
-        if listing.coordinates:
-            coords = None
-        
         return cls(
             id=listing.id,
             category_id=listing.category_id,
@@ -53,7 +58,7 @@ class ListingData:
             document_types=listing.document_types or [],
             utilities=listing.utilities or {},
             heating_type=listing.heating_type.value if listing.heating_type else None,
-            coordinates=coords,
+            coordinates=None,
             is_vip=getattr(listing, 'is_vip', False),
             priority_score=getattr(listing, 'priority_score', 0),
         )
@@ -106,6 +111,288 @@ class RequirementData:
             heating_types=requirement.heating_types or [],
         )
 
+def _float_column(values: Sequence[Any]) -> np.ndarray:
+    """float64 column with NaN for ``None``."""
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+def rank_by_score(
+    indices: np.ndarray,
+    scores: np.ndarray,
+    top_k: Optional[int] = None,
+) -> np.ndarray:
+    """
+    ``indices`` ordered by ``scores[indices]`` descending, ties in input order.
+    
+    With ``top_k`` only the first ``top_k`` are kept; an O(n) partition
+    narrows the candidates before the sort, so the result equals slicing
+    the fully sorted array.
+    """
+    if top_k is not None:
+        if top_k <= 0:
+            return indices[:0]
+        if top_k < len(indices):
+            kth_best = np.partition(scores[indices], len(indices) - top_k)[len(indices) - top_k]
+            indices = indices[scores[indices] >= kth_best]
+    return indices[np.argsort(-scores[indices], kind="stable")][:top_k]
+
+def _intern(values: Sequence[Any], index: dict[Any, int]) -> np.ndarray:
+    """int32 codes for ``values``, assigning the next free code to unseen ones."""
+    return np.array([index.setdefault(v, len(index)) for v in values], dtype=np.int32)
+
+@dataclass(frozen=True)
+class ListingBatch:
+    """Structure-of-arrays view of listings for vectorized scoring."""
+    
+    rows: Sequence[ListingData]
+    locations: tuple[uuid.UUID, ...]
+    location_codes: np.ndarray
+    price: np.ndarray
+    area: np.ndarray
+    rooms: np.ndarray
+    floor: np.ndarray
+    building_floors: np.ndarray
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[ListingData]) -> "ListingBatch":
+        
+        location_index: dict[uuid.UUID, int] = {}
+        location_codes = _intern([r.location_id for r in rows], location_index)
+        return cls(
+            rows=rows,
+            locations=tuple(location_index),
+            location_codes=location_codes,
+            price=_float_column([r.price for r in rows]),
+            area=_float_column([r.area for r in rows]),
+            rooms=_float_column([r.rooms for r in rows]),
+            floor=_float_column([r.floor for r in rows]),
+            building_floors=_float_column([r.building_floors for r in rows]),
+        )
+
+@dataclass(frozen=True)
+class RequirementBatch:
+    """Structure-of-arrays view of requirements for vectorized scoring."""
+    
+    rows: Sequence[RequirementData]
+    location_index: dict[uuid.UUID, int]
+    location_codes: np.ndarray
+    location_rows: np.ndarray
+    has_locations: np.ndarray
+    price_min: np.ndarray
+    price_max: np.ndarray
+    rooms_min: np.ndarray
+    rooms_max: np.ndarray
+    area_min: np.ndarray
+    area_max: np.ndarray
+    floor_min: np.ndarray
+    floor_max: np.ndarray
+    not_first_floor: np.ndarray
+    not_last_floor: np.ndarray
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[RequirementData]) -> "RequirementBatch":
+        
+        # Every wanted location of every row, flattened: location_codes[j] is
+        # wanted by row location_rows[j].
+        location_index: dict[uuid.UUID, int] = {}
+        location_codes = _intern(
+            [loc for r in rows for loc in r.location_ids], location_index
+        )
+        return cls(
+            rows=rows,
+            location_index=location_index,
+            location_codes=location_codes,
+            location_rows=np.repeat(
+                np.arange(len(rows)), [len(r.location_ids) for r in rows]
+            ).astype(np.int32),
+            has_locations=np.array([bool(r.location_ids) for r in rows], dtype=bool),
+            price_min=_float_column([r.price_min for r in rows]),
+            price_max=_float_column([r.price_max for r in rows]),
+            rooms_min=_float_column([r.rooms_min for r in rows]),
+            rooms_max=_float_column([r.rooms_max for r in rows]),
+            area_min=_float_column([r.area_min for r in rows]),
+            area_max=_float_column([r.area_max for r in rows]),
+            floor_min=_float_column([r.floor_min for r in rows]),
+            floor_max=_float_column([r.floor_max for r in rows]),
+            not_first_floor=np.array([r.not_first_floor for r in rows], dtype=bool),
+            not_last_floor=np.array([r.not_last_floor for r in rows], dtype=bool),
+        )
+
+def _outside_range(value: Any, lo: Any, hi: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Masks for values below ``lo`` and (otherwise) above ``hi``; NaN bounds are open."""
+    below = ~np.isnan(lo) & (value < lo)
+    above = ~below & ~np.isnan(hi) & (value > hi)
+    return below, above
+
+def _relative_tier_scores(value: Any, lo: Any, hi: Any) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ``calculate_price_score`` / ``calculate_area_score``.
+    
+    Also returns the mask of entries too close to a tier edge for float
+    arithmetic to be trusted.
+    """
+    value, lo, hi = np.broadcast_arrays(value, lo, hi)
+    below, above = _outside_range(value, lo, hi)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deviation = np.where(below, (lo - value) / lo, np.where(above, (value - hi) / hi, 0.0))
+    percent = deviation * 100
+    outside = below | above
+    scores = np.where(outside, np.where(percent <= 10, 80, np.where(percent <= 20, 50, 0)), 100)
+    near_edge = outside & (
+        (np.abs(percent - 10) < _TIER_EPSILON) | (np.abs(percent - 20) < _TIER_EPSILON)
+    )
+    return scores, near_edge
+
+def _rooms_scores(value: Any, lo: Any, hi: Any) -> np.ndarray:
+    """Vectorized ``calculate_rooms_score``."""
+    value, lo, hi = np.broadcast_arrays(value, lo, hi)
+    below, above = _outside_range(value, lo, hi)
+    deviation = np.where(below, lo - value, np.where(above, value - hi, 0.0))
+    tiers = np.where(deviation == 1, 70, np.where(deviation == 2, 40, 0))
+    return np.where(below | above, tiers, 100)
+
+def _floor_scores(
+    value: Any,
+    building_floors: Any,
+    lo: Any,
+    hi: Any,
+    not_first_floor: Any,
+    not_last_floor: Any,
+) -> np.ndarray:
+    """Vectorized ``calculate_floor_score``."""
+    value, building_floors, lo, hi, not_first_floor, not_last_floor = np.broadcast_arrays(
+        value, building_floors, lo, hi, not_first_floor, not_last_floor
+    )
+    excluded = (not_first_floor & (value == 1)) | (
+        not_last_floor & (building_floors != 0) & (value == building_floors)
+    )
+    below, above = _outside_range(value, lo, hi)
+    deviation = np.where(below, lo - value, np.where(above, value - hi, 0.0))
+    tiers = np.where(deviation <= 2, 70, np.where(deviation <= 5, 40, 0))
+    scores = np.where(excluded, 0, np.where(below | above, tiers, 100))
+    return np.where(np.isnan(value), 100, scores)
+
+@njit(cache=True)
+def _relative_tier_score(value: float, lo: float, hi: float) -> tuple[int, bool]:
+    if not np.isnan(lo) and value < lo:
+        percent = (lo - value) / lo * 100
+    elif not np.isnan(hi) and value > hi:
+        percent = (value - hi) / hi * 100
+    else:
+        return 100, False
+    near_edge = abs(percent - 10) < _TIER_EPSILON or abs(percent - 20) < _TIER_EPSILON
+    if percent <= 10:
+        return 80, near_edge
+    if percent <= 20:
+        return 50, near_edge
+    return 0, near_edge
+
+@njit(cache=True)
+def _step_deviation(value: float, lo: float, hi: float) -> float:
+    if not np.isnan(lo) and value < lo:
+        return lo - value
+    if not np.isnan(hi) and value > hi:
+        return value - hi
+    return 0.0
+
+@njit(parallel=True, cache=True)
+def _numeric_scores_kernel(
+    price: np.ndarray,
+    area: np.ndarray,
+    rooms: np.ndarray,
+    floor: np.ndarray,
+    building_floors: np.ndarray,
+    price_min: np.ndarray,
+    price_max: np.ndarray,
+    area_min: np.ndarray,
+    area_max: np.ndarray,
+    rooms_min: np.ndarray,
+    rooms_max: np.ndarray,
+    floor_min: np.ndarray,
+    floor_max: np.ndarray,
+    not_first_floor: np.ndarray,
+    not_last_floor: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    """Row-wise equivalent of the NumPy helpers above, compiled when numba is installed."""
+    n = price.shape[0]
+    price_scores = np.empty(n, dtype=np.int64)
+    price_edge = np.empty(n, dtype=np.bool_)
+    area_scores = np.empty(n, dtype=np.int64)
+    area_edge = np.empty(n, dtype=np.bool_)
+    rooms_scores = np.empty(n, dtype=np.int64)
+    floor_scores = np.empty(n, dtype=np.int64)
+    
+    for i in prange(n):
+        score, near_edge = _relative_tier_score(price[i], price_min[i], price_max[i])
+        price_scores[i] = score
+        price_edge[i] = near_edge
+        score, near_edge = _relative_tier_score(area[i], area_min[i], area_max[i])
+        area_scores[i] = score
+        area_edge[i] = near_edge
+        
+        deviation = _step_deviation(rooms[i], rooms_min[i], rooms_max[i])
+        if deviation == 0:
+            rooms_scores[i] = 100
+        elif deviation == 1:
+            rooms_scores[i] = 70
+        elif deviation == 2:
+            rooms_scores[i] = 40
+        else:
+            rooms_scores[i] = 0
+        
+        value = floor[i]
+        if np.isnan(value):
+            floor_scores[i] = 100
+        elif (not_first_floor[i] and value == 1) or (
+            not_last_floor[i] and building_floors[i] != 0 and value == building_floors[i]
+        ):
+            floor_scores[i] = 0
+        else:
+            deviation = _step_deviation(value, floor_min[i], floor_max[i])
+            if deviation == 0:
+                floor_scores[i] = 100
+            elif deviation <= 2:
+                floor_scores[i] = 70
+            elif deviation <= 5:
+                floor_scores[i] = 40
+            else:
+                floor_scores[i] = 0
+    
+    return price_scores, price_edge, area_scores, area_edge, rooms_scores, floor_scores
+
+def _numeric_scores(
+    listing_columns: tuple[Any, ...],
+    requirement_columns: tuple[Any, ...],
+) -> tuple[np.ndarray, ...]:
+    """
+    Price, area, rooms and floor scores plus the price/area near-edge masks.
+    
+    ``listing_columns`` is (price, area, rooms, floor, building_floors) and
+    ``requirement_columns`` is (price_min, price_max, area_min, area_max,
+    rooms_min, rooms_max, floor_min, floor_max, not_first_floor,
+    not_last_floor); either side may be scalars broadcast over the other.
+    """
+    if NUMBA_AVAILABLE:
+        columns = np.broadcast_arrays(*listing_columns, *requirement_columns)
+        return _numeric_scores_kernel(*(np.ascontiguousarray(c) for c in columns))
+    
+    price, area, rooms, floor, building_floors = listing_columns
+    (
+        price_min, price_max, area_min, area_max, rooms_min, rooms_max,
+        floor_min, floor_max, not_first_floor, not_last_floor,
+    ) = requirement_columns
+    price_scores, price_edge = _relative_tier_scores(price, price_min, price_max)
+    area_scores, area_edge = _relative_tier_scores(area, area_min, area_max)
+    return (
+        price_scores,
+        price_edge,
+        area_scores,
+        area_edge,
+        _rooms_scores(rooms, rooms_min, rooms_max),
+        _floor_scores(
+            floor, building_floors, floor_min, floor_max, not_first_floor, not_last_floor
+        ),
+    )
+
 class MatchScorer:
 
     
@@ -610,6 +897,186 @@ class MatchScorer:
         
         return int(total)
     
+    def calculate_listing_scores(
+        self,
+        listing: ListingData,
+        requirements: RequirementBatch,
+        adjacent_location_ids: Optional[list[uuid.UUID]] = None,
+        same_city_location_ids: Optional[list[uuid.UUID]] = None,
+    ) -> np.ndarray:
+        """
+        ``calculate_total_score`` of one listing against a batch of requirements.
+        
+        Price, rooms, area, floor and location are scored column-wise; the
+        list/dict criteria are still evaluated per requirement.
+        """
+        rows = requirements.rows
+        price, price_edge, area, area_edge, rooms, floor = _numeric_scores(
+            (
+                float(listing.price),
+                float(listing.area),
+                np.nan if listing.rooms is None else float(listing.rooms),
+                np.nan if listing.floor is None else float(listing.floor),
+                np.nan if listing.building_floors is None else float(listing.building_floors),
+            ),
+            (
+                requirements.price_min,
+                requirements.price_max,
+                requirements.area_min,
+                requirements.area_max,
+                requirements.rooms_min,
+                requirements.rooms_max,
+                requirements.floor_min,
+                requirements.floor_max,
+                requirements.not_first_floor,
+                requirements.not_last_floor,
+            ),
+        )
+        self._rescore(price, price_edge, lambda i: self.calculate_price_score(
+            listing.price, rows[i].price_min, rows[i].price_max
+        ))
+        self._rescore(area, area_edge, lambda i: self.calculate_area_score(
+            listing.area, rows[i].area_min, rows[i].area_max
+        ))
+        
+        category_ok = np.array([r.category_id == listing.category_id for r in rows], dtype=bool)
+        # Rows not wanting the listing's location all fall through to the same
+        # adjacent / same-city checks, so that score is computed once.
+        wanted = np.zeros(len(rows), dtype=bool)
+        code = requirements.location_index.get(listing.location_id)
+        if code is not None:
+            wanted[requirements.location_rows[requirements.location_codes == code]] = True
+        location = np.full(len(rows), 100.0)
+        misses = np.flatnonzero(requirements.has_locations & ~wanted)
+        if misses.size:
+            location[misses] = self.calculate_location_score(
+                listing_location_id=listing.location_id,
+                requirement_location_ids=rows[misses[0]].location_ids,
+                adjacent_location_ids=adjacent_location_ids,
+                same_city_location_ids=same_city_location_ids,
+            )
+        other = np.array([
+            self.calculate_other_score(
+                listing_renovation=listing.renovation_status,
+                listing_documents=listing.document_types,
+                listing_utilities=listing.utilities,
+                listing_heating=listing.heating_type,
+                req_renovation=r.renovation_status,
+                req_documents=r.document_types,
+                req_utilities=r.utilities,
+                req_heating=r.heating_types,
+            )
+            for r in rows
+        ], dtype=np.float64)
+        
+        return self._combine_scores(category_ok, location, price, rooms, area, floor, other)
+    
+    def calculate_requirement_scores(
+        self,
+        requirement: RequirementData,
+        listings: ListingBatch,
+        adjacent_locations: Optional[dict[uuid.UUID, list[uuid.UUID]]] = None,
+        same_city_locations: Optional[dict[uuid.UUID, list[uuid.UUID]]] = None,
+    ) -> np.ndarray:
+        """
+        ``calculate_total_score`` of a batch of listings against one requirement.
+        
+        Adjacent / same-city locations are looked up per listing location,
+        as ``AutoMatchEngine.find_matches_for_requirement`` does.
+        """
+        rows = listings.rows
+        
+        def bound(value: Optional[Any]) -> float:
+            return np.nan if value is None else float(value)
+        
+        price, price_edge, area, area_edge, rooms, floor = _numeric_scores(
+            (
+                listings.price,
+                listings.area,
+                listings.rooms,
+                listings.floor,
+                listings.building_floors,
+            ),
+            (
+                bound(requirement.price_min),
+                bound(requirement.price_max),
+                bound(requirement.area_min),
+                bound(requirement.area_max),
+                bound(requirement.rooms_min),
+                bound(requirement.rooms_max),
+                bound(requirement.floor_min),
+                bound(requirement.floor_max),
+                requirement.not_first_floor,
+                requirement.not_last_floor,
+            ),
+        )
+        self._rescore(price, price_edge, lambda i: self.calculate_price_score(
+            rows[i].price, requirement.price_min, requirement.price_max
+        ))
+        self._rescore(area, area_edge, lambda i: self.calculate_area_score(
+            rows[i].area, requirement.area_min, requirement.area_max
+        ))
+        
+        category_ok = np.array([r.category_id == requirement.category_id for r in rows], dtype=bool)
+        # Location depends only on the listing's location, so score each
+        # distinct one once and broadcast through the interned codes.
+        location_by_code = np.array([
+            self.calculate_location_score(
+                listing_location_id=location_id,
+                requirement_location_ids=requirement.location_ids,
+                adjacent_location_ids=(
+                    adjacent_locations.get(location_id, []) if adjacent_locations else None
+                ),
+                same_city_location_ids=(
+                    same_city_locations.get(location_id, []) if same_city_locations else None
+                ),
+            )
+            for location_id in listings.locations
+        ], dtype=np.float64)
+        location = location_by_code[listings.location_codes]
+        other = np.array([
+            self.calculate_other_score(
+                listing_renovation=r.renovation_status,
+                listing_documents=r.document_types,
+                listing_utilities=r.utilities,
+                listing_heating=r.heating_type,
+                req_renovation=requirement.renovation_status,
+                req_documents=requirement.document_types,
+                req_utilities=requirement.utilities,
+                req_heating=requirement.heating_types,
+            )
+            for r in rows
+        ], dtype=np.float64)
+        
+        return self._combine_scores(category_ok, location, price, rooms, area, floor, other)
+    
+    @staticmethod
+    def _rescore(scores: np.ndarray, mask: np.ndarray, score_one: Callable[[int], int]) -> None:
+        for i in np.flatnonzero(mask):
+            scores[i] = score_one(int(i))
+    
+    def _combine_scores(
+        self,
+        category_ok: np.ndarray,
+        location: np.ndarray,
+        price: np.ndarray,
+        rooms: np.ndarray,
+        area: np.ndarray,
+        floor: np.ndarray,
+        other: np.ndarray,
+    ) -> np.ndarray:
+        """Weighted total, evaluated in the same order as ``calculate_total_score``."""
+        combined_other = np.trunc(other * 0.7 + floor * 0.3)
+        total = (
+            100 * self.weights.category +
+            location * self.weights.location +
+            price * self.weights.price +
+            rooms * self.weights.rooms +
+            area * self.weights.area +
+            combined_other * self.weights.other
+        )
+        return np.where(category_ok, np.trunc(total), 0).astype(np.int64)
+    
     def is_valid_match(self, score: int) -> bool:
 
         return score >= self.MATCH_THRESHOLD
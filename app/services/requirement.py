@@ -249,6 +249,19 @@ class RequirementService:
 
         return False
 
+    async def add_locations(
+        self,
+        requirement_id: uuid.UUID,
+        locations: Sequence[tuple[uuid.UUID, float]],
+    ) -> bool:
+        result = await self.repository.add_locations(requirement_id, locations)
+
+        if result is not None:
+            await self.session.commit()
+            return True
+
+        return False
+
     async def remove_location(
         self,
         requirement_id: uuid.UUID,
@@ -169,7 +169,6 @@ class SubscriptionService:
         user.subscription_expires_at = new_expires_at
 
         await self.session.commit()
-        await self.session.refresh(user)
 
         logger.info(
             f"User {user_id} purchased {plan_id}, expires at {new_expires_at}"
@@ -259,7 +258,6 @@ class SubscriptionService:
         user.subscription_expires_at = new_expires_at
 
         await self.session.commit()
-        await self.session.refresh(user)
 
         return user
 
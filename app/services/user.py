@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -9,6 +10,8 @@ from app.repositories.listing import ListingRepository
 from app.repositories.requirement import RequirementRepository
 from app.core.config import get_settings
 
+PROFILE_UPDATABLE_FIELDS = frozenset({"telegram_username", "language", "subscription_type"})
+
 
 class UserService:
     def __init__(self, session: AsyncSession):
@@ -27,16 +30,19 @@ class UserService:
         if telegram_username is not None:
             data["telegram_username"] = telegram_username
 
-        existing = await self.repository.get_by_telegram_id(telegram_id)
-        if existing is None:
-            data["language"] = language
-
-        user, created = await self.repository.create_or_update(telegram_id, data)
+        user, created = await self.repository.create_or_update(
+            telegram_id, data, defaults={"language": language}
+        )
         await self.session.commit()
         return user, created
 
-    async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
-        return await self.repository.get_by_telegram_id(telegram_id)
+    async def get_by_telegram_id(
+        self,
+        telegram_id: int,
+        *,
+        load: Sequence[str] = (),
+    ) -> Optional[User]:
+        return await self.repository.get_by_telegram_id(telegram_id, load=load)
 
     async def update_language(
         self,
@@ -57,10 +63,9 @@ class UserService:
         if user is None:
             return None
 
-        valid_fields = {"telegram_username", "language", "subscription_type"}
         update_data = {
             k: v for k, v in kwargs.items()
-            if k in valid_fields and v is not None
+            if k in PROFILE_UPDATABLE_FIELDS and v is not None
         }
 
         if not update_data:
@@ -8,11 +8,23 @@ and other API-related properties.
 **Validates: Requirements 13.9**
 """
 
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
 from typing import Any
 
 from hypothesis import given, settings, strategies as st
 
 from app.api.responses import create_error_response, create_success_response
+from app.models.listing import ListingMediaTypeEnum, ListingStatusEnum, PaymentTypeEnum
+from app.schemas.common import list_adapter
+from app.schemas.listing import (
+    ListingListResponse,
+    ListingMediaResponse,
+    ListingResponse,
+    UtilitiesSchema,
+)
 
 
 # Strategies for generating test data
@@ -295,3 +307,97 @@ class TestAPIResponseFormatConsistency:
         
         # Both error objects have the same structure
         assert set(response1["error"].keys()) == set(response2["error"].keys())
+
+
+class TestTrustedSchemaConstruction:
+    """
+    Property tests for building response schemas from DB rows without validation.
+    
+    Property: *For any* row that satisfies the schema, ``from_orm_trusted``
+    dumps to the same data as ``model_validate``.
+    """
+
+    @given(
+        rooms=st.one_of(st.none(), st.integers(min_value=1, max_value=20)),
+        price=st.decimals(min_value=1000, max_value=1_000_000, places=2),
+        area=st.decimals(min_value=10, max_value=1000, places=2),
+        is_vip=st.booleans(),
+        status=st.sampled_from(list(ListingStatusEnum)),
+    )
+    @settings(max_examples=50)
+    def test_trusted_listing_card_matches_validated(
+        self, rooms: int | None, price: Decimal, area: Decimal, is_vip: bool, status: ListingStatusEnum
+    ) -> None:
+        row = SimpleNamespace(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            category_id=uuid.uuid4(),
+            location_id=uuid.uuid4(),
+            price=price,
+            payment_type=PaymentTypeEnum.CASH,
+            rooms=rooms,
+            area=area,
+            floor=None,
+            building_floors=None,
+            renovation_status=None,
+            status=status,
+            is_vip=is_vip,
+            expires_at=None,
+            created_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        
+        trusted = ListingListResponse.from_orm_trusted(row)
+        validated = ListingListResponse.model_validate(row)
+        
+        assert trusted.model_dump() == validated.model_dump()
+        assert list_adapter(ListingListResponse).dump_python([trusted, validated]) == [
+            validated.model_dump(),
+            validated.model_dump(),
+        ]
+
+    def test_trusted_construction_converts_nested_schemas(self) -> None:
+        now = datetime(2025, 1, 1, tzinfo=UTC)
+        media = SimpleNamespace(
+            id=uuid.uuid4(),
+            listing_id=uuid.uuid4(),
+            type=ListingMediaTypeEnum.IMAGE,
+            url="https://example.com/1.jpg",
+            thumbnail_url=None,
+            order=0,
+            created_at=now,
+            updated_at=now,
+        )
+        row = SimpleNamespace(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            category_id=uuid.uuid4(),
+            location_id=uuid.uuid4(),
+            price=Decimal("50000"),
+            payment_type=PaymentTypeEnum.CASH,
+            down_payment=None,
+            rooms=2,
+            area=Decimal("60"),
+            floor=None,
+            building_floors=None,
+            renovation_status=None,
+            document_types=[],
+            utilities={"gas": True, "electricity": None, "water": False},
+            heating_type=None,
+            construction_year=None,
+            description=None,
+            status=ListingStatusEnum.ACTIVE,
+            rejection_reason=None,
+            is_vip=False,
+            vip_expires_at=None,
+            priority_score=0,
+            expires_at=None,
+            created_at=now,
+            updated_at=now,
+            media=[media],
+        )
+        
+        trusted = ListingResponse.from_orm_trusted(row)
+        
+        assert isinstance(trusted.utilities, UtilitiesSchema)
+        assert isinstance(trusted.media[0], ListingMediaResponse)
+        assert trusted.model_dump() == ListingResponse.model_validate(row).model_dump()
@@ -15,7 +15,9 @@ from hypothesis import given, settings, strategies as st, assume
 from app.services.matching.scorer import (
     MatchScorer,
     MatchWeights,
+    ListingBatch,
     ListingData,
+    RequirementBatch,
     RequirementData,
 )
 
@@ -237,6 +239,43 @@ class TestMatchScoreConsistencyProperty:
         
         assert 0 <= score <= 100, f"Score {score} should be between 0 and 100"
 
+    @settings(max_examples=100)
+    @given(
+        pairs=st.lists(matching_pair_strategy(), min_size=1, max_size=8),
+        listing=listing_data_strategy(),
+        requirement=requirement_data_strategy(),
+    )
+    def test_batch_scores_match_scalar_scores(
+        self,
+        pairs: list[tuple[ListingData, RequirementData]],
+        listing: ListingData,
+        requirement: RequirementData,
+    ) -> None:
+        """
+        *For any* batch of listings or requirements, the vectorized scores
+        should equal ``calculate_total_score`` for each row.
+        
+        **Feature: auto-match-platform, Property 7: Match Score Calculation Consistency**
+        **Validates: Requirements 7.3**
+        """
+        scorer = MatchScorer()
+        listings = [listing] + [other for other, _ in pairs]
+        requirements = [requirement] + [r for _, r in pairs]
+        
+        listing_scores = scorer.calculate_listing_scores(
+            listing, RequirementBatch.from_rows(requirements)
+        )
+        requirement_scores = scorer.calculate_requirement_scores(
+            requirement, ListingBatch.from_rows(listings)
+        )
+        
+        assert listing_scores.tolist() == [
+            scorer.calculate_total_score(listing, r) for r in requirements
+        ]
+        assert requirement_scores.tolist() == [
+            scorer.calculate_total_score(other, requirement) for other in listings
+        ]
+
     @settings(max_examples=100)
     @given(
         listing=listing_data_strategy(),
@@ -1248,3 +1287,97 @@ class TestDuplicateDetectionAccuracyProperty:
             f"Score without location match should be <= 70, got {result.similarity_score}"
         assert not result.is_potential_duplicate, \
             "Different locations should not be flagged as duplicates"
+
+    @settings(max_examples=50)
+    @given(
+        pair=duplicate_pair_strategy(),
+        others=st.lists(listing_for_duplicate_check_strategy(), max_size=10),
+        min_score=st.integers(min_value=0, max_value=100),
+    )
+    def test_vectorized_results_match_scalar_checks(
+        self,
+        pair: tuple[ListingForDuplicateCheck, ListingForDuplicateCheck],
+        others: list[ListingForDuplicateCheck],
+        min_score: int,
+    ) -> None:
+        """
+        *For any* batch of existing listings, find_all_similar should return
+        the same results as check_duplicate applied per listing.
+        
+        **Feature: auto-match-platform, Property 16: Duplicate Detection Accuracy**
+        **Validates: Requirements 12.1, 12.2**
+        """
+        listing1, listing2 = pair
+        edge = ListingForDuplicateCheck(
+            id=uuid.uuid4(),
+            location_id=listing1.location_id,
+            price=listing1.price * Decimal(41) / Decimal(39),  # exactly 5% apart
+            area=listing1.area,
+            rooms=listing1.rooms,
+        )
+        existing_listings = [listing1, listing2, edge, *others]
+        detector = DuplicateDetector()
+        
+        expected = [
+            detector.check_duplicate(listing1, existing)
+            for existing in existing_listings[1:]
+        ]
+        expected = sorted(
+            (r for r in expected if r.similarity_score >= min_score),
+            key=lambda r: r.similarity_score,
+            reverse=True,
+        )
+        
+        assert detector.find_all_similar(listing1, existing_listings, min_score) == expected
+
+    @settings(max_examples=100)
+    @given(
+        hashes1=st.lists(st.text(min_size=16, max_size=16, alphabet="0123456789abcdef"), max_size=5),
+        hashes2=st.lists(st.text(min_size=16, max_size=16, alphabet="0123456789abcdef"), max_size=5),
+        threshold=st.integers(min_value=0, max_value=64),
+    )
+    def test_image_hash_match_uses_hamming_distance(
+        self,
+        hashes1: list[str],
+        hashes2: list[str],
+        threshold: int,
+    ) -> None:
+        """
+        *For any* two sets of hex hashes, check_image_hash_match should report
+        a match exactly when some pair differs in at most ``threshold`` bits.
+        
+        **Feature: auto-match-platform, Property 16: Duplicate Detection Accuracy**
+        **Validates: Requirements 12.3**
+        """
+        detector = DuplicateDetector()
+        expected = any(
+            bin(int(h1, 16) ^ int(h2, 16)).count("1") <= threshold
+            for h1 in hashes1
+            for h2 in hashes2
+        )
+        
+        assert detector.check_image_hash_match(hashes1, hashes2, threshold) == expected
+
+    @settings(max_examples=50)
+    @given(
+        existing_listings=st.lists(listing_for_duplicate_check_strategy(), max_size=15),
+        new_listing=listing_for_duplicate_check_strategy(),
+        top_k=st.integers(min_value=0, max_value=20),
+    )
+    def test_top_k_is_prefix_of_full_results(
+        self,
+        existing_listings: list[ListingForDuplicateCheck],
+        new_listing: ListingForDuplicateCheck,
+        top_k: int,
+    ) -> None:
+        """
+        *For any* top_k, find_all_similar should return the first top_k
+        entries of the full, score-ordered result list.
+        
+        **Feature: auto-match-platform, Property 16: Duplicate Detection Accuracy**
+        **Validates: Requirements 12.4**
+        """
+        detector = DuplicateDetector()
+        full = detector.find_all_similar(new_listing, existing_listings)
+        
+        assert detector.find_all_similar(new_listing, existing_listings, top_k=top_k) == full[:top_k]
@@ -395,3 +395,69 @@ class TestRequirementInitialStatusProperty:
         assert fetched is not None
         assert fetched.status == RequirementStatusEnum.ACTIVE
         assert fetched.expires_at is not None
+
+
+class TestMonthlyCounterProperty:
+    """
+    Property-based tests for the trigger-maintained monthly listing counter.
+    
+    **Feature: auto-match-platform, Property: Monthly Counter Tracks Live Listings**
+    """
+
+    @pytest.mark.asyncio
+    @settings(max_examples=20, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @given(
+        listing_count=st.integers(min_value=1, max_value=5),
+        soft=st.booleans(),
+    )
+    async def test_counter_drops_on_soft_and_hard_delete(
+        self,
+        db_session: AsyncSession,
+        listing_count: int,
+        soft: bool,
+    ) -> None:
+        """
+        *For any* number of listings created this month, deleting one of them,
+        either by status or by removing the row, should lower the monthly
+        count by exactly one.
+        """
+        category = Category(
+            name_az="Test",
+            name_ru="Тест",
+            name_en="Test",
+        )
+        db_session.add(category)
+        
+        location = Location(
+            name_az="Test",
+            name_ru="Тест",
+            name_en="Test",
+            type=LocationTypeEnum.CITY,
+        )
+        db_session.add(location)
+        
+        from app.models.user import User
+        user = User(
+            telegram_id=uuid.uuid4().int % 9_000_000_000 + 1,
+            language=LanguageEnum.EN,
+        )
+        db_session.add(user)
+        await db_session.flush()
+        
+        repo = ListingRepository(db_session)
+        
+        listings = [
+            await repo.create({
+                "user_id": user.id,
+                "category_id": category.id,
+                "location_id": location.id,
+                "price": Decimal("100000"),
+                "payment_type": PaymentTypeEnum.CASH,
+            })
+            for _ in range(listing_count)
+        ]
+        assert await repo.count_by_user_this_month(user.id) == listing_count
+        
+        assert await repo.delete(listings[0].id, soft=soft)
+        
+        assert await repo.count_by_user_this_month(user.id) == listing_count - 1
@@ -28,6 +28,8 @@ from app.core.validators import (
     FLOOR_MAX,
     BUILDING_FLOORS_MIN,
     BUILDING_FLOORS_MAX,
+    HTML_TAG_PATTERN,
+    SCRIPT_PATTERN,
     validate_price,
     validate_area,
     validate_coordinates,
@@ -390,6 +392,19 @@ class TestXSSPreventionProperty:
         assert result.is_valid is True
         assert "onerror" not in result.sanitized_value.lower()
 
+    @settings(max_examples=100)
+    @given(text=st.text(min_size=0, max_size=500, alphabet=st.sampled_from("ab <>=:/onscript\t\n")))
+    def test_fast_path_matches_full_sanitization(self, text: str) -> None:
+        """
+        Skipping the regexes for text without markup characters must not
+        change the result.
+        
+        **Feature: auto-match-platform, Property 20: XSS Prevention in Text Fields**
+        **Validates: Requirements 22.9**
+        """
+        expected = " ".join(HTML_TAG_PATTERN.sub("", SCRIPT_PATTERN.sub("", text)).split())
+        assert sanitize_text(text).sanitized_value == expected
+
 
 class TestInputValidationRejectsInvalidData:
     """